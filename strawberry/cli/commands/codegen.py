@@ -4,7 +4,7 @@ import functools
 import importlib
 import inspect
 from pathlib import Path  # noqa: TCH003
-from typing import List, Optional, Type
+from typing import Dict, List, Optional, Type
 
 import rich
 import typer
@@ -12,6 +12,7 @@ import typer
 from strawberry.cli.app import app
 from strawberry.cli.utils import load_schema
 from strawberry.codegen import ConsolePlugin, QueryCodegen, QueryCodegenPlugin
+from strawberry.codegen.plugins.trusted_documents import TrustedDocumentsPlugin
 
 
 def _is_codegen_plugin(obj: object) -> bool:
@@ -77,11 +78,17 @@ def _load_plugin(plugin_path: str) -> Type[QueryCodegenPlugin]:
     return plugin
 
 
-def _load_plugins(plugin_ids: List[str], query: Path) -> List[QueryCodegenPlugin]:
+def _load_plugins(
+    plugin_ids: List[str], query: Path, documents: Dict[str, str]
+) -> List[QueryCodegenPlugin]:
     plugins = []
     for ptype_id in plugin_ids:
         ptype = _load_plugin(ptype_id)
-        plugin = ptype(query)
+        if issubclass(ptype, TrustedDocumentsPlugin):
+            # the manifest includes the documents of all the files of the run
+            plugin = ptype(query, documents=documents)
+        else:
+            plugin = ptype(query)
         plugins.append(plugin)
 
     return plugins
@@ -129,8 +136,10 @@ def codegen(
     console_plugin = console_plugin_type(output_dir)
     console_plugin.before_any_start()
 
+    trusted_documents: Dict[str, str] = {}
+
     for q in query:
-        plugins = _load_plugins(selected_plugins, q)
+        plugins = _load_plugins(selected_plugins, q, trusted_documents)
         console_plugin.query = q  # update the query in the console plugin.
 
         code_generator = QueryCodegen(
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+from strawberry.codegen import CodegenFile, QueryCodegenPlugin
+from strawberry.schema.trusted_documents import TrustedDocuments
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from strawberry.codegen.types import GraphQLOperation, GraphQLType
+
+
+class TrustedDocumentsPlugin(QueryCodegenPlugin):
+    """Generate a trusted documents manifest from the processed queries.
+
+    The manifest maps the sha256 hash of each `.graphql` file to its content
+    and can be loaded with `TrustedDocuments.from_file`. As the codegen
+    creates a plugin for each file, the plugins of the same run can share
+    their `documents`, so that the manifest rewritten for each file contains
+    all the files processed so far.
+    """
+
+    MANIFEST_FILENAME = "trusted_documents.json"
+
+    def __init__(self, query: Path, documents: Optional[Dict[str, str]] = None) -> None:
+        """Initialize the plugin.
+
+        Args:
+            query: The path to the file that is being processed by this plugin.
+            documents: The documents collected by the other plugins of the run,
+                updated with the document of this file.
+        """
+        super().__init__(query)
+        self.documents = {} if documents is None else documents
+
+    def generate_code(
+        self, types: List[GraphQLType], operation: GraphQLOperation
+    ) -> List[CodegenFile]:
+        document = self.query.read_text()
+        self.documents[TrustedDocuments.hash_document(document)] = document
+
+        return [
+            CodegenFile(
+                self.MANIFEST_FILENAME,
+                json.dumps(self.documents, indent=2, sort_keys=True) + "\n",
+            )
+        ]
+
+
+__all__ = ["TrustedDocumentsPlugin"]
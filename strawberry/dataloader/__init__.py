@@ -0,0 +1,72 @@
+from .cache import (
+    AbstractCache,
+    AbstractSharedCache,
+    DefaultCache,
+    InMemorySharedCache,
+    LRUCache,
+    TTLCache,
+)
+from .instrumentation import (
+    DataLoaderInstrumentation,
+    get_instrumentations,
+    instrument_dataloaders,
+)
+from .limits import AdaptiveBatchSize, BatchLimiter
+from .loader import (
+    Batch,
+    DataLoader,
+    LoaderTask,
+    dispatch,
+    dispatch_batch,
+    get_current_batch,
+    get_unique_keys,
+    should_create_new_batch,
+)
+from .schedulers import (
+    BatchScheduler,
+    iterations_scheduler,
+    next_tick_scheduler,
+    time_window_scheduler,
+)
+from .single_flight import SingleFlight
+from .sync import (
+    SyncDataLoader,
+    SyncFuture,
+    dispatch_pending_loaders,
+    dispatch_sync_batch,
+    gather_sync_futures,
+    run_sync,
+)
+
+__all__ = [
+    "DataLoader",
+    "DataLoaderInstrumentation",
+    "instrument_dataloaders",
+    "get_instrumentations",
+    "Batch",
+    "LoaderTask",
+    "AbstractCache",
+    "DefaultCache",
+    "AbstractSharedCache",
+    "InMemorySharedCache",
+    "SingleFlight",
+    "BatchLimiter",
+    "AdaptiveBatchSize",
+    "LRUCache",
+    "TTLCache",
+    "BatchScheduler",
+    "next_tick_scheduler",
+    "time_window_scheduler",
+    "iterations_scheduler",
+    "should_create_new_batch",
+    "get_current_batch",
+    "dispatch",
+    "dispatch_batch",
+    "get_unique_keys",
+    "SyncDataLoader",
+    "SyncFuture",
+    "gather_sync_futures",
+    "dispatch_sync_batch",
+    "dispatch_pending_loaders",
+    "run_sync",
+]
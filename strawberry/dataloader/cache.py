@@ -0,0 +1,441 @@
+from __future__ import annotations
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from asyncio.futures import Future
+
+    from .loader import DataLoader
+
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+
+class AbstractCache(Generic[K, T], ABC):
+    @abstractmethod
+    def get(self, key: K) -> Union[Future[T], None]:
+        pass
+
+    @abstractmethod
+    def set(self, key: K, value: Future[T]) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: K) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        pass
+
+
+class DefaultCache(AbstractCache[K, T]):
+    def __init__(self, cache_key_fn: Optional[Callable[[K], Hashable]] = None) -> None:
+        self.cache_key_fn: Callable[[K], Hashable] = (
+            cache_key_fn if cache_key_fn is not None else lambda x: x
+        )
+        self.cache_map: Dict[Hashable, Future[T]] = {}
+
+    def get(self, key: K) -> Union[Future[T], None]:
+        return self.cache_map.get(self.cache_key_fn(key))
+
+    def set(self, key: K, value: Future[T]) -> None:
+        self.cache_map[self.cache_key_fn(key)] = value
+
+    def delete(self, key: K) -> None:
+        del self.cache_map[self.cache_key_fn(key)]
+
+    def clear(self) -> None:
+        self.cache_map.clear()
+
+
+class LRUCache(AbstractCache[K, T]):
+    """A cache evicting the least recently used entries when it's full.
+
+    The size of the cache can be bounded by number of entries, with `maxsize`,
+    and by the total weight of the loaded values, with `max_weight` and a
+    `weight_fn` returning the weight of a value, for example `sys.getsizeof`
+    to approximate memory usage. Values are weighed once they are loaded.
+
+    Hits, misses and evictions are counted, which helps tuning the bounds.
+
+    Example:
+
+    ```python
+    from strawberry.dataloader import DataLoader, LRUCache
+
+    loader = DataLoader(load_fn=load_users, cache_map=LRUCache(maxsize=1000))
+    ```
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 1000,
+        cache_key_fn: Optional[Callable[[K], Hashable]] = None,
+        *,
+        max_weight: Optional[int] = None,
+        weight_fn: Optional[Callable[[T], int]] = None,
+    ) -> None:
+        """Initialize the LRUCache.
+
+        Args:
+            maxsize: The maximum number of entries, `None` means no limit.
+            cache_key_fn: A function returning the cache key for a key.
+            max_weight: The maximum total weight of the cached values, `None`
+                means no limit.
+            weight_fn: A function returning the weight of a loaded value,
+                required when `max_weight` is set.
+        """
+        if max_weight is not None and weight_fn is None:
+            raise ValueError("`weight_fn` is required when setting `max_weight`")
+
+        self.maxsize = maxsize
+        self.max_weight = max_weight
+        self.weight_fn = weight_fn
+        self.cache_key_fn: Callable[[K], Hashable] = (
+            cache_key_fn if cache_key_fn is not None else lambda x: x
+        )
+        self.cache_map: OrderedDict[Hashable, Future[T]] = OrderedDict()
+
+        self.weight = 0
+        self.weights: Dict[Hashable, int] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: K) -> Union[Future[T], None]:
+        cache_key = self.cache_key_fn(key)
+        future = self.cache_map.get(cache_key)
+
+        if future is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.cache_map.move_to_end(cache_key)
+
+        return future
+
+    def set(self, key: K, value: Future[T]) -> None:
+        cache_key = self.cache_key_fn(key)
+
+        if cache_key in self.cache_map:
+            self._remove(cache_key)
+
+        self.cache_map[cache_key] = value
+
+        if self.weight_fn is not None:
+            if value.done():
+                self._weigh(cache_key, value)
+            else:
+                value.add_done_callback(partial(self._weigh, cache_key))
+
+        self._evict()
+
+    def delete(self, key: K) -> None:
+        cache_key = self.cache_key_fn(key)
+
+        # the entry might have been evicted already
+        if cache_key in self.cache_map:
+            self._remove(cache_key)
+
+    def clear(self) -> None:
+        self.cache_map.clear()
+        self.weights.clear()
+        self.weight = 0
+
+    def _weigh(self, cache_key: Hashable, future: Future[T]) -> None:
+        # the entry might have been replaced or evicted while loading
+        if self.cache_map.get(cache_key) is not future:
+            return
+
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        assert self.weight_fn is not None
+
+        weight = self.weight_fn(future.result())
+        self.weights[cache_key] = weight
+        self.weight += weight
+
+        self._evict()
+
+    def _remove(self, cache_key: Hashable) -> None:
+        del self.cache_map[cache_key]
+        self.weight -= self.weights.pop(cache_key, 0)
+
+    def _is_full(self) -> bool:
+        return (self.maxsize is not None and len(self.cache_map) > self.maxsize) or (
+            self.max_weight is not None and self.weight > self.max_weight
+        )
+
+    def _evict(self) -> None:
+        while self.cache_map and self._is_full():
+            self._remove(next(iter(self.cache_map)))
+            self.evictions += 1
+
+    def __len__(self) -> int:
+        return len(self.cache_map)
+
+
+class TTLCache(LRUCache[K, T]):
+    """A cache whose entries expire `ttl` seconds after being set.
+
+    Expired entries are evicted when they are accessed or when new entries are
+    set, and are counted as evictions. Like `LRUCache`, the cache can also be
+    bounded by number of entries and by weight, but it isn't by default.
+
+    Example:
+
+    ```python
+    from strawberry.dataloader import DataLoader, TTLCache
+
+    loader = DataLoader(load_fn=load_users, cache_map=TTLCache(ttl=60))
+    ```
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: Optional[int] = None,
+        cache_key_fn: Optional[Callable[[K], Hashable]] = None,
+        *,
+        max_weight: Optional[int] = None,
+        weight_fn: Optional[Callable[[T], int]] = None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the TTLCache.
+
+        Args:
+            ttl: How long entries are kept, in seconds.
+            maxsize: The maximum number of entries, `None` means no limit.
+            cache_key_fn: A function returning the cache key for a key.
+            max_weight: The maximum total weight of the cached values, `None`
+                means no limit.
+            weight_fn: A function returning the weight of a loaded value,
+                required when `max_weight` is set.
+            timer: The clock used to expire entries.
+        """
+        super().__init__(
+            maxsize, cache_key_fn, max_weight=max_weight, weight_fn=weight_fn
+        )
+
+        self.ttl = ttl
+        self.timer = timer
+        # ordered by expiration time, as the ttl is the same for all entries
+        self.expires_at: OrderedDict[Hashable, float] = OrderedDict()
+
+    def get(self, key: K) -> Union[Future[T], None]:
+        cache_key = self.cache_key_fn(key)
+        expires_at = self.expires_at.get(cache_key)
+
+        if expires_at is not None and expires_at <= self.timer():
+            self._remove(cache_key)
+            self.evictions += 1
+
+        return super().get(key)
+
+    def set(self, key: K, value: Future[T]) -> None:
+        now = self.timer()
+
+        while self.expires_at:
+            cache_key, expires_at = next(iter(self.expires_at.items()))
+
+            if expires_at > now:
+                break
+
+            self._remove(cache_key)
+            self.evictions += 1
+
+        super().set(key, value)
+
+        cache_key = self.cache_key_fn(key)
+
+        # unless the entry was evicted right away by the size bounds
+        if cache_key in self.cache_map:
+            self.expires_at[cache_key] = now + self.ttl
+
+    def clear(self) -> None:
+        super().clear()
+        self.expires_at.clear()
+
+    def _remove(self, cache_key: Hashable) -> None:
+        super()._remove(cache_key)
+        self.expires_at.pop(cache_key, None)
+
+
+class AbstractSharedCache(ABC):
+    """A cache of loaded values shared by all the DataLoaders of a process.
+
+    Unlike `AbstractCache`, which stores the futures of a single DataLoader,
+    a shared cache stores the loaded values, grouped by namespace, so that
+    they can be reused by the DataLoaders created for other requests. All the
+    methods are async, so that caches backed by a remote store can be used.
+    """
+
+    @abstractmethod
+    async def get_many(
+        self, namespace: str, keys: Sequence[Hashable]
+    ) -> Mapping[Hashable, Any]:
+        """Return the cached values for `keys`, missing keys are omitted."""
+
+    @abstractmethod
+    async def set_many(
+        self,
+        namespace: str,
+        values: Mapping[Hashable, Any],
+        ttl: Optional[float] = None,
+    ) -> None:
+        """Store `values`, expiring them after `ttl` seconds if set."""
+
+    @abstractmethod
+    async def invalidate(
+        self, namespace: str, keys: Optional[Iterable[Hashable]] = None
+    ) -> None:
+        """Remove `keys` from the cache, or the whole namespace if omitted."""
+
+
+class InMemorySharedCache(AbstractSharedCache):
+    """An in memory shared cache, for the DataLoaders of a single process.
+
+    Example:
+
+    ```python
+    from strawberry.dataloader import DataLoader, InMemorySharedCache
+
+    currencies_cache = InMemorySharedCache(ttl=300)
+
+
+    def get_context():
+        return {
+            "currency_loader": DataLoader(
+                load_fn=load_currencies,
+                shared_cache=currencies_cache,
+                shared_cache_namespace="currencies",
+            )
+        }
+    ```
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        maxsize: Optional[int] = 10_000,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the InMemorySharedCache.
+
+        Args:
+            ttl: The default time to live of the values, in seconds. `None`
+                keeps them until they are invalidated or evicted.
+            maxsize: The maximum number of values for each namespace, the least
+                recently used ones are evicted first. `None` means no limit.
+            timer: The clock used to expire values.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.timer = timer
+        self.namespaces: Dict[
+            str, OrderedDict[Hashable, Tuple[Any, Optional[float]]]
+        ] = {}
+        self._lock = threading.Lock()
+
+    async def get_many(
+        self, namespace: str, keys: Sequence[Hashable]
+    ) -> Dict[Hashable, Any]:
+        values: Dict[Hashable, Any] = {}
+
+        with self._lock:
+            entries = self.namespaces.get(namespace)
+
+            if not entries:
+                return values
+
+            now = self.timer()
+
+            for key in keys:
+                entry = entries.get(key)
+
+                if entry is None:
+                    continue
+
+                value, expires_at = entry
+
+                if expires_at is not None and expires_at <= now:
+                    del entries[key]
+                    continue
+
+                entries.move_to_end(key)
+                values[key] = value
+
+        return values
+
+    async def set_many(
+        self,
+        namespace: str,
+        values: Mapping[Hashable, Any],
+        ttl: Optional[float] = None,
+    ) -> None:
+        if ttl is None:
+            ttl = self.ttl
+
+        with self._lock:
+            expires_at = None if ttl is None else self.timer() + ttl
+            entries = self.namespaces.setdefault(namespace, OrderedDict())
+
+            for key, value in values.items():
+                entries[key] = (value, expires_at)
+                entries.move_to_end(key)
+
+            if self.maxsize is not None:
+                while len(entries) > self.maxsize:
+                    entries.popitem(last=False)
+
+    async def invalidate(
+        self, namespace: str, keys: Optional[Iterable[Hashable]] = None
+    ) -> None:
+        with self._lock:
+            if keys is None:
+                self.namespaces.pop(namespace, None)
+                return
+
+            entries = self.namespaces.get(namespace)
+
+            if entries is not None:
+                for key in keys:
+                    entries.pop(key, None)
+
+
+def get_shared_cache_key(loader: DataLoader, key: Any) -> Hashable:
+    return loader.cache_key_fn(key) if loader.cache_key_fn is not None else key
+
+
+__all__ = [
+    "AbstractCache",
+    "DefaultCache",
+    "AbstractSharedCache",
+    "InMemorySharedCache",
+    "LRUCache",
+    "TTLCache",
+]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Iterator, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from .loader import DataLoader
+    from .sync import SyncDataLoader
+
+
+class DataLoaderInstrumentation:
+    """Receives events from DataLoaders, for example to collect metrics.
+
+    Instrumentations are either passed to a loader, or activated for all the
+    loaders used in a block with `instrument_dataloaders`. All the methods do
+    nothing by default.
+    """
+
+    def on_load(self, loader: Any, key: Any, cache_hit: bool) -> None:
+        """Called for each key requested with `load`."""
+
+    def on_batch_dispatch(self, loader: Any, batch_size: int, wait_time: float) -> None:
+        """Called before `load_fn` is called.
+
+        `wait_time` is the time between the first `load` of the batch and its
+        dispatch, in seconds.
+        """
+
+    def on_batch_queued(self, loader: Any, batch_size: int, queue_time: float) -> None:
+        """Called when a batch got its slots from the loader's `BatchLimiter`s.
+
+        `queue_time` is the time the batch waited for them, in seconds. It is
+        only called for loaders limiting their concurrent batches.
+        """
+
+    def on_batch_loaded(
+        self,
+        loader: Any,
+        batch_size: int,
+        load_time: float,
+        error: Optional[BaseException],
+    ) -> None:
+        """Called once `load_fn` returned, or failed with `error`.
+
+        `load_time` is the time spent in `load_fn`, in seconds. Returning the
+        wrong number of values is reported as a `WrongNumberOfResultsReturned`
+        error.
+        """
+
+
+_active_instrumentations: ContextVar[Tuple[DataLoaderInstrumentation, ...]] = (
+    ContextVar("_active_instrumentations", default=())
+)
+
+
+@contextmanager
+def instrument_dataloaders(
+    instrumentation: DataLoaderInstrumentation,
+) -> Iterator[None]:
+    """Report the events of all the loaders used inside the block to `instrumentation`.
+
+    Example:
+
+    ```python
+    with instrument_dataloaders(MyInstrumentation()):
+        schema.execute_sync(query)
+    ```
+    """
+    token = _active_instrumentations.set(
+        (*_active_instrumentations.get(), instrumentation)
+    )
+
+    try:
+        yield
+    finally:
+        _active_instrumentations.reset(token)
+
+
+def get_instrumentations(
+    loader: Union[DataLoader, SyncDataLoader],
+) -> Tuple[DataLoaderInstrumentation, ...]:
+    active = _active_instrumentations.get()
+
+    if loader.instrumentation is None:
+        return active
+
+    return (loader.instrumentation, *active)
+
+
+def report_load(
+    loader: Union[DataLoader, SyncDataLoader],
+    instrumentations: Tuple[DataLoaderInstrumentation, ...],
+    key: Any,
+    cache_hit: bool,
+) -> None:
+    for instrumentation in instrumentations:
+        instrumentation.on_load(loader, key, cache_hit)
+
+
+def report_batch_dispatch(
+    loader: Union[DataLoader, SyncDataLoader],
+    instrumentations: Tuple[DataLoaderInstrumentation, ...],
+    batch_size: int,
+    created_at: float,
+) -> float:
+    wait_time = time.perf_counter() - created_at
+
+    for instrumentation in instrumentations:
+        instrumentation.on_batch_dispatch(loader, batch_size, wait_time)
+
+    # the time spent in the instrumentations isn't part of the next step
+    return time.perf_counter()
+
+
+def report_batch_queued(
+    loader: DataLoader,
+    instrumentations: Tuple[DataLoaderInstrumentation, ...],
+    batch_size: int,
+    dispatched_at: float,
+) -> float:
+    queue_time = time.perf_counter() - dispatched_at
+
+    for instrumentation in instrumentations:
+        instrumentation.on_batch_queued(loader, batch_size, queue_time)
+
+    return time.perf_counter()
+
+
+def report_batch_loaded(
+    loader: Union[DataLoader, SyncDataLoader],
+    instrumentations: Tuple[DataLoaderInstrumentation, ...],
+    batch_size: int,
+    dispatched_at: float,
+    error: Optional[BaseException] = None,
+) -> None:
+    load_time = time.perf_counter() - dispatched_at
+
+    for instrumentation in instrumentations:
+        instrumentation.on_batch_loaded(loader, batch_size, load_time, error)
+
+
+__all__ = [
+    "DataLoaderInstrumentation",
+    "instrument_dataloaders",
+    "get_instrumentations",
+]
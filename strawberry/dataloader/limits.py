@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+from asyncio import CancelledError, get_running_loop
+from collections import deque
+from typing import TYPE_CHECKING, Deque
+
+if TYPE_CHECKING:
+    from asyncio.futures import Future
+
+
+class BatchLimiter:
+    """Limits the number of batches loading at the same time.
+
+    Batches over the limit wait for a slot, in the order they were dispatched.
+    A limiter can be shared between loaders, for example to stay within the
+    size of a database connection pool.
+
+    Example:
+
+    ```python
+    from strawberry.dataloader import BatchLimiter, DataLoader
+
+    database_limiter = BatchLimiter(max_concurrent_batches=10)
+
+    loader = DataLoader(load_fn=load_users, batch_limiter=database_limiter)
+    ```
+    """
+
+    def __init__(self, max_concurrent_batches: int) -> None:
+        if max_concurrent_batches < 1:
+            raise ValueError("`max_concurrent_batches` must be at least 1")
+
+        self.max_concurrent_batches = max_concurrent_batches
+        self.active = 0
+        self.waiters: Deque[Future[None]] = deque()
+
+    async def acquire(self) -> None:
+        if self.active < self.max_concurrent_batches and not self.waiters:
+            self.active += 1
+            return
+
+        waiter: Future[None] = get_running_loop().create_future()
+        self.waiters.append(waiter)
+
+        try:
+            await waiter
+        except CancelledError:
+            # the slot was handed over before the cancellation
+            if not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        # the slot is handed over to the first waiter still waiting
+        while self.waiters:
+            waiter = self.waiters.popleft()
+
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self.active -= 1
+
+
+class AdaptiveBatchSize:
+    """Adapts the size of batches to keep `load_fn` calls under a target latency.
+
+    After each successful call to `load_fn`, the latency per key is used to
+    estimate how many keys can be loaded within `target_latency`. Slower calls
+    shrink the batch size, and calls faster than the target grow it (at most
+    doubling it each time), when they were limited by the batch size.
+
+    The keys requested before a batch is dispatched are split into chunks of
+    the current batch size, which are loaded concurrently. Share an instance
+    between the loaders of all requests, so that it learns from all of them.
+
+    Example:
+
+    ```python
+    from strawberry.dataloader import AdaptiveBatchSize, DataLoader
+
+    user_batch_size = AdaptiveBatchSize(target_latency=0.05, max_size=500)
+
+
+    async def get_context() -> Dict[str, Any]:
+        return {
+            "user_loader": DataLoader(load_users, adaptive_batch_size=user_batch_size)
+        }
+    ```
+    """
+
+    def __init__(
+        self,
+        target_latency: float,
+        min_size: int = 1,
+        max_size: int = 1000,
+        initial_size: int = 100,
+        smoothing: float = 0.5,
+    ) -> None:
+        """Initialize the AdaptiveBatchSize.
+
+        Args:
+            target_latency: The latency to aim for for each `load_fn` call, in
+                seconds.
+            min_size: The smallest batch size.
+            max_size: The largest batch size.
+            initial_size: The batch size to use before the first measurement.
+            smoothing: How much each measurement moves the batch size towards
+                its estimate, between 0 (not at all) and 1 (completely).
+        """
+        if not 1 <= min_size <= max_size:
+            raise ValueError("`min_size` must be between 1 and `max_size`")
+
+        if not 0 < smoothing <= 1:
+            raise ValueError("`smoothing` must be between 0 and 1")
+
+        self.target_latency = target_latency
+        self.min_size = min_size
+        self.max_size = max_size
+        self.smoothing = smoothing
+        self.size = float(min(max(initial_size, min_size), max_size))
+
+    @property
+    def batch_size(self) -> int:
+        return round(self.size)
+
+    def record(self, batch_size: int, latency: float) -> None:
+        """Update the batch size from the `latency` of a call with `batch_size` keys."""
+        if batch_size <= 0:
+            return
+
+        if latency > self.target_latency:
+            estimate = batch_size * self.target_latency / latency
+        elif batch_size >= self.batch_size:
+            # the batch was limited by its size, so larger batches could be
+            # loaded within the target latency
+            estimate = 2 * batch_size
+
+            if latency > 0:
+                estimate = min(estimate, batch_size * self.target_latency / latency)
+        else:
+            return
+
+        self.size += self.smoothing * (estimate - self.size)
+        self.size = min(max(self.size, self.min_size), self.max_size)
+
+
+__all__ = [
+    "BatchLimiter",
+    "AdaptiveBatchSize",
+]
@@ -0,0 +1,516 @@
+from __future__ import annotations
+
+import dataclasses
+import time
+from asyncio import CancelledError, create_task, gather, get_event_loop
+from asyncio.futures import Future
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+from strawberry.exceptions import WrongNumberOfResultsReturned
+
+from .cache import DefaultCache, get_shared_cache_key
+from .instrumentation import (
+    get_instrumentations,
+    report_batch_dispatch,
+    report_batch_loaded,
+    report_batch_queued,
+    report_load,
+)
+from .limits import BatchLimiter
+from .schedulers import next_tick_scheduler
+
+if TYPE_CHECKING:
+    from asyncio.events import AbstractEventLoop
+
+    from .cache import AbstractCache, AbstractSharedCache
+    from .instrumentation import DataLoaderInstrumentation
+    from .limits import AdaptiveBatchSize
+    from .schedulers import BatchScheduler
+    from .single_flight import SingleFlight
+    from .sync import SyncDataLoader
+
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+
+@dataclass
+class LoaderTask(Generic[K, T]):
+    key: K
+    future: Future
+
+
+@dataclass
+class Batch(Generic[K, T]):
+    tasks: List[LoaderTask] = dataclasses.field(default_factory=list)
+    dispatched: bool = False
+    created_at: float = dataclasses.field(default_factory=time.perf_counter)
+
+    def add_task(self, key: Any, future: Future) -> None:
+        task = LoaderTask[K, T](key, future)
+        self.tasks.append(task)
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+
+class DataLoader(Generic[K, T]):
+    batch: Optional[Batch[K, T]] = None
+    cache: bool = False
+    cache_map: AbstractCache[K, T]
+    shared_cache_namespace: Optional[str]
+
+    @overload
+    def __init__(
+        self,
+        # any BaseException is rethrown in 'load', so should be excluded from the T type
+        load_fn: Callable[[List[K]], Awaitable[Sequence[Union[T, BaseException]]]],
+        max_batch_size: Optional[int] = None,
+        cache: bool = True,
+        loop: Optional[AbstractEventLoop] = None,
+        cache_map: Optional[AbstractCache[K, T]] = None,
+        cache_key_fn: Optional[Callable[[K], Hashable]] = None,
+        shared_cache: Optional[AbstractSharedCache] = None,
+        shared_cache_namespace: Optional[str] = None,
+        shared_cache_ttl: Optional[float] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
+        instrumentation: Optional[DataLoaderInstrumentation] = None,
+        single_flight: Optional[SingleFlight] = None,
+        max_concurrent_batches: Optional[int] = None,
+        batch_limiter: Optional[BatchLimiter] = None,
+        adaptive_batch_size: Optional[AdaptiveBatchSize] = None,
+    ) -> None: ...
+
+    # fallback if load_fn is untyped and there's no other info for inference
+    @overload
+    def __init__(
+        self: DataLoader[K, Any],
+        load_fn: Callable[[List[K]], Awaitable[List[Any]]],
+        max_batch_size: Optional[int] = None,
+        cache: bool = True,
+        loop: Optional[AbstractEventLoop] = None,
+        cache_map: Optional[AbstractCache[K, T]] = None,
+        cache_key_fn: Optional[Callable[[K], Hashable]] = None,
+        shared_cache: Optional[AbstractSharedCache] = None,
+        shared_cache_namespace: Optional[str] = None,
+        shared_cache_ttl: Optional[float] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
+        instrumentation: Optional[DataLoaderInstrumentation] = None,
+        single_flight: Optional[SingleFlight] = None,
+        max_concurrent_batches: Optional[int] = None,
+        batch_limiter: Optional[BatchLimiter] = None,
+        adaptive_batch_size: Optional[AdaptiveBatchSize] = None,
+    ) -> None: ...
+
+    def __init__(
+        self,
+        load_fn: Callable[[List[K]], Awaitable[Sequence[Union[T, BaseException]]]],
+        max_batch_size: Optional[int] = None,
+        cache: bool = True,
+        loop: Optional[AbstractEventLoop] = None,
+        cache_map: Optional[AbstractCache[K, T]] = None,
+        cache_key_fn: Optional[Callable[[K], Hashable]] = None,
+        shared_cache: Optional[AbstractSharedCache] = None,
+        shared_cache_namespace: Optional[str] = None,
+        shared_cache_ttl: Optional[float] = None,
+        batch_scheduler: Optional[BatchScheduler] = None,
+        instrumentation: Optional[DataLoaderInstrumentation] = None,
+        single_flight: Optional[SingleFlight] = None,
+        max_concurrent_batches: Optional[int] = None,
+        batch_limiter: Optional[BatchLimiter] = None,
+        adaptive_batch_size: Optional[AdaptiveBatchSize] = None,
+    ):
+        self.load_fn = load_fn
+        self.max_batch_size = max_batch_size
+        self.instrumentation = instrumentation
+        self.batch_scheduler = (
+            batch_scheduler if batch_scheduler is not None else next_tick_scheduler
+        )
+
+        self.cache_key_fn = cache_key_fn
+        self.shared_cache = shared_cache
+        self.shared_cache_ttl = shared_cache_ttl
+        self.single_flight = single_flight
+        self.adaptive_batch_size = adaptive_batch_size
+
+        # the loader's own limit is acquired first, so that its batches don't
+        # hold slots of the shared limiter while waiting
+        batch_limiters = []
+
+        if max_concurrent_batches is not None:
+            batch_limiters.append(BatchLimiter(max_concurrent_batches))
+
+        if batch_limiter is not None:
+            batch_limiters.append(batch_limiter)
+
+        self.batch_limiters = tuple(batch_limiters)
+
+        # the namespace is used by both the shared cache and single flight
+        if (
+            shared_cache is not None or single_flight is not None
+        ) and shared_cache_namespace is None:
+            qualname = getattr(load_fn, "__qualname__", None)
+
+            if qualname is None:
+                raise ValueError(
+                    "`shared_cache_namespace` is required when `load_fn` "
+                    "doesn't have a qualified name"
+                )
+
+            shared_cache_namespace = f"{load_fn.__module__}.{qualname}"
+
+        self.shared_cache_namespace = shared_cache_namespace
+
+        self._loop = loop
+
+        self.cache = cache
+
+        if self.cache:
+            self.cache_map = (
+                DefaultCache(cache_key_fn) if cache_map is None else cache_map
+            )
+
+    @property
+    def loop(self) -> AbstractEventLoop:
+        if self._loop is None:
+            self._loop = get_event_loop()
+
+        return self._loop
+
+    def load(self, key: K) -> Awaitable[T]:
+        instrumentations = get_instrumentations(self)
+
+        if self.cache:
+            future = self.cache_map.get(key)
+
+            if future and not future.cancelled():
+                if instrumentations:
+                    report_load(self, instrumentations, key, cache_hit=True)
+
+                return future
+
+        if instrumentations:
+            report_load(self, instrumentations, key, cache_hit=False)
+
+        future = self.loop.create_future()
+
+        if self.cache:
+            self.cache_map.set(key, future)
+
+        batch = get_current_batch(self)
+        batch.add_task(key, future)
+
+        return future
+
+    def load_many(self, keys: Iterable[K]) -> Awaitable[List[T]]:
+        return gather(*map(self.load, keys))
+
+    def clear(self, key: K) -> None:
+        if self.cache:
+            self.cache_map.delete(key)
+
+    def clear_many(self, keys: Iterable[K]) -> None:
+        if self.cache:
+            for key in keys:
+                self.cache_map.delete(key)
+
+    def clear_all(self) -> None:
+        if self.cache:
+            self.cache_map.clear()
+
+    def prime(self, key: K, value: T, force: bool = False) -> None:
+        self.prime_many({key: value}, force)
+
+    def prime_many(self, data: Mapping[K, T], force: bool = False) -> None:
+        # Populate the cache with the specified values
+        if self.cache:
+            for key, value in data.items():
+                if not self.cache_map.get(key) or force:
+                    future: Future = Future(loop=self.loop)
+                    future.set_result(value)
+                    self.cache_map.set(key, future)
+
+        # For keys that are pending on the current batch, but the
+        # batch hasn't started fetching yet: Remove it from the
+        # batch and set to the specified value
+        if self.batch is not None and not self.batch.dispatched:
+            batch_updated = False
+            for task in self.batch.tasks:
+                if task.key in data:
+                    batch_updated = True
+                    task.future.set_result(data[task.key])
+            if batch_updated:
+                self.batch.tasks = [
+                    task for task in self.batch.tasks if not task.future.done()
+                ]
+
+
+def should_create_new_batch(loader: DataLoader, batch: Batch) -> bool:
+    return bool(
+        batch.dispatched
+        or loader.max_batch_size
+        and len(batch) >= loader.max_batch_size
+    )
+
+
+def get_current_batch(loader: DataLoader) -> Batch:
+    if loader.batch and not should_create_new_batch(loader, loader.batch):
+        return loader.batch
+
+    loader.batch = Batch()
+
+    dispatch(loader, loader.batch)
+
+    return loader.batch
+
+
+def dispatch(loader: DataLoader, batch: Batch) -> None:
+    loader.batch_scheduler(
+        loader.loop, partial(create_task, dispatch_batch(loader, batch))
+    )
+
+
+async def dispatch_batch(loader: DataLoader, batch: Batch) -> None:
+    batch.dispatched = True
+
+    if len(batch.tasks) == 0:
+        # Ensure batch is not empty
+        # Unlikely, but could happen if the tasks are
+        # overriden with preset values
+        return
+
+    # TODO: check if load_fn return an awaitable and it is a list
+
+    try:
+        if loader.shared_cache is not None:
+            await load_from_shared_cache(loader, batch)
+
+            if not batch.tasks:
+                return
+
+        keys, positions = get_unique_keys(loader, batch.tasks)
+        adaptive_batch_size = loader.adaptive_batch_size
+
+        if (
+            adaptive_batch_size is not None
+            and len(keys) > adaptive_batch_size.batch_size
+        ):
+            values = await load_keys_in_chunks(
+                loader, batch.created_at, keys, adaptive_batch_size.batch_size
+            )
+        else:
+            values = await load_keys(loader, batch.created_at, keys)
+
+        for task, position in zip(batch.tasks, positions):
+            # Trying to set_result in a cancelled future would raise
+            # asyncio.exceptions.InvalidStateError
+            if task.future.cancelled():
+                continue
+
+            value = values[position]
+
+            if isinstance(value, BaseException):
+                task.future.set_exception(value)
+            else:
+                task.future.set_result(value)
+    except CancelledError:
+        # only the loads of this batch are cancelled, see `SingleFlight`
+        for task in batch.tasks:
+            task.future.cancel()
+
+        raise
+    except Exception as e:
+        for task in batch.tasks:
+            task.future.set_exception(e)
+
+
+def get_unique_keys(
+    loader: Union[DataLoader, SyncDataLoader], tasks: List[LoaderTask]
+) -> Tuple[List[Any], List[int]]:
+    """Return the keys of `tasks` without duplicates, and the position of each.
+
+    Keys are compared using `cache_key_fn`, when set. Keys that can't be hashed
+    are all kept.
+    """
+    keys: List[Any] = []
+    positions: List[int] = []
+    seen: Dict[Hashable, int] = {}
+    cache_key_fn = loader.cache_key_fn
+
+    try:
+        for task in tasks:
+            cache_key = task.key if cache_key_fn is None else cache_key_fn(task.key)
+            position = seen.get(cache_key)
+
+            if position is None:
+                position = seen[cache_key] = len(keys)
+                keys.append(task.key)
+
+            positions.append(position)
+    except TypeError:
+        return [task.key for task in tasks], list(range(len(tasks)))
+
+    return keys, positions
+
+
+async def load_keys(
+    loader: DataLoader, created_at: float, keys: List[Any]
+) -> List[Any]:
+    if loader.single_flight is not None:
+        return await loader.single_flight.load(
+            loader, keys, partial(call_load_fn, loader, created_at)
+        )
+
+    return await call_load_fn(loader, created_at, keys)
+
+
+async def load_keys_in_chunks(
+    loader: DataLoader, created_at: float, keys: List[Any], chunk_size: int
+) -> List[Any]:
+    """Load `keys` with concurrent calls to `load_fn`, of `chunk_size` keys each.
+
+    A failing chunk only fails its own keys.
+    """
+    chunks = [keys[i : i + chunk_size] for i in range(0, len(keys), chunk_size)]
+    results = await gather(
+        *(load_keys(loader, created_at, chunk) for chunk in chunks),
+        return_exceptions=True,
+    )
+
+    values: List[Any] = []
+
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, BaseException):
+            values.extend([result] * len(chunk))
+        else:
+            values.extend(result)
+
+    return values
+
+
+async def call_load_fn(
+    loader: DataLoader, created_at: float, keys: List[Any]
+) -> List[Any]:
+    instrumentations = get_instrumentations(loader)
+
+    if instrumentations:
+        dispatched_at = report_batch_dispatch(
+            loader, instrumentations, len(keys), created_at
+        )
+
+    acquired: List[BatchLimiter] = []
+
+    try:
+        if loader.batch_limiters:
+            for limiter in loader.batch_limiters:
+                await limiter.acquire()
+                acquired.append(limiter)
+
+            if instrumentations:
+                dispatched_at = report_batch_queued(
+                    loader, instrumentations, len(keys), dispatched_at
+                )
+
+        started_at = time.perf_counter()
+
+        try:
+            values = await loader.load_fn(keys)
+            values = list(values)
+
+            if len(values) != len(keys):
+                raise WrongNumberOfResultsReturned(
+                    expected=len(keys), received=len(values)
+                )
+        except Exception as e:
+            if instrumentations:
+                report_batch_loaded(
+                    loader, instrumentations, len(keys), dispatched_at, e
+                )
+            raise
+    finally:
+        for limiter in acquired:
+            limiter.release()
+
+    if loader.adaptive_batch_size is not None:
+        loader.adaptive_batch_size.record(len(keys), time.perf_counter() - started_at)
+
+    if instrumentations:
+        report_batch_loaded(loader, instrumentations, len(keys), dispatched_at)
+
+    if loader.shared_cache is not None:
+        await save_to_shared_cache(loader, keys, values)
+
+    return values
+
+
+async def load_from_shared_cache(loader: DataLoader, batch: Batch) -> None:
+    assert loader.shared_cache is not None
+
+    shared_keys = [get_shared_cache_key(loader, task.key) for task in batch.tasks]
+    cached_values = await loader.shared_cache.get_many(
+        loader.shared_cache_namespace,  # type: ignore[arg-type]
+        shared_keys,
+    )
+
+    if not cached_values:
+        return
+
+    pending_tasks = []
+
+    for task, shared_key in zip(batch.tasks, shared_keys):
+        if shared_key not in cached_values:
+            pending_tasks.append(task)
+        elif not task.future.cancelled():
+            task.future.set_result(cached_values[shared_key])
+
+    batch.tasks = pending_tasks
+
+
+async def save_to_shared_cache(
+    loader: DataLoader, keys: Sequence[Any], values: Sequence[Any]
+) -> None:
+    assert loader.shared_cache is not None
+
+    loaded_values = {
+        get_shared_cache_key(loader, key): value
+        for key, value in zip(keys, values)
+        if not isinstance(value, BaseException)
+    }
+
+    if loaded_values:
+        await loader.shared_cache.set_many(
+            loader.shared_cache_namespace,  # type: ignore[arg-type]
+            loaded_values,
+            loader.shared_cache_ttl,
+        )
+
+
+__all__ = [
+    "DataLoader",
+    "Batch",
+    "LoaderTask",
+    "should_create_new_batch",
+    "get_current_batch",
+    "dispatch",
+    "dispatch_batch",
+    "get_unique_keys",
+]
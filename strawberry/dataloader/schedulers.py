@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+if TYPE_CHECKING:
+    from asyncio.events import AbstractEventLoop
+
+
+# Called with the event loop and a callback dispatching the batch, which the
+# scheduler runs once the batch should be loaded
+BatchScheduler = Callable[["AbstractEventLoop", Callable[[], Any]], None]
+
+
+def next_tick_scheduler(loop: AbstractEventLoop, callback: Callable[[], Any]) -> None:
+    """Dispatch batches on the next iteration of the event loop, the default."""
+    loop.call_soon(callback)
+
+
+def time_window_scheduler(seconds: float) -> BatchScheduler:
+    """Dispatch batches `seconds` after their first key has been requested.
+
+    This collects the keys requested by resolvers that await something else
+    first, at the cost of adding up to `seconds` to each load.
+    """
+
+    def schedule(loop: AbstractEventLoop, callback: Callable[[], Any]) -> None:
+        loop.call_later(seconds, callback)
+
+    return schedule
+
+
+def iterations_scheduler(iterations: int = 5) -> BatchScheduler:
+    """Dispatch batches `iterations` iterations of the event loop later.
+
+    Resolvers awaiting something else before requesting their keys, such as
+    nested async resolvers, get that many iterations to join the batch. It
+    only uses `loop.call_soon`, so it works with any event loop.
+    """
+    if iterations < 1:
+        raise ValueError("`iterations` must be at least 1")
+
+    def schedule(loop: AbstractEventLoop, callback: Callable[[], Any]) -> None:
+        remaining = iterations
+
+        def hop() -> None:
+            nonlocal remaining
+            remaining -= 1
+
+            # callbacks scheduled while the loop runs its ready callbacks run
+            # on its next iteration
+            if remaining:
+                loop.call_soon(hop)
+            else:
+                callback()
+
+        loop.call_soon(hop)
+
+    return schedule
+
+
+__all__ = [
+    "BatchScheduler",
+    "next_tick_scheduler",
+    "time_window_scheduler",
+    "iterations_scheduler",
+]
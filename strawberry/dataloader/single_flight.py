@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+from asyncio import shield
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, Hashable, List, Tuple
+
+from .cache import get_shared_cache_key
+
+if TYPE_CHECKING:
+    from asyncio.futures import Future
+
+    from .loader import DataLoader
+
+
+# set on the keys of a cancelled batch, instead of their value
+_NOT_LOADED: Any = object()
+
+
+class SingleFlight:
+    """Shares the keys being loaded between concurrent batches.
+
+    When a batch is dispatched, the keys that another batch of a loader with
+    the same namespace is already loading are not passed to `load_fn`, the
+    batch waits for the values of the other batch instead. Use the same
+    instance for the loaders of all requests, so that concurrent requests
+    loading the same keys result in a single call to the backend.
+
+    Only batches running on the same event loop are shared. When the batch
+    loading a key is cancelled, the batches waiting for it load the key
+    themselves.
+
+    Example:
+
+    ```python
+    from strawberry.dataloader import DataLoader, SingleFlight
+
+    single_flight = SingleFlight()
+
+
+    async def get_context() -> Dict[str, Any]:
+        return {
+            "product_loader": DataLoader(load_products, single_flight=single_flight)
+        }
+    ```
+    """
+
+    def __init__(self) -> None:
+        # values (or errors) of the keys being loaded, by namespace and key
+        self.in_flight: Dict[Tuple[str, Hashable], Future[Any]] = {}
+
+    async def load(
+        self,
+        loader: DataLoader,
+        keys: List[Any],
+        load_fn: Callable[[List[Any]], Awaitable[List[Any]]],
+    ) -> List[Any]:
+        """Return the values of `keys`, calling `load_fn` for those not in flight.
+
+        Values are returned in the same order as `keys`, errors are returned
+        instead of being raised.
+        """
+        loop = loader.loop
+        namespace = loader.shared_cache_namespace
+        values: List[Any] = [None] * len(keys)
+        joined: List[Tuple[int, Future[Any]]] = []
+        owned: List[Tuple[int, Tuple[str, Hashable], Future[Any]]] = []
+
+        for index, key in enumerate(keys):
+            flight_key = (namespace, get_shared_cache_key(loader, key))
+            future = self.in_flight.get(flight_key)  # type: ignore[arg-type]
+
+            if future is not None and future.get_loop() is loop:
+                joined.append((index, future))
+            else:
+                future = loop.create_future()
+                self.in_flight[flight_key] = future  # type: ignore[index]
+                owned.append((index, flight_key, future))  # type: ignore[arg-type]
+
+        try:
+            if owned:
+                owned_keys = [keys[index] for index, _, _ in owned]
+
+                try:
+                    loaded = await load_fn(owned_keys)
+                except Exception as e:
+                    loaded = [e] * len(owned)
+
+                for (index, _, future), value in zip(owned, loaded):
+                    values[index] = value
+
+                    # joined batches could have been cancelled
+                    if not future.done():
+                        future.set_result(value)
+        finally:
+            for _, flight_key, future in owned:
+                # this batch was cancelled, the batches that joined it load
+                # the keys themselves
+                if not future.done():
+                    future.set_result(_NOT_LOADED)
+
+                if self.in_flight.get(flight_key) is future:
+                    del self.in_flight[flight_key]
+
+        not_loaded: List[int] = []
+
+        for index, future in joined:
+            # cancelling this batch mustn't cancel the one loading the key
+            value = await shield(future)
+
+            if value is _NOT_LOADED:
+                not_loaded.append(index)
+            else:
+                values[index] = value
+
+        if not_loaded:
+            reloaded = await self.load(
+                loader, [keys[index] for index in not_loaded], load_fn
+            )
+
+            for index, value in zip(not_loaded, reloaded):
+                values[index] = value
+
+        return values
+
+
+__all__ = [
+    "SingleFlight",
+]
@@ -0,0 +1,417 @@
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Generator,
+    Generic,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TypeVar,
+    Union,
+)
+
+from strawberry.exceptions import WrongNumberOfResultsReturned
+
+from .cache import DefaultCache
+from .instrumentation import (
+    get_instrumentations,
+    report_batch_dispatch,
+    report_batch_loaded,
+    report_load,
+)
+from .loader import LoaderTask, get_unique_keys
+
+if TYPE_CHECKING:
+    from .cache import AbstractCache
+    from .instrumentation import DataLoaderInstrumentation
+
+
+T = TypeVar("T")
+K = TypeVar("K")
+
+
+# loaders with pending keys, for the `run_sync` call in progress
+_sync_batch_scope: ContextVar[Optional[List[SyncDataLoader]]] = ContextVar(
+    "_sync_batch_scope", default=None
+)
+
+
+_PENDING = "PENDING"
+
+
+_FINISHED = "FINISHED"
+
+
+class SyncFuture(Generic[T]):
+    """The eventual result of a `SyncDataLoader` load.
+
+    It mirrors the parts of `asyncio.Future` used by the caches. Awaiting it
+    inside `run_sync` suspends the caller until the loader is dispatched, so
+    that the keys requested by the other pending resolvers end up in the same
+    batch. Outside of `run_sync`, awaiting it or calling `result` dispatches
+    the loader right away.
+    """
+
+    __slots__ = ("loader", "_state", "_result", "_exception", "_callbacks")
+
+    def __init__(self, loader: Optional[SyncDataLoader] = None) -> None:
+        # the loader that needs to be dispatched for this future to be done
+        self.loader = loader
+        self._state = _PENDING
+        self._result: Any = None
+        self._exception: Optional[BaseException] = None
+        self._callbacks: List[Callable[[SyncFuture[T]], Any]] = []
+
+    def done(self) -> bool:
+        return self._state == _FINISHED
+
+    def cancelled(self) -> bool:
+        return False
+
+    def result(self) -> T:
+        while self._state == _PENDING:
+            loader = self.loader
+
+            if loader is None or not loader.pending:
+                raise RuntimeError("The result of this load is not available")
+
+            loader.dispatch()
+
+        if self._exception is not None:
+            raise self._exception
+
+        return self._result
+
+    def exception(self) -> Optional[BaseException]:
+        if self._state == _PENDING:
+            raise RuntimeError("The result of this load is not available")
+
+        return self._exception
+
+    def set_result(self, result: T) -> None:
+        self._finish(result, None)
+
+    def set_exception(self, exception: BaseException) -> None:
+        self._finish(None, exception)
+
+    def add_done_callback(self, fn: Callable[[SyncFuture[T]], Any]) -> None:
+        if self._state == _FINISHED:
+            fn(self)
+        else:
+            self._callbacks.append(fn)
+
+    def then(self, fn: Callable[[T], Any]) -> SyncFuture[Any]:
+        """Return a future for the result of calling `fn` with this result.
+
+        If `fn` returns another `SyncFuture`, the returned future resolves to
+        its result, which allows chaining loads inside sync resolvers.
+        """
+        future: SyncFuture[Any] = SyncFuture(self.loader)
+
+        def on_done(source: SyncFuture[T]) -> None:
+            if source._exception is not None:
+                future.set_exception(source._exception)
+                return
+
+            try:
+                value = fn(source._result)
+            except Exception as e:
+                future.set_exception(e)
+                return
+
+            if isinstance(value, SyncFuture):
+                future.loader = value.loader
+                value.add_done_callback(future._copy_state)
+            else:
+                future.set_result(value)
+
+        self.add_done_callback(on_done)
+
+        return future
+
+    def _copy_state(self, source: SyncFuture[T]) -> None:
+        self._finish(source._result, source._exception)
+
+    def _finish(self, result: Any, exception: Optional[BaseException]) -> None:
+        if self._state == _FINISHED:
+            raise RuntimeError("The result of this load is already set")
+
+        self._state = _FINISHED
+        self._result = result
+        self._exception = exception
+
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback(self)
+
+    def __await__(self) -> Generator[SyncFuture[T], None, T]:
+        while self._state == _PENDING:
+            scope = _sync_batch_scope.get()
+
+            if scope is None:
+                break
+
+            # the keys could have been requested before `run_sync` started
+            if self.loader is not None and self.loader not in scope:
+                scope.append(self.loader)
+
+            yield self
+
+        return self.result()
+
+
+def gather_sync_futures(futures: Sequence[SyncFuture[T]]) -> SyncFuture[List[T]]:
+    """Return a future for the results of `futures`, in the same order."""
+    gathered: SyncFuture[List[T]] = SyncFuture(
+        next((future.loader for future in futures if not future.done()), None)
+    )
+    pending = len(futures)
+
+    def on_done(_: SyncFuture[T]) -> None:
+        nonlocal pending
+
+        pending -= 1
+
+        if pending or gathered.done():
+            return
+
+        exceptions = [future._exception for future in futures if future._exception]
+
+        if exceptions:
+            gathered.set_exception(exceptions[0])
+        else:
+            gathered.set_result([future._result for future in futures])
+
+    if not futures:
+        gathered.set_result([])
+
+    for future in futures:
+        future.add_done_callback(on_done)
+
+    return gathered
+
+
+class SyncDataLoader(Generic[K, T]):
+    """A DataLoader for operations executed synchronously.
+
+    `load` returns a `SyncFuture` instead of an asyncio future, and the batch
+    function is a plain function. Keys are collected until the loader is
+    dispatched, which `SyncBatchingExecutionContext` does once all the fields
+    of the current level of the operation have been resolved, so each loader
+    is called once per level.
+
+    Example:
+
+    ```python
+    from strawberry.dataloader import SyncDataLoader
+
+
+    def load_users(keys: List[int]) -> List[User]:
+        return User.objects.in_bulk(keys).values()
+
+
+    loader = SyncDataLoader(load_fn=load_users)
+    ```
+    """
+
+    cache_map: AbstractCache[K, T]
+
+    def __init__(
+        self,
+        # any BaseException is rethrown when getting the result, so should be
+        # excluded from the T type
+        load_fn: Callable[[List[K]], Sequence[Union[T, BaseException]]],
+        max_batch_size: Optional[int] = None,
+        cache: bool = True,
+        cache_map: Optional[AbstractCache[K, T]] = None,
+        cache_key_fn: Optional[Callable[[K], Hashable]] = None,
+        instrumentation: Optional[DataLoaderInstrumentation] = None,
+    ) -> None:
+        self.load_fn = load_fn
+        self.max_batch_size = max_batch_size
+        self.cache = cache
+        self.cache_key_fn = cache_key_fn
+        self.instrumentation = instrumentation
+        self.pending: List[LoaderTask[K, T]] = []
+        # when the first of the pending keys was requested
+        self.pending_since = 0.0
+
+        if self.cache:
+            self.cache_map = (
+                DefaultCache(cache_key_fn) if cache_map is None else cache_map
+            )
+
+    def load(self, key: K) -> SyncFuture[T]:
+        instrumentations = get_instrumentations(self)
+
+        if self.cache:
+            future = self.cache_map.get(key)
+
+            if future is not None:
+                if instrumentations:
+                    report_load(self, instrumentations, key, cache_hit=True)
+
+                return future  # type: ignore[return-value]
+
+        if instrumentations:
+            report_load(self, instrumentations, key, cache_hit=False)
+
+        future = SyncFuture(self)
+
+        if self.cache:
+            self.cache_map.set(key, future)  # type: ignore[arg-type]
+
+        self.pending.append(LoaderTask(key, future))  # type: ignore[arg-type]
+
+        if len(self.pending) == 1:
+            self.pending_since = time.perf_counter()
+            scope = _sync_batch_scope.get()
+
+            if scope is not None:
+                scope.append(self)
+
+        return future
+
+    def load_many(self, keys: Iterable[K]) -> SyncFuture[List[T]]:
+        return gather_sync_futures([self.load(key) for key in keys])
+
+    def dispatch(self) -> None:
+        """Call `load_fn` with the pending keys, in batches of `max_batch_size`."""
+        while self.pending:
+            if self.max_batch_size:
+                tasks = self.pending[: self.max_batch_size]
+                self.pending = self.pending[self.max_batch_size :]
+            else:
+                tasks, self.pending = self.pending, []
+
+            dispatch_sync_batch(self, tasks)
+
+    def clear(self, key: K) -> None:
+        if self.cache:
+            self.cache_map.delete(key)
+
+    def clear_many(self, keys: Iterable[K]) -> None:
+        if self.cache:
+            for key in keys:
+                self.cache_map.delete(key)
+
+    def clear_all(self) -> None:
+        if self.cache:
+            self.cache_map.clear()
+
+    def prime(self, key: K, value: T, force: bool = False) -> None:
+        self.prime_many({key: value}, force)
+
+    def prime_many(self, data: Mapping[K, T], force: bool = False) -> None:
+        if self.cache:
+            for key, value in data.items():
+                if not self.cache_map.get(key) or force:
+                    future: SyncFuture[T] = SyncFuture()
+                    future.set_result(value)
+                    self.cache_map.set(key, future)  # type: ignore[arg-type]
+
+        # keys that haven't been dispatched yet get the specified value
+        pending = []
+        for task in self.pending:
+            if task.key in data:
+                task.future.set_result(data[task.key])
+            else:
+                pending.append(task)
+
+        self.pending = pending
+
+
+def dispatch_sync_batch(loader: SyncDataLoader, tasks: List[LoaderTask]) -> None:
+    keys, positions = get_unique_keys(loader, tasks)
+    instrumentations = get_instrumentations(loader)
+
+    if instrumentations:
+        dispatched_at = report_batch_dispatch(
+            loader, instrumentations, len(keys), loader.pending_since
+        )
+
+    try:
+        values = list(loader.load_fn(keys))
+
+        if len(values) != len(keys):
+            raise WrongNumberOfResultsReturned(expected=len(keys), received=len(values))
+    except Exception as e:
+        if instrumentations:
+            report_batch_loaded(loader, instrumentations, len(keys), dispatched_at, e)
+
+        for task in tasks:
+            task.future.set_exception(e)
+        return
+
+    if instrumentations:
+        report_batch_loaded(loader, instrumentations, len(keys), dispatched_at)
+
+    for task, position in zip(tasks, positions):
+        value = values[position]
+
+        if isinstance(value, BaseException):
+            task.future.set_exception(value)
+        else:
+            task.future.set_result(value)
+
+
+def dispatch_pending_loaders(loaders: List[SyncDataLoader]) -> bool:
+    """Dispatch the loaders with pending keys, returning whether there were any."""
+    dispatched = False
+
+    while loaders:
+        loader = loaders.pop(0)
+
+        if loader.pending:
+            loader.dispatch()
+            dispatched = True
+
+    return dispatched
+
+
+def run_sync(awaitable: Awaitable[T]) -> T:
+    """Run `awaitable` to completion without an event loop.
+
+    Every time the pending coroutines are all waiting on `SyncFuture`s, the
+    loaders with pending keys are dispatched. Awaiting anything else, such as
+    an asyncio future, raises a `RuntimeError`.
+    """
+    scope: List[SyncDataLoader] = []
+    token = _sync_batch_scope.set(scope)
+    iterator = awaitable.__await__()
+
+    try:
+        while True:
+            try:
+                yielded = iterator.send(None)
+            except StopIteration as stop:
+                return stop.value
+
+            if (
+                yielded is not None and not isinstance(yielded, SyncFuture)
+            ) or not dispatch_pending_loaders(scope):
+                raise RuntimeError(
+                    "GraphQL execution failed to complete synchronously."
+                )
+    finally:
+        iterator.close()  # type: ignore[attr-defined]
+        _sync_batch_scope.reset(token)
+
+
+__all__ = [
+    "SyncDataLoader",
+    "SyncFuture",
+    "gather_sync_futures",
+    "dispatch_sync_batch",
+    "dispatch_pending_loaders",
+    "run_sync",
+]
@@ -143,6 +143,18 @@ class InvalidDefaultFactoryError(Exception):
         super().__init__(message)
 
 
+class InvalidBatchResolverError(Exception):
+    """Raised when a batch field doesn't have a resolver returning a list."""
+
+    def __init__(self, field_name: str) -> None:
+        message = (
+            f'The batch field "{field_name}" must have a resolver returning a '
+            "list, with a value for each parent"
+        )
+
+        super().__init__(message)
+
+
 class InvalidCustomContext(Exception):
     """Raised when a custom context object is of the wrong python type."""
 
@@ -183,6 +195,7 @@ __all__ = [
     "MissingQueryError",
     "InvalidArgumentTypeError",
     "InvalidDefaultFactoryError",
+    "InvalidBatchResolverError",
     "InvalidCustomContext",
     "MissingFieldAnnotationError",
     "DuplicatedTypeName",
@@ -2,7 +2,8 @@ import warnings
 from typing import Type
 
 from .add_validation_rules import AddValidationRules
-from .base_extension import LifecycleStep, SchemaExtension
+from .base_extension import LifecycleStep, ResolveScope, SchemaExtension
+from .dataloader_metrics import DataLoaderMetrics
 from .disable_validation import DisableValidation
 from .field_extension import FieldExtension
 from .mask_errors import MaskErrors
@@ -32,6 +33,7 @@ __all__ = [
     "FieldExtension",
     "SchemaExtension",
     "LifecycleStep",
+    "ResolveScope",
     "AddValidationRules",
     "DisableValidation",
     "ParserCache",
@@ -41,4 +43,5 @@ __all__ = [
     "MaskErrors",
     "MaxAliasesLimiter",
     "MaxTokensLimiter",
+    "DataLoaderMetrics",
 ]
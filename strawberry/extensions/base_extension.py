@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import TYPE_CHECKING, Any, Callable, Dict, Set
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Dict, Set
 
 from strawberry.utils.await_maybe import AsyncIteratorOrIterator, AwaitableOrValue
 
@@ -18,8 +18,19 @@ class LifecycleStep(Enum):
     RESOLVE = "resolve"
 
 
+class ResolveScope(Enum):
+    """The fields an extension's `resolve` hook is called for."""
+
+    ALL_FIELDS = "all_fields"
+    # fields with a custom resolver, skipping the ones reading an attribute
+    RESOLVER_FIELDS = "resolver_fields"
+    # fields of the query, mutation and subscription types
+    ROOT_FIELDS = "root_fields"
+
+
 class SchemaExtension:
     execution_context: ExecutionContext
+    resolve_scope: ClassVar[ResolveScope] = ResolveScope.ALL_FIELDS
 
     def __init__(self, *, execution_context: ExecutionContext) -> None:
         self.execution_context = execution_context
@@ -71,4 +82,4 @@ HOOK_METHODS: Set[str] = {
     SchemaExtension.on_execute.__name__,
 }
 
-__all__ = ["SchemaExtension", "Hook", "HOOK_METHODS", "LifecycleStep"]
+__all__ = ["SchemaExtension", "Hook", "HOOK_METHODS", "LifecycleStep", "ResolveScope"]
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import contextlib
 import inspect
-import types
 import warnings
 from asyncio import iscoroutinefunction
+from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -12,16 +12,21 @@ from typing import (
     AsyncIterator,
     Callable,
     ContextManager,
+    Dict,
+    FrozenSet,
     Iterator,
     List,
     NamedTuple,
     Optional,
+    Sequence,
+    Tuple,
     Type,
     Union,
 )
 
 from strawberry.extensions import SchemaExtension
 from strawberry.utils.await_maybe import AwaitableOrValue, await_maybe
+from strawberry.utils.deprecations import get_user_stacklevel
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -35,11 +40,20 @@ class WrappedHook(NamedTuple):
     is_async: bool
 
 
+HookFactory = Callable[[SchemaExtension], WrappedHook]
+
+
+def _raise_error(error: ValueError) -> HookFactory:
+    def hook_factory(extension: SchemaExtension) -> WrappedHook:
+        raise ValueError(*error.args)
+
+    return hook_factory
+
+
 class ExtensionContextManagerBase:
     __slots__ = (
         "hooks",
         "deprecation_message",
-        "default_hook",
         "async_exit_stack",
         "exit_stack",
     )
@@ -56,52 +70,107 @@ class ExtensionContextManagerBase:
     LEGACY_ENTER: str
     LEGACY_EXIT: str
 
-    def __init__(self, extensions: List[SchemaExtension]) -> None:
+    def __init__(
+        self,
+        extensions: List[SchemaExtension],
+        hook_factories: Optional[Sequence[Optional[HookFactory]]] = None,
+    ) -> None:
         self.hooks: List[WrappedHook] = []
-        self.default_hook: Hook = getattr(SchemaExtension, self.HOOK_NAME)
-        for extension in extensions:
-            hook = self.get_hook(extension)
-            if hook:
-                self.hooks.append(hook)
 
-    def get_hook(self, extension: SchemaExtension) -> Optional[WrappedHook]:
-        on_start = getattr(extension, self.LEGACY_ENTER, None)
-        on_end = getattr(extension, self.LEGACY_EXIT, None)
+        if hook_factories is None:
+            hook_factories = self.get_hook_factories(
+                [type(extension) for extension in extensions]
+            )
+
+        for extension, hook_factory in zip(extensions, hook_factories):
+            if hook_factory is not None:
+                self.hooks.append(hook_factory(extension))
 
-        is_legacy = on_start is not None or on_end is not None
-        hook_fn: Optional[Hook] = getattr(type(extension), self.HOOK_NAME)
-        hook_fn = hook_fn if hook_fn is not self.default_hook else None
+    def get_hook(self, extension: SchemaExtension) -> Optional[WrappedHook]:
+        hook_factory = self.get_hook_factory(type(extension))
+
+        return hook_factory(extension) if hook_factory else None
+
+    @classmethod
+    def get_hook_factories(
+        cls, extension_types: Sequence[Type[SchemaExtension]]
+    ) -> Tuple[Optional[HookFactory], ...]:
+        hook_factories: List[Optional[HookFactory]] = []
+
+        for extension_type in extension_types:
+            try:
+                hook_factory = cls.get_hook_factory(extension_type)
+            except ValueError as error:
+                # invalid hooks are reported when running the operation
+                hook_factory = _raise_error(error)
+
+            hook_factories.append(hook_factory)
+
+        return tuple(hook_factories)
+
+    @classmethod
+    def get_hook_factory(
+        cls, extension_type: Type[SchemaExtension]
+    ) -> Optional[HookFactory]:
+        """Find how `extension_type` implements this lifecycle hook.
+
+        The returned function creates the hook for an instance of the
+        extension, without inspecting the extension again.
+        """
+        legacy_enter = cls.LEGACY_ENTER
+        legacy_exit = cls.LEGACY_EXIT
+
+        is_legacy = (
+            getattr(extension_type, legacy_enter, None) is not None
+            or getattr(extension_type, legacy_exit, None) is not None
+        )
+        hook_fn: Optional[Hook] = getattr(extension_type, cls.HOOK_NAME)
+        hook_fn = (
+            hook_fn if hook_fn is not getattr(SchemaExtension, cls.HOOK_NAME) else None
+        )
         if is_legacy and hook_fn is not None:
             raise ValueError(
-                f"{extension} defines both legacy and new style extension hooks for "
+                f"{extension_type} defines both legacy and new style extension hooks for "
                 "{self.HOOK_NAME}"
             )
         elif is_legacy:
-            warnings.warn(self.DEPRECATION_MESSAGE, DeprecationWarning, stacklevel=3)
-            return self.from_legacy(extension, on_start, on_end)
+            warnings.warn(
+                cls.DEPRECATION_MESSAGE,
+                DeprecationWarning,
+                stacklevel=get_user_stacklevel(),
+            )
+            return lambda extension: cls.from_legacy(
+                extension,
+                getattr(extension, legacy_enter, None),
+                getattr(extension, legacy_exit, None),
+            )
 
         if hook_fn:
             if inspect.isgeneratorfunction(hook_fn):
-                context_manager = contextlib.contextmanager(
-                    types.MethodType(hook_fn, extension)
-                )
-                return WrappedHook(
-                    extension=extension, hook=context_manager, is_async=False
+                context_manager = contextlib.contextmanager(hook_fn)
+
+                return lambda extension: WrappedHook(
+                    extension=extension,
+                    hook=partial(context_manager, extension),
+                    is_async=False,
                 )
 
             if inspect.isasyncgenfunction(hook_fn):
-                context_manager_async = contextlib.asynccontextmanager(
-                    types.MethodType(hook_fn, extension)
-                )
-                return WrappedHook(
-                    extension=extension, hook=context_manager_async, is_async=True
+                context_manager_async = contextlib.asynccontextmanager(hook_fn)
+
+                return lambda extension: WrappedHook(
+                    extension=extension,
+                    hook=partial(context_manager_async, extension),
+                    is_async=True,
                 )
 
             if callable(hook_fn):
-                return self.from_callable(extension, hook_fn)
+                callable_hook_fn = hook_fn
+
+                return lambda extension: cls.from_callable(extension, callable_hook_fn)
 
             raise ValueError(
-                f"Hook {self.HOOK_NAME} on {extension} "
+                f"Hook {cls.HOOK_NAME} on {extension_type} "
                 f"must be callable, received {hook_fn!r}"
             )
 
@@ -227,3 +296,58 @@ class ExecutingContextManager(ExtensionContextManagerBase):
     HOOK_NAME = SchemaExtension.on_execute.__name__
     LEGACY_ENTER = "on_executing_start"
     LEGACY_EXIT = "on_executing_end"
+
+
+class ExtensionHooks:
+    """The lifecycle hooks implemented by a list of extensions.
+
+    Finding out which hooks an extension implements, and how, only depends on
+    its class, so this is done once per schema instead of once per operation.
+    """
+
+    __slots__ = (
+        "extensions",
+        "operation",
+        "validation",
+        "parsing",
+        "executing",
+        "resolve",
+        "resolve_scopes",
+        "shared_middleware",
+        "middleware_resolvers",
+        "root_resolvers",
+    )
+
+    def __init__(
+        self, extensions: Sequence[Union[Type[SchemaExtension], SchemaExtension]]
+    ) -> None:
+        self.extensions = tuple(extensions)
+
+        extension_types = [
+            extension if isinstance(extension, type) else type(extension)
+            for extension in self.extensions
+        ]
+
+        self.operation = OperationContextManager.get_hook_factories(extension_types)
+        self.validation = ValidationContextManager.get_hook_factories(extension_types)
+        self.parsing = ParsingContextManager.get_hook_factories(extension_types)
+        self.executing = ExecutingContextManager.get_hook_factories(extension_types)
+
+        # only the extensions implementing `resolve` are used as middleware
+        self.resolve = tuple(
+            index
+            for index, extension_type in enumerate(extension_types)
+            if extension_type.resolve is not SchemaExtension.resolve
+        )
+        self.resolve_scopes = tuple(
+            extension_types[index].resolve_scope for index in self.resolve
+        )
+
+        # when all of them are instances, the same ones are used for every
+        # operation, so the wrapped resolvers can be reused too
+        self.shared_middleware = all(
+            isinstance(self.extensions[index], SchemaExtension)
+            for index in self.resolve
+        )
+        self.middleware_resolvers: Dict[Callable, Callable] = {}
+        self.root_resolvers: Optional[FrozenSet[Callable]] = None
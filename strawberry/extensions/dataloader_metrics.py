@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterator, Optional
+
+from strawberry.dataloader import DataLoaderInstrumentation, instrument_dataloaders
+from strawberry.exceptions import WrongNumberOfResultsReturned
+from strawberry.extensions.base_extension import SchemaExtension
+
+
+def get_loader_name(loader: Any) -> str:
+    load_fn = loader.load_fn
+    name = getattr(load_fn, "__qualname__", None)
+
+    if name is None:
+        return repr(load_fn)
+
+    return f"{load_fn.__module__}.{name}"
+
+
+class LoaderMetrics:
+    __slots__ = (
+        "loads",
+        "cache_hits",
+        "batches",
+        "batch_sizes",
+        "total_wait_time",
+        "max_wait_time",
+        "total_queue_time",
+        "max_queue_time",
+        "total_load_time",
+        "max_load_time",
+        "errors",
+        "wrong_number_of_results",
+    )
+
+    def __init__(self) -> None:
+        self.loads = 0
+        self.cache_hits = 0
+        self.batches = 0
+        # number of batches for each batch size
+        self.batch_sizes: Dict[int, int] = {}
+        self.total_wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.total_queue_time = 0.0
+        self.max_queue_time = 0.0
+        self.total_load_time = 0.0
+        self.max_load_time = 0.0
+        self.errors = 0
+        self.wrong_number_of_results = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "loads": self.loads,
+            "cacheHits": self.cache_hits,
+            "cacheMisses": self.loads - self.cache_hits,
+            "cacheHitRatio": self.cache_hits / self.loads if self.loads else None,
+            "batches": self.batches,
+            "batchSizes": {
+                str(size): count for size, count in sorted(self.batch_sizes.items())
+            },
+            "waitTime": {"total": self.total_wait_time, "max": self.max_wait_time},
+            "queueTime": {"total": self.total_queue_time, "max": self.max_queue_time},
+            "loadTime": {"total": self.total_load_time, "max": self.max_load_time},
+            "errors": self.errors,
+            "wrongNumberOfResults": self.wrong_number_of_results,
+        }
+
+
+class DataLoaderMetricsCollector(DataLoaderInstrumentation):
+    """Aggregates the events of each loader, keyed by the name of its `load_fn`."""
+
+    def __init__(self) -> None:
+        self.loaders: Dict[str, LoaderMetrics] = {}
+
+    def get_metrics(self, loader: Any) -> LoaderMetrics:
+        name = get_loader_name(loader)
+        metrics = self.loaders.get(name)
+
+        if metrics is None:
+            metrics = self.loaders[name] = LoaderMetrics()
+
+        return metrics
+
+    def on_load(self, loader: Any, key: Any, cache_hit: bool) -> None:
+        metrics = self.get_metrics(loader)
+        metrics.loads += 1
+
+        if cache_hit:
+            metrics.cache_hits += 1
+
+    def on_batch_dispatch(self, loader: Any, batch_size: int, wait_time: float) -> None:
+        metrics = self.get_metrics(loader)
+        metrics.batches += 1
+        metrics.batch_sizes[batch_size] = metrics.batch_sizes.get(batch_size, 0) + 1
+        metrics.total_wait_time += wait_time
+        metrics.max_wait_time = max(metrics.max_wait_time, wait_time)
+
+    def on_batch_queued(self, loader: Any, batch_size: int, queue_time: float) -> None:
+        metrics = self.get_metrics(loader)
+        metrics.total_queue_time += queue_time
+        metrics.max_queue_time = max(metrics.max_queue_time, queue_time)
+
+    def on_batch_loaded(
+        self,
+        loader: Any,
+        batch_size: int,
+        load_time: float,
+        error: Optional[BaseException],
+    ) -> None:
+        metrics = self.get_metrics(loader)
+        metrics.total_load_time += load_time
+        metrics.max_load_time = max(metrics.max_load_time, load_time)
+
+        if error is not None:
+            metrics.errors += 1
+
+            if isinstance(error, WrongNumberOfResultsReturned):
+                metrics.wrong_number_of_results += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: metrics.as_dict() for name, metrics in self.loaders.items()}
+
+
+class DataLoaderMetrics(SchemaExtension):
+    """Add metrics about the DataLoaders used by each operation to its result.
+
+    For each loader, keyed by the qualified name of its `load_fn`, the number
+    of loads and cache hits, the number of batches of each size, the time
+    batches waited to be dispatched and for a slot of the loader's
+    `BatchLimiter`s, the time spent in `load_fn` (in seconds), and the number
+    of failed batches are added to the `dataloaders` key of the response
+    `extensions`.
+
+    A loader shared between concurrent operations reports each batch to the
+    operation that requested its first key.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.extensions import DataLoaderMetrics
+
+    schema = strawberry.Schema(Query, extensions=[DataLoaderMetrics])
+    ```
+    """
+
+    collector: Optional[DataLoaderMetricsCollector] = None
+
+    def on_operation(self) -> Iterator[None]:
+        self.collector = DataLoaderMetricsCollector()
+
+        with instrument_dataloaders(self.collector):
+            yield
+
+    def get_results(self) -> Dict[str, Any]:
+        if self.collector is None:
+            return {}
+
+        return {"dataloaders": self.collector.as_dict()}
+
+
+__all__ = ["DataLoaderMetrics", "DataLoaderMetricsCollector", "LoaderMetrics"]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import inspect
 import itertools
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, Awaitable, Callable, Union
@@ -51,7 +52,9 @@ class SyncToAsyncExtension(FieldExtension):
     async def resolve_async(
         self, next_: AsyncExtensionResolver, source: Any, info: Info, **kwargs: Any
     ) -> Any:
-        return next_(source, info, **kwargs)
+        result = next_(source, info, **kwargs)
+        # sync resolvers can still return awaitables, like a DataLoader's future
+        return await result if inspect.isawaitable(result) else result
 
 
 def _get_sync_resolvers(
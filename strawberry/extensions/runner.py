@@ -1,24 +1,120 @@
 from __future__ import annotations
 
 import inspect
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union
+from functools import partial, reduce
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Type,
+    Union,
+)
 
 from graphql import MiddlewareManager
 
 from strawberry.extensions.context import (
     ExecutingContextManager,
+    ExtensionHooks,
     OperationContextManager,
     ParsingContextManager,
     ValidationContextManager,
 )
+from strawberry.resolvers import is_default_resolver
 from strawberry.utils.await_maybe import await_maybe
 
 from . import SchemaExtension
+from .base_extension import ResolveScope
 
 if TYPE_CHECKING:
+    from graphql import GraphQLSchema
+
     from strawberry.types import ExecutionContext
 
 
+def get_root_resolvers(schema: GraphQLSchema) -> FrozenSet[Callable]:
+    root_types = (schema.query_type, schema.mutation_type, schema.subscription_type)
+
+    return frozenset(
+        field.resolve
+        for root_type in root_types
+        if root_type is not None
+        for field in root_type.fields.values()
+        if field.resolve is not None
+    )
+
+
+def should_wrap_resolver(
+    scope: ResolveScope,
+    field_resolver: Callable,
+    root_resolvers: FrozenSet[Callable],
+) -> bool:
+    if scope is ResolveScope.RESOLVER_FIELDS:
+        return not is_default_resolver(field_resolver)
+
+    if scope is ResolveScope.ROOT_FIELDS:
+        return field_resolver in root_resolvers
+
+    return True
+
+
+class ExtensionsMiddlewareManager(MiddlewareManager):
+    """Wraps field resolvers with the `resolve` hook of the extensions.
+
+    Each resolver is only wrapped by the extensions whose `resolve_scope`
+    includes its field. When the extensions are shared instances, the wrapped
+    resolvers are computed once per schema instead of once per operation.
+
+    Only the public `get_field_resolver` of graphql-core's `MiddlewareManager`
+    is overridden, the hooks are composed here.
+    """
+
+    def __init__(
+        self,
+        extensions: List[SchemaExtension],
+        hooks: ExtensionHooks,
+        schema: GraphQLSchema,
+    ) -> None:
+        resolve_extensions = [extensions[index] for index in hooks.resolve]
+
+        super().__init__(*resolve_extensions)
+
+        if hooks.root_resolvers is None:
+            hooks.root_resolvers = get_root_resolvers(schema)
+
+        self.hooks = hooks
+        self.resolve_hooks: List[Callable] = [
+            extension.resolve for extension in resolve_extensions
+        ]
+        self.resolvers: Dict[Callable, Callable] = (
+            hooks.middleware_resolvers if hooks.shared_middleware else {}
+        )
+
+    def get_field_resolver(self, field_resolver: Callable) -> Callable:
+        resolver = self.resolvers.get(field_resolver)
+
+        if resolver is None:
+            hooks = self.hooks
+            assert hooks.root_resolvers is not None
+
+            resolve_hooks = [
+                resolve_hook
+                for resolve_hook, scope in zip(self.resolve_hooks, hooks.resolve_scopes)
+                if should_wrap_resolver(scope, field_resolver, hooks.root_resolvers)
+            ]
+
+            resolver = self.resolvers[field_resolver] = reduce(
+                lambda chained_fns, next_fn: partial(next_fn, chained_fns),
+                resolve_hooks,
+                field_resolver,
+            )
+
+        return resolver
+
+
 class SchemaExtensionsRunner:
     extensions: List[SchemaExtension]
 
@@ -28,15 +124,18 @@ class SchemaExtensionsRunner:
         extensions: Optional[
             List[Union[Type[SchemaExtension], SchemaExtension]]
         ] = None,
+        hooks: Optional[ExtensionHooks] = None,
     ) -> None:
         self.execution_context = execution_context
 
-        if not extensions:
-            extensions = []
+        if hooks is None:
+            hooks = ExtensionHooks(extensions or [])
+
+        self.hooks = hooks
 
         init_extensions: List[SchemaExtension] = []
 
-        for extension in extensions:
+        for extension in hooks.extensions:
             # If the extension has already been instantiated then set the
             # `execution_context` attribute
             if isinstance(extension, SchemaExtension):
@@ -48,16 +147,16 @@ class SchemaExtensionsRunner:
         self.extensions = init_extensions
 
     def operation(self) -> OperationContextManager:
-        return OperationContextManager(self.extensions)
+        return OperationContextManager(self.extensions, self.hooks.operation)
 
     def validation(self) -> ValidationContextManager:
-        return ValidationContextManager(self.extensions)
+        return ValidationContextManager(self.extensions, self.hooks.validation)
 
     def parsing(self) -> ParsingContextManager:
-        return ParsingContextManager(self.extensions)
+        return ParsingContextManager(self.extensions, self.hooks.parsing)
 
     def executing(self) -> ExecutingContextManager:
-        return ExecutingContextManager(self.extensions)
+        return ExecutingContextManager(self.extensions, self.hooks.executing)
 
     def get_extensions_results_sync(self) -> Dict[str, Any]:
         data: Dict[str, Any] = {}
@@ -80,10 +179,23 @@ class SchemaExtensionsRunner:
 
         return data
 
-    def as_middleware_manager(self, *additional_middlewares: Any) -> MiddlewareManager:
-        middlewares = tuple(self.extensions) + additional_middlewares
+    def as_middleware_manager(
+        self, *additional_middlewares: Any
+    ) -> Optional[MiddlewareManager]:
+        if additional_middlewares:
+            middlewares = (
+                *(self.extensions[index] for index in self.hooks.resolve),
+                *additional_middlewares,
+            )
+
+            return MiddlewareManager(*middlewares)
+
+        if not self.hooks.resolve:
+            return None
 
-        return MiddlewareManager(*middlewares)
+        return ExtensionsMiddlewareManager(
+            self.extensions, self.hooks, self.execution_context.schema._schema
+        )
 
 
-__all__ = ["SchemaExtensionsRunner"]
+__all__ = ["SchemaExtensionsRunner", "ExtensionsMiddlewareManager"]
@@ -6,7 +6,7 @@ from datetime import datetime, timezone
 from inspect import isawaitable
 from typing import TYPE_CHECKING, Any, Callable, Dict, Generator, List, Optional
 
-from strawberry.extensions import SchemaExtension
+from strawberry.extensions import ResolveScope, SchemaExtension
 from strawberry.extensions.utils import get_path_from_info
 
 from .utils import should_skip_tracing
@@ -80,6 +80,9 @@ class ApolloTracingStats:
 
 
 class ApolloTracingExtension(SchemaExtension):
+    # default resolvers are never traced, see `should_skip_tracing`
+    resolve_scope = ResolveScope.RESOLVER_FIELDS
+
     def __init__(self, execution_context: ExecutionContext) -> None:
         self._resolver_stats: List[ApolloResolverStats] = []
         self.execution_context = execution_context
@@ -7,7 +7,7 @@ from typing import TYPE_CHECKING, Any, Callable, Generator, Iterator, Optional
 
 from ddtrace import Span, tracer
 
-from strawberry.extensions import LifecycleStep, SchemaExtension
+from strawberry.extensions import LifecycleStep, ResolveScope, SchemaExtension
 from strawberry.extensions.tracing.utils import should_skip_tracing
 
 if TYPE_CHECKING:
@@ -17,6 +17,9 @@ if TYPE_CHECKING:
 
 
 class DatadogTracingExtension(SchemaExtension):
+    # default resolvers are never traced, see `should_skip_tracing`
+    resolve_scope = ResolveScope.RESOLVER_FIELDS
+
     def __init__(
         self,
         *,
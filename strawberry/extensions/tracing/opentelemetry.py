@@ -18,7 +18,7 @@ from typing import (
 from opentelemetry import trace
 from opentelemetry.trace import SpanKind
 
-from strawberry.extensions import LifecycleStep, SchemaExtension
+from strawberry.extensions import LifecycleStep, ResolveScope, SchemaExtension
 from strawberry.extensions.utils import get_path_from_info
 
 from .utils import should_skip_tracing
@@ -36,6 +36,9 @@ ArgFilter = Callable[[Dict[str, Any], "GraphQLResolveInfo"], Dict[str, Any]]
 
 
 class OpenTelemetryExtension(SchemaExtension):
+    # default resolvers are never traced, see `should_skip_tracing`
+    resolve_scope = ResolveScope.RESOLVER_FIELDS
+
     _arg_filter: Optional[ArgFilter]
     _span_holder: Dict[LifecycleStep, Span] = dict()
     _tracer: Tracer
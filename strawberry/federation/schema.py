@@ -1,9 +1,13 @@
+import asyncio
+import inspect
 from collections import defaultdict
 from functools import cached_property
 from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
+    Callable,
     DefaultDict,
     Dict,
     Iterable,
@@ -18,6 +22,7 @@ from typing import (
 )
 
 from strawberry.annotation import StrawberryAnnotation
+from strawberry.exceptions import WrongNumberOfResultsReturned
 from strawberry.printer import print_schema
 from strawberry.schema import Schema as BaseSchema
 from strawberry.types.base import (
@@ -29,6 +34,7 @@ from strawberry.types.base import (
 from strawberry.types.info import Info
 from strawberry.types.scalar import scalar
 from strawberry.types.union import StrawberryUnion
+from strawberry.utils.await_maybe import AwaitableOrValue
 from strawberry.utils.inspect import get_func_args
 
 from .schema_directive import StrawberryFederationSchemaDirective
@@ -39,6 +45,8 @@ if TYPE_CHECKING:
     from strawberry.extensions import SchemaExtension
     from strawberry.federation.schema_directives import ComposeDirective
     from strawberry.schema.config import StrawberryConfig
+    from strawberry.schema.operation_cache import OperationCache
+    from strawberry.schema.trusted_documents import TrustedDocuments
     from strawberry.schema_directive import StrawberrySchemaDirective
     from strawberry.types.enum import EnumDefinition
     from strawberry.types.scalar import ScalarDefinition, ScalarWrapper
@@ -47,6 +55,32 @@ if TYPE_CHECKING:
 FederationAny = scalar(NewType("_Any", object), name="_Any")  # type: ignore
 
 
+_EntityResolver = Callable[[List[Dict[str, Any]], Info], AwaitableOrValue[List[Any]]]
+
+
+def _check_references(
+    representations: List[Dict[str, Any]], results: Iterable[Any]
+) -> List[Any]:
+    results = list(results)
+
+    if len(results) != len(representations):
+        error = WrongNumberOfResultsReturned(
+            expected=len(representations), received=len(results)
+        )
+        return [error] * len(representations)
+
+    return results
+
+
+async def _await_references(
+    representations: List[Dict[str, Any]], results: Awaitable[Iterable[Any]]
+) -> List[Any]:
+    try:
+        return _check_references(representations, await results)
+    except Exception as e:
+        return [e] * len(representations)
+
+
 class Schema(BaseSchema):
     def __init__(
         self,
@@ -64,7 +98,12 @@ class Schema(BaseSchema):
         ] = None,
         schema_directives: Iterable[object] = (),
         enable_federation_2: bool = False,
+        operation_cache: Optional["OperationCache"] = None,
+        trusted_documents: Optional["TrustedDocuments"] = None,
     ) -> None:
+        # the function resolving the representations of each entity type
+        self._entity_resolvers: Dict[str, _EntityResolver] = {}
+
         query = self._get_federation_query_type(query, mutation, subscription, types)
         types = [*types, FederationAny]
 
@@ -79,6 +118,8 @@ class Schema(BaseSchema):
             config=config,
             scalar_overrides=scalar_overrides,
             schema_directives=schema_directives,
+            operation_cache=operation_cache,
+            trusted_documents=trusted_documents,
         )
 
         self.schema_directives = list(schema_directives)
@@ -158,47 +199,137 @@ class Schema(BaseSchema):
     def entities_resolver(
         self, info: Info, representations: List[FederationAny]
     ) -> List[FederationAny]:
-        results = []
+        # group the representations by type, so each type is resolved at once
+        indices: DefaultDict[str, List[int]] = defaultdict(list)
 
-        for representation in representations:
-            type_name = representation.pop("__typename")
-            type_ = self.schema_converter.type_map[type_name]
+        for index, representation in enumerate(representations):
+            indices[representation.pop("__typename")].append(index)
 
-            definition = cast(StrawberryObjectDefinition, type_.definition)
+        results: List[Any] = [None] * len(representations)
+        awaitable_results: Dict[str, Awaitable[List[Any]]] = {}
 
-            if hasattr(definition.origin, "resolve_reference"):
-                resolve_reference = definition.origin.resolve_reference
+        for type_name, type_indices in indices.items():
+            type_results = self._get_entity_resolver(type_name)(
+                [representations[index] for index in type_indices], info
+            )
+
+            if inspect.isawaitable(type_results):
+                awaitable_results[type_name] = type_results
+                continue
+
+            for index, result in zip(type_indices, type_results):
+                results[index] = result
+
+        if not awaitable_results:
+            return results
 
-                func_args = get_func_args(resolve_reference)
-                kwargs = representation
+        async def gather_results() -> List[Any]:
+            # the types are resolved concurrently
+            for type_name, type_results in zip(
+                awaitable_results,
+                await asyncio.gather(*awaitable_results.values()),
+            ):
+                for index, result in zip(indices[type_name], type_results):
+                    results[index] = result
 
-                # TODO: use the same logic we use for other resolvers
-                if "info" in func_args:
-                    kwargs["info"] = info
+            return results
+
+        return gather_results()  # type: ignore[return-value]
+
+    def _get_entity_resolver(self, type_name: str) -> _EntityResolver:
+        resolver = self._entity_resolvers.get(type_name)
+
+        if resolver is None:
+            resolver = self._entity_resolvers[type_name] = self._create_entity_resolver(
+                type_name
+            )
 
+        return resolver
+
+    def _create_entity_resolver(self, type_name: str) -> _EntityResolver:
+        """Create the function resolving the representations of a type.
+
+        The type's `resolve_references` is called once with all of them, its
+        `resolve_reference` is called for each of them, and otherwise they are
+        converted to the type like input arguments.
+        """
+        type_ = self.schema_converter.type_map[type_name]
+
+        definition = cast(StrawberryObjectDefinition, type_.definition)
+        origin = definition.origin
+
+        if hasattr(origin, "resolve_references"):
+            resolve_references = origin.resolve_references
+            pass_info = "info" in get_func_args(resolve_references)
+
+            def resolve_batch(
+                representations: List[Dict[str, Any]], info: Info
+            ) -> AwaitableOrValue[List[Any]]:
                 try:
-                    result = resolve_reference(**kwargs)
+                    if pass_info:
+                        results = resolve_references(representations, info=info)
+                    else:
+                        results = resolve_references(representations)
                 except Exception as e:
-                    result = e
-            else:
-                from strawberry.types.arguments import convert_argument
+                    return [e] * len(representations)
+
+                if inspect.isawaitable(results):
+                    return _await_references(representations, results)
+
+                return _check_references(representations, results)
+
+            return resolve_batch
 
-                config = info.schema.config
-                scalar_registry = info.schema.schema_converter.scalar_registry
+        if hasattr(origin, "resolve_reference"):
+            resolve_reference = origin.resolve_reference
+            pass_info = "info" in get_func_args(resolve_reference)
 
+            def resolve_each(
+                representations: List[Dict[str, Any]], info: Info
+            ) -> List[Any]:
+                results = []
+
+                for kwargs in representations:
+                    # TODO: use the same logic we use for other resolvers
+                    if pass_info:
+                        kwargs["info"] = info
+
+                    try:
+                        result = resolve_reference(**kwargs)
+                    except Exception as e:
+                        result = e
+
+                    results.append(result)
+
+                return results
+
+            return resolve_each
+
+        def convert_each(
+            representations: List[Dict[str, Any]], info: Info
+        ) -> List[Any]:
+            from strawberry.types.arguments import convert_argument
+
+            config = info.schema.config
+            scalar_registry = info.schema.schema_converter.scalar_registry
+            results = []
+
+            for representation in representations:
                 try:
                     result = convert_argument(
                         representation,
-                        type_=definition.origin,
+                        type_=origin,
                         scalar_registry=scalar_registry,
                         config=config,
                     )
                 except Exception:
                     result = TypeError(f"Unable to resolve reference for {type_name}")
 
-            results.append(result)
+                results.append(result)
+
+            return results
 
-        return results
+        return convert_each
 
     def _remove_resolvable_field(self) -> None:
         # this might be removed when we remove support for federation 1
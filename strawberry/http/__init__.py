@@ -33,6 +33,9 @@ class GraphQLRequestData:
     query: Optional[str]
     variables: Optional[Dict[str, Any]]
     operation_name: Optional[str]
+    extensions: Optional[Dict[str, Any]] = None
+    # id of a trusted document, sent instead of the query
+    document_id: Optional[str] = None
 
 
 def parse_query_params(params: Dict[str, str]) -> Dict[str, Any]:
@@ -47,6 +50,8 @@ def parse_request_data(data: Mapping[str, Any]) -> GraphQLRequestData:
         query=data.get("query"),
         variables=data.get("variables"),
         operation_name=data.get("operationName"),
+        extensions=data.get("extensions"),
+        document_id=data.get("documentId"),
     )
 
 
@@ -26,10 +26,16 @@ from strawberry.http import (
     process_result,
 )
 from strawberry.http.ides import GraphQL_IDE
+from strawberry.http.persisted_queries import (
+    get_persisted_query_hash,
+    persisted_query_not_found_error,
+    verify_query_hash,
+)
 from strawberry.schema.base import BaseSchema
 from strawberry.schema.exceptions import InvalidOperationTypeError
 from strawberry.types import ExecutionResult, SubscriptionExecutionResult
 from strawberry.types.graphql import OperationType
+from strawberry.utils.await_maybe import await_maybe
 
 from .base import BaseView
 from .exceptions import HTTPException
@@ -121,6 +127,11 @@ class AsyncBaseHTTPView(
 
         assert self.schema
 
+        if not await self.resolve_persisted_query(request_data):
+            return ExecutionResult(
+                data=None, errors=[persisted_query_not_found_error()]
+            )
+
         return await self.schema.execute(
             request_data.query,
             root_value=root_value,
@@ -128,8 +139,40 @@ class AsyncBaseHTTPView(
             context_value=context,
             operation_name=request_data.operation_name,
             allowed_operation_types=allowed_operation_types,
+            document_id=self.get_document_id(request_data),
+        )
+
+    async def resolve_persisted_query(self, request_data: GraphQLRequestData) -> bool:
+        """Handle the Automatic Persisted Queries protocol.
+
+        Fills in the query of requests that only send the hash of a known
+        document and stores documents sent along with their hash.
+
+        Returns `False` when the hash is not in the store, so that clients can
+        retry sending the full document.
+        """
+        if self.persisted_query_store is None:
+            return True
+
+        sha256_hash = get_persisted_query_hash(request_data.extensions)
+
+        if sha256_hash is None:
+            return True
+
+        if request_data.query is None:
+            request_data.query = await await_maybe(
+                self.persisted_query_store.get(sha256_hash)
+            )
+
+            return request_data.query is not None
+
+        verify_query_hash(request_data.query, sha256_hash)
+        await await_maybe(
+            self.persisted_query_store.set(sha256_hash, request_data.query)
         )
 
+        return True
+
     async def parse_multipart(self, request: AsyncHTTPRequestAdapter) -> Dict[str, str]:
         try:
             form_data = await request.get_form_data()
@@ -327,6 +370,8 @@ class AsyncBaseHTTPView(
             query=data.get("query"),
             variables=data.get("variables"),
             operation_name=data.get("operationName"),
+            extensions=data.get("extensions"),
+            document_id=data.get("documentId"),
         )
 
     async def process_result(
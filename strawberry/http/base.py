@@ -2,8 +2,12 @@ import json
 from typing import Any, Dict, Generic, List, Mapping, Optional, Union
 from typing_extensions import Protocol
 
-from strawberry.http import GraphQLHTTPResponse
+from strawberry.http import GraphQLHTTPResponse, GraphQLRequestData
 from strawberry.http.ides import GraphQL_IDE, get_graphql_ide_html
+from strawberry.http.persisted_queries import (
+    PersistedQueryStore,
+    get_persisted_query_hash,
+)
 from strawberry.http.types import HTTPMethod, QueryParams
 
 from .exceptions import HTTPException
@@ -24,6 +28,9 @@ class BaseRequestProtocol(Protocol):
 class BaseView(Generic[Request]):
     graphql_ide: Optional[GraphQL_IDE]
 
+    # Enables Automatic Persisted Queries when set
+    persisted_query_store: Optional[PersistedQueryStore] = None
+
     # TODO: we might remove this in future :)
     _ide_replace_variables: bool = True
     _ide_subscription_enabled: bool = True
@@ -32,6 +39,8 @@ class BaseView(Generic[Request]):
         return (
             request.method == "GET"
             and request.query_params.get("query") is None
+            and request.query_params.get("extensions") is None
+            and request.query_params.get("documentId") is None
             and any(
                 supported_header in request.headers.get("accept", "")
                 for supported_header in ("text/html", "*/*")
@@ -59,8 +68,28 @@ class BaseView(Generic[Request]):
             if variables:
                 params["variables"] = self.parse_json(variables)
 
+        if "extensions" in params:
+            extensions = params["extensions"]
+
+            if extensions:
+                params["extensions"] = self.parse_json(extensions)
+
         return params
 
+    def get_document_id(self, request_data: GraphQLRequestData) -> Optional[str]:
+        """Return the id of the trusted document referenced by the request.
+
+        Requests without a query can reference a document either with the
+        `documentId` field or with the hash used by persisted queries.
+        """
+        if request_data.document_id is not None:
+            return request_data.document_id
+
+        if request_data.query is None:
+            return get_persisted_query_hash(request_data.extensions)
+
+        return None
+
     @property
     def graphql_ide_html(self) -> str:
         return get_graphql_ide_html(
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Mapping, Optional
+from typing_extensions import Protocol
+
+from graphql import GraphQLError
+
+from .exceptions import HTTPException
+
+if TYPE_CHECKING:
+    from strawberry.utils.await_maybe import AwaitableOrValue
+
+PERSISTED_QUERY_NOT_FOUND = "PersistedQueryNotFound"
+PERSISTED_QUERY_NOT_FOUND_CODE = "PERSISTED_QUERY_NOT_FOUND"
+ASYNC_STORE_IN_SYNC_VIEW_MESSAGE = (
+    "Async persisted query stores are not supported in sync mode"
+)
+
+
+class PersistedQueryStore(Protocol):
+    """Storage for Automatic Persisted Queries, mapping sha256 hashes to documents.
+
+    Both methods can either return a value or an awaitable, awaitables are
+    only supported by the async views.
+    """
+
+    def get(self, sha256_hash: str) -> AwaitableOrValue[Optional[str]]: ...
+
+    def set(self, sha256_hash: str, query: str) -> AwaitableOrValue[None]: ...
+
+
+class InMemoryPersistedQueryStore:
+    """In memory LRU store for Automatic Persisted Queries.
+
+    Example:
+
+    ```python
+    from strawberry.asgi import GraphQL
+    from strawberry.http.persisted_queries import InMemoryPersistedQueryStore
+
+
+    class MyGraphQL(GraphQL):
+        persisted_query_store = InMemoryPersistedQueryStore(maxsize=1000)
+    ```
+    """
+
+    def __init__(self, maxsize: Optional[int] = 1000) -> None:
+        """Initialize the InMemoryPersistedQueryStore.
+
+        Args:
+            maxsize: The maximum number of documents to keep. If `maxsize` is set
+                to `None` the store will grow without bound.
+        """
+        self.maxsize = maxsize
+        self._queries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, sha256_hash: str) -> Optional[str]:
+        with self._lock:
+            query = self._queries.get(sha256_hash)
+
+            if query is not None:
+                self._queries.move_to_end(sha256_hash)
+
+            return query
+
+    def set(self, sha256_hash: str, query: str) -> None:
+        with self._lock:
+            self._queries[sha256_hash] = query
+            self._queries.move_to_end(sha256_hash)
+
+            if self.maxsize is not None:
+                while len(self._queries) > self.maxsize:
+                    self._queries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._queries)
+
+
+def is_async_persisted_query_store(store: PersistedQueryStore) -> bool:
+    return inspect.iscoroutinefunction(store.get) or inspect.iscoroutinefunction(
+        store.set
+    )
+
+
+def get_persisted_query_hash(
+    extensions: Optional[Mapping[str, Any]],
+) -> Optional[str]:
+    """Return the sha256 hash from the `persistedQuery` request extension."""
+    if not extensions:
+        return None
+
+    persisted_query = extensions.get("persistedQuery")
+
+    if not isinstance(persisted_query, dict):
+        return None
+
+    if persisted_query.get("version", 1) != 1:
+        raise HTTPException(400, "Unsupported persisted query version")
+
+    sha256_hash = persisted_query.get("sha256Hash")
+
+    if not isinstance(sha256_hash, str):
+        raise HTTPException(400, "Persisted query is missing the sha256Hash")
+
+    return sha256_hash
+
+
+def hash_query(query: str) -> str:
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def verify_query_hash(query: str, sha256_hash: str) -> None:
+    if hash_query(query) != sha256_hash:
+        raise HTTPException(400, "Provided sha does not match query")
+
+
+def persisted_query_not_found_error() -> GraphQLError:
+    return GraphQLError(
+        PERSISTED_QUERY_NOT_FOUND,
+        extensions={"code": PERSISTED_QUERY_NOT_FOUND_CODE},
+    )
+
+
+__all__ = [
+    "PersistedQueryStore",
+    "InMemoryPersistedQueryStore",
+    "is_async_persisted_query_store",
+    "get_persisted_query_hash",
+    "hash_query",
+    "verify_query_hash",
+    "persisted_query_not_found_error",
+]
@@ -9,6 +9,7 @@ from typing import (
     Mapping,
     Optional,
     Union,
+    cast,
 )
 
 from graphql import GraphQLError
@@ -22,6 +23,13 @@ from strawberry.http import (
     process_result,
 )
 from strawberry.http.ides import GraphQL_IDE
+from strawberry.http.persisted_queries import (
+    ASYNC_STORE_IN_SYNC_VIEW_MESSAGE,
+    get_persisted_query_hash,
+    is_async_persisted_query_store,
+    persisted_query_not_found_error,
+    verify_query_hash,
+)
 from strawberry.schema import BaseSchema
 from strawberry.schema.exceptions import InvalidOperationTypeError
 from strawberry.types import ExecutionResult
@@ -117,6 +125,11 @@ class SyncBaseHTTPView(
 
         assert self.schema
 
+        if not self.resolve_persisted_query(request_data):
+            return ExecutionResult(
+                data=None, errors=[persisted_query_not_found_error()]
+            )
+
         return self.schema.execute_sync(
             request_data.query,
             root_value=root_value,
@@ -124,8 +137,41 @@ class SyncBaseHTTPView(
             context_value=context,
             operation_name=request_data.operation_name,
             allowed_operation_types=allowed_operation_types,
+            document_id=self.get_document_id(request_data),
         )
 
+    def resolve_persisted_query(self, request_data: GraphQLRequestData) -> bool:
+        """Handle the Automatic Persisted Queries protocol.
+
+        Fills in the query of requests that only send the hash of a known
+        document and stores documents sent along with their hash.
+
+        Returns `False` when the hash is not in the store, so that clients can
+        retry sending the full document.
+        """
+        store = self.persisted_query_store
+
+        if store is None:
+            return True
+
+        sha256_hash = get_persisted_query_hash(request_data.extensions)
+
+        if sha256_hash is None:
+            return True
+
+        if is_async_persisted_query_store(store):
+            raise RuntimeError(ASYNC_STORE_IN_SYNC_VIEW_MESSAGE)
+
+        if request_data.query is None:
+            request_data.query = cast(Optional[str], store.get(sha256_hash))
+
+            return request_data.query is not None
+
+        verify_query_hash(request_data.query, sha256_hash)
+        store.set(sha256_hash, request_data.query)
+
+        return True
+
     def parse_multipart(self, request: SyncHTTPRequestAdapter) -> Dict[str, str]:
         operations = self.parse_json(request.post_data.get("operations", "{}"))
         files_map = self.parse_json(request.post_data.get("map", "{}"))
@@ -156,6 +202,8 @@ class SyncBaseHTTPView(
             query=data.get("query"),
             variables=data.get("variables"),
             operation_name=data.get("operationName"),
+            extensions=data.get("extensions"),
+            document_id=data.get("documentId"),
         )
 
     def _handle_errors(
@@ -4,7 +4,9 @@ from .types import (
     Edge,
     GlobalID,
     GlobalIDValueError,
+    KeysetConnection,
     ListConnection,
+    ListConnectionWithTotalCount,
     Node,
     NodeID,
     NodeType,
@@ -18,7 +20,9 @@ __all__ = [
     "Edge",
     "GlobalID",
     "GlobalIDValueError",
+    "KeysetConnection",
     "ListConnection",
+    "ListConnectionWithTotalCount",
     "Node",
     "NodeExtension",
     "NodeID",
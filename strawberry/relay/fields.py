@@ -46,7 +46,15 @@ from strawberry.types.lazy_type import LazyType
 from strawberry.utils.aio import asyncgen_to_list
 from strawberry.utils.typing import eval_type, is_generic_alias
 
-from .types import Connection, GlobalID, Node, NodeIterableType, NodeType
+from .types import (
+    Connection,
+    GlobalID,
+    Node,
+    NodeIterableType,
+    NodeType,
+    _get_node_loader,
+    _load_node,
+)
 
 if TYPE_CHECKING:
     from typing_extensions import Literal
@@ -91,7 +99,8 @@ class NodeExtension(FieldExtension):
             info: Info,
             id: Annotated[GlobalID, argument(description="The ID of the object.")],
         ) -> Union[Node, None, Awaitable[Union[Node, None]]]:
-            return id.resolve_type(info).resolve_node(
+            return _load_node(
+                id.resolve_type(info),
                 id.node_id,
                 info=info,
                 required=not is_optional,
@@ -112,13 +121,29 @@ class NodeExtension(FieldExtension):
                 List[GlobalID], argument(description="The IDs of the objects.")
             ],
         ) -> Union[List[Node], Awaitable[List[Node]]]:
+            node_types = [gid.resolve_type(info) for gid in ids]
+
+            # Batch the ids with the ones of other fields when all the types can be
+            if all(
+                _get_node_loader(node_t, info) is not None for node_t in set(node_types)
+            ):
+                loaded = [
+                    _load_node(node_t, gid.node_id, info=info, required=not is_optional)
+                    for node_t, gid in zip(node_types, ids)
+                ]
+
+                async def resolve_loaded() -> List[Node]:
+                    # All the ids are already loading, so they are awaited in order
+                    return [await node for node in loaded]  # type: ignore[misc]
+
+                return resolve_loaded()
+
             nodes_map: DefaultDict[Type[Node], List[str]] = defaultdict(list)
             # Store the index of the node in the list of nodes of the same type
             # so that we can return them in the same order while also supporting
             # different types
             index_map: Dict[GlobalID, Tuple[Type[Node], int]] = {}
-            for gid in ids:
-                node_t = gid.resolve_type(info)
+            for node_t, gid in zip(node_types, ids):
                 nodes_map[node_t].append(gid.node_id)
                 index_map[gid] = (node_t, len(nodes_map[node_t]) - 1)
 
@@ -3,7 +3,9 @@ from __future__ import annotations
 import dataclasses
 import inspect
 import itertools
+import json
 import sys
+from collections import deque
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -11,21 +13,29 @@ from typing import (
     AsyncIterator,
     Awaitable,
     ClassVar,
+    Deque,
+    Dict,
     ForwardRef,
     Generic,
     Iterable,
     Iterator,
     List,
     Optional,
+    Protocol,
     Sequence,
+    Sized,
+    Tuple,
     Type,
     TypeVar,
     Union,
     cast,
     overload,
+    runtime_checkable,
 )
 from typing_extensions import Annotated, Literal, Self, TypeAlias, get_args, get_origin
 
+from graphql import print_ast
+
 from strawberry.relay.exceptions import NodeIDAnnotationError
 from strawberry.types.base import (
     StrawberryContainer,
@@ -36,8 +46,14 @@ from strawberry.types.field import field
 from strawberry.types.info import Info  # noqa: TCH001
 from strawberry.types.lazy_type import LazyType
 from strawberry.types.object_type import interface, type
-from strawberry.types.private import StrawberryPrivate
-from strawberry.utils.aio import aenumerate, aislice, resolve_awaitable
+from strawberry.types.private import Private, StrawberryPrivate
+from strawberry.utils.aio import (
+    aenumerate,
+    aislice,
+    asyncgen_to_list,
+    resolve_awaitable,
+)
+from strawberry.utils.await_maybe import await_maybe
 from strawberry.utils.inspect import in_async_context
 from strawberry.utils.typing import eval_type, is_classvar
 
@@ -49,6 +65,7 @@ from .utils import (
 )
 
 if TYPE_CHECKING:
+    from strawberry.dataloader import DataLoader, SyncDataLoader
     from strawberry.scalars import ID
     from strawberry.utils.await_maybe import AwaitableOrValue
 
@@ -63,6 +80,9 @@ NodeIterableType: TypeAlias = Union[
 NodeType = TypeVar("NodeType", bound="Node")
 
 PREFIX = "arrayconnection"
+KEYSET_PREFIX = "keysetconnection"
+
+_SELECTION_KEY_ATTRIBUTE = "_strawberry_selection_key"
 
 
 class GlobalIDValueError(ValueError):
@@ -187,7 +207,8 @@ class GlobalID:
         n_type = self.resolve_type(info)
         node: Node | Awaitable[Node] = cast(
             Awaitable[Node],
-            n_type.resolve_node(
+            _load_node(
+                n_type,
                 self.node_id,
                 info=info,
                 required=required or ensure_type is not None,
@@ -618,6 +639,99 @@ class Node:
         return next(iter(cast(Iterable[Self], retval)))
 
 
+def _get_selection_key(info: Info) -> Tuple[str, ...]:
+    keys = []
+
+    # cached on the field nodes, so it is printed once for each parsed document
+    for field_node in info._raw_info.field_nodes:
+        key = field_node.__dict__.get(_SELECTION_KEY_ATTRIBUTE)
+
+        if key is None:
+            selection_set = field_node.selection_set
+            key = field_node.__dict__[_SELECTION_KEY_ATTRIBUTE] = (
+                "" if selection_set is None else print_ast(selection_set)
+            )
+
+        keys.append(key)
+
+    return tuple(keys)
+
+
+def _get_node_loader(
+    node_type: Type[Node], info: Info
+) -> Optional[Union[DataLoader, SyncDataLoader]]:
+    from strawberry.schema.batch_resolvers import (
+        get_batch_loader,
+        get_batch_loader_class,
+    )
+
+    # types overriding `resolve_node` expect it to be called for each node
+    if (
+        node_type.resolve_node.__func__ is not Node.resolve_node.__func__  # type: ignore[attr-defined]
+        or get_batch_loader_class() is None
+    ):
+        return None
+
+    def load_nodes(node_ids: List[str]) -> AwaitableOrValue[List[Optional[Node]]]:
+        # a missing node only fails its own field, see `_ensure_node`
+        nodes = node_type.resolve_nodes(info=info, node_ids=node_ids, required=False)
+
+        if isinstance(nodes, AsyncIterable):
+            return asyncgen_to_list(nodes)  # type: ignore[arg-type]
+
+        if inspect.isawaitable(nodes):
+            return resolve_awaitable(nodes, list)
+
+        return list(nodes)
+
+    # `resolve_nodes` gets the info of the first field loading a node, so
+    # only the fields selecting the same subfields share a loader
+    return get_batch_loader(
+        ("relay_nodes", node_type, _get_selection_key(info)),
+        load_nodes,
+        is_sync=not (
+            inspect.iscoroutinefunction(node_type.resolve_nodes)
+            or inspect.isasyncgenfunction(node_type.resolve_nodes)
+        ),
+    )
+
+
+async def _ensure_node(
+    node_type: Type[Node], node_id: str, node: Awaitable[Optional[Node]], info: Info
+) -> Node:
+    resolved = await node
+
+    if resolved is None:
+        # resolve it on its own, to raise the error of the type
+        return await await_maybe(
+            node_type.resolve_node(node_id, info=info, required=True)
+        )
+
+    return resolved
+
+
+def _load_node(
+    node_type: Type[Node], node_id: str, *, info: Info, required: bool
+) -> AwaitableOrValue[Optional[Node]]:
+    """Resolve a node, batched with the nodes of its type loaded by the operation.
+
+    The ids of a type loaded while executing the same level of the operation
+    are resolved with a single `resolve_nodes` call. When they can't be
+    batched, `resolve_node` is called with the id.
+    """
+    loader = _get_node_loader(node_type, info)
+
+    if loader is None:
+        return node_type.resolve_node(node_id, info=info, required=required)
+
+    node = loader.load(node_id)
+
+    if required:
+        return _ensure_node(node_type, node_id, node, info)
+
+    return node
+
+
 @type(description="Information to aid in pagination.")
 class PageInfo:
     """Information to aid in pagination.
@@ -738,6 +852,100 @@ class Connection(Generic[NodeType]):
         raise NotImplementedError
 
 
+@runtime_checkable
+class SupportsRelayTail(Protocol):
+    """An iterable of nodes that can efficiently return its last nodes.
+
+    `ListConnection` uses it when `last` is given without `before`, instead of
+    iterating all the nodes.
+    """
+
+    def relay_tail(
+        self, count: int
+    ) -> AwaitableOrValue[Tuple[int, NodeIterableType[Any]]]:
+        """Return the index of the first of the last `count` nodes, and them."""
+        ...
+
+
+def _skip_before_start(
+    first_index: int, tail: List[Any], start: int
+) -> Tuple[int, List[Any]]:
+    # the tail can begin before the `after` cursor
+    if first_index < start:
+        return start, tail[start - first_index :]
+
+    return first_index, tail
+
+
+def _resolve_sized_tail(
+    nodes: Any, start: int, count: int
+) -> Optional[Tuple[int, Iterable[Any]]]:
+    if not isinstance(nodes, Sized) or not hasattr(nodes, "__getitem__"):
+        return None
+
+    first_index = max(start, len(nodes) - count)
+
+    try:
+        return first_index, nodes[first_index:]  # type: ignore[index]
+    except TypeError:
+        return None
+
+
+def _resolve_tail(
+    nodes: NodeIterableType[Any], start: int, count: int
+) -> Tuple[int, List[Any]]:
+    """Return the index of the first of the last `count` nodes, and them."""
+    if isinstance(nodes, SupportsRelayTail):
+        first_index, tail = cast(Tuple[int, Iterable[Any]], nodes.relay_tail(count))
+        return _skip_before_start(first_index, list(tail), start)
+
+    sized_tail = _resolve_sized_tail(nodes, start, count)
+    if sized_tail is not None:
+        return sized_tail[0], list(sized_tail[1])
+
+    # keep only the last nodes while iterating
+    tail = deque(
+        enumerate(itertools.islice(cast(Iterable[Any], nodes), start, None), start),
+        maxlen=count,
+    )
+    return (tail[0][0] if tail else start), [v for _, v in tail]
+
+
+async def _aresolve_tail(
+    nodes: NodeIterableType[Any], start: int, count: int
+) -> Tuple[int, List[Any]]:
+    """Async version of `_resolve_tail`."""
+    if isinstance(nodes, SupportsRelayTail):
+        first_index, tail = await await_maybe(nodes.relay_tail(count))
+
+        if isinstance(tail, (AsyncIterator, AsyncIterable)):
+            tail = [v async for v in tail]
+
+        return _skip_before_start(first_index, list(tail), start)
+
+    # `len` could do a sync query here (e.g. django querysets), so only the
+    # last nodes are kept while iterating
+    window: Deque[Tuple[int, Any]] = deque(maxlen=count)
+    async for i, v in aenumerate(cast(AsyncIterable[Any], nodes)):
+        if i >= start:
+            window.append((i, v))
+
+    return (window[0][0] if window else start), [v for _, v in window]
+
+
+def _get_edge_class(connection: Type[Connection[NodeType]]) -> Type[Edge[NodeType]]:
+    type_def = get_object_definition(connection)
+    assert type_def
+    field_def = type_def.get_field("edges")
+    assert field_def
+
+    field = field_def.resolve_type(type_definition=type_def)
+    while isinstance(field, StrawberryContainer):
+        field = field.of_type
+
+    return cast(Type[Edge[NodeType]], field)
+
+
 @type(name="Connection", description="A connection to a list of items.")
 class ListConnection(Connection[NodeType]):
     """A connection to a list of items.
@@ -794,20 +1002,32 @@ class ListConnection(Connection[NodeType]):
             last=last,
         )
 
-        type_def = get_object_definition(cls)
-        assert type_def
-        field_def = type_def.get_field("edges")
-        assert field_def
-
-        field = field_def.resolve_type(type_definition=type_def)
-        while isinstance(field, StrawberryContainer):
-            field = field.of_type
-
-        edge_class = cast(Edge[NodeType], field)
+        edge_class = _get_edge_class(cls)
 
         if isinstance(nodes, (AsyncIterator, AsyncIterable)) and in_async_context():
 
             async def resolver() -> Self:
+                if not should_resolve_list_connection_edges(info):
+                    return cls._resolve_tail_connection(
+                        edge_class, [], first_index=0, start=0, info=info
+                    )
+
+                if slice_metadata.end == sys.maxsize:
+                    # Last was asked without before, only the last nodes are
+                    # needed
+                    assert last is not None
+                    first_index, tail = await _aresolve_tail(
+                        nodes, slice_metadata.start, last
+                    )
+                    return cls._resolve_tail_connection(
+                        edge_class,
+                        tail,
+                        first_index=first_index,
+                        start=slice_metadata.start,
+                        info=info,
+                        **kwargs,
+                    )
+
                 try:
                     iterator = cast(
                         Union[AsyncIterator[NodeType], AsyncIterable[NodeType]],
@@ -851,13 +1071,6 @@ class ListConnection(Connection[NodeType]):
                     # Remove the overfetched result
                     edges = edges[:-1]
                     has_next_page = True
-                elif slice_metadata.end == sys.maxsize:
-                    # Last was asked without any after/before
-                    assert last is not None
-                    original_len = len(edges)
-                    edges = edges[-last:]
-                    has_next_page = False
-                    has_previous_page = len(edges) != original_len
                 else:
                     has_next_page = False
 
@@ -873,6 +1086,24 @@ class ListConnection(Connection[NodeType]):
 
             return resolver()
 
+        if not should_resolve_list_connection_edges(info):
+            return cls._resolve_tail_connection(
+                edge_class, [], first_index=0, start=0, info=info
+            )
+
+        if slice_metadata.end == sys.maxsize:
+            # Last was asked without before, only the last nodes are needed
+            assert last is not None
+            first_index, tail = _resolve_tail(nodes, slice_metadata.start, last)
+            return cls._resolve_tail_connection(
+                edge_class,
+                tail,
+                first_index=first_index,
+                start=slice_metadata.start,
+                info=info,
+                **kwargs,
+            )
+
         try:
             iterator = cast(
                 Union[Iterator[NodeType], Iterable[NodeType]],
@@ -886,17 +1117,6 @@ class ListConnection(Connection[NodeType]):
                 slice_metadata.overfetch,
             )
 
-        if not should_resolve_list_connection_edges(info):
-            return cls(
-                edges=[],
-                page_info=PageInfo(
-                    start_cursor=None,
-                    end_cursor=None,
-                    has_previous_page=False,
-                    has_next_page=False,
-                ),
-            )
-
         edges = [
             edge_class.resolve_edge(
                 cls.resolve_node(v, info=info, **kwargs),
@@ -913,13 +1133,6 @@ class ListConnection(Connection[NodeType]):
             # Remove the overfetched result
             edges = edges[:-1]
             has_next_page = True
-        elif slice_metadata.end == sys.maxsize:
-            # Last was asked without any after/before
-            assert last is not None
-            original_len = len(edges)
-            edges = edges[-last:]
-            has_next_page = False
-            has_previous_page = len(edges) != original_len
         else:
             has_next_page = False
 
@@ -933,6 +1146,375 @@ class ListConnection(Connection[NodeType]):
             ),
         )
 
+    @classmethod
+    def _resolve_tail_connection(
+        cls,
+        edge_class: Type[Edge[NodeType]],
+        tail: Iterable[Any],
+        *,
+        first_index: int,
+        start: int,
+        info: Info,
+        **kwargs: Any,
+    ) -> Self:
+        edges = [
+            edge_class.resolve_edge(
+                cls.resolve_node(v, info=info, **kwargs),
+                cursor=first_index + i,
+            )
+            for i, v in enumerate(tail)
+        ]
+
+        return cls(
+            edges=edges,
+            page_info=PageInfo(
+                start_cursor=edges[0].cursor if edges else None,
+                end_cursor=edges[-1].cursor if edges else None,
+                has_previous_page=first_index > start,
+                has_next_page=False,
+            ),
+        )
+
+
+@type(
+    name="CountableConnection",
+    description="A connection to a list of items, with their total count.",
+)
+class ListConnectionWithTotalCount(ListConnection[NodeType]):
+    """A `ListConnection` with the total number of nodes.
+
+    The total is only computed when `totalCount` is requested, by calling
+    `resolve_total_count` with the nodes that were paginated.
+
+    Attributes:
+        page_info:
+            Pagination data for this connection
+        edges:
+            Contains the nodes in this connection
+        total_count:
+            Total quantity of existing nodes
+
+    """
+
+    nodes: Private[Any] = None
+
+    @field(description="Total quantity of existing nodes.")
+    def total_count(self, info: Info) -> Optional[int]:
+        return self.__class__.resolve_total_count(self.nodes, info=info)  # type: ignore[return-value]
+
+    @classmethod
+    def resolve_total_count(
+        cls, nodes: NodeIterableType[Any], *, info: Info
+    ) -> AwaitableOrValue[Optional[int]]:
+        """Count the nodes returned by the resolver of the connection field.
+
+        By default, sequences are counted with `len`, and objects with a
+        `count` method, such as django querysets, by calling it. Other
+        iterables can't be counted without iterating them again, so `None` is
+        returned for them. Subclasses can override this to count the nodes
+        differently, for example with a query.
+
+        Args:
+            nodes: The nodes returned by the resolver of the connection field.
+            info: The strawberry execution info of the connection field.
+        """
+        if isinstance(nodes, Sequence):
+            return len(nodes)
+
+        count = getattr(nodes, "count", None)
+        if callable(count):
+            return count()
+
+        if isinstance(nodes, Sized):
+            return len(nodes)
+
+        return None
+
+    @classmethod
+    def resolve_connection(
+        cls,
+        nodes: NodeIterableType[NodeType],
+        *,
+        info: Info,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+        first: Optional[int] = None,
+        last: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AwaitableOrValue[Self]:
+        def with_nodes(connection: Self) -> Self:
+            connection.nodes = nodes
+            return connection
+
+        connection = super().resolve_connection(
+            nodes,
+            info=info,
+            before=before,
+            after=after,
+            first=first,
+            last=last,
+            **kwargs,
+        )
+
+        if inspect.isawaitable(connection):
+            return resolve_awaitable(connection, with_nodes)
+
+        return with_nodes(connection)
+
+
+@type(
+    name="KeysetConnection",
+    description="A connection to a list of items, paginated by their sort key.",
+)
+class KeysetConnection(Connection[NodeType]):
+    """A connection to a list of items, paginated by their sort key.
+
+    Instead of the position of the node in the list, the cursor of each edge
+    encodes the sort key of its node, returned by `resolve_cursor_key`. This
+    allows `resolve_keyset` to only fetch the requested page, for example with
+    `WHERE (k1, k2) > (...) ORDER BY k1, k2 LIMIT n` in SQL, which doesn't get
+    slower as the pages get deeper, unlike an `OFFSET`.
+
+    The default `resolve_keyset` filters the nodes in Python, expecting them
+    to be sorted by ascending key, and should be overridden to push the
+    filtering to the data source.
+
+    Attributes:
+        page_info:
+            Pagination data for this connection
+        edges:
+            Contains the nodes in this connection
+
+    """
+
+    page_info: PageInfo = field(description="Pagination data for this connection")
+    edges: List[Edge[NodeType]] = field(
+        description="Contains the nodes in this connection"
+    )
+
+    @classmethod
+    def resolve_cursor_key(cls, node: Any, *, info: Info, **kwargs: Any) -> Tuple:
+        """Return the sort key of the node, encoded in the cursor of its edge.
+
+        Subclasses must define this method. By default, the cursor is JSON
+        encoded, so the key should only contain values supported by JSON,
+        see `encode_cursor` to customize this.
+
+        Args:
+            node: A node returned by `resolve_keyset`.
+            info: The strawberry execution info of the connection field.
+            **kwargs: Additional arguments passed to the resolver.
+        """
+        raise NotImplementedError
+
+    @classmethod
+    def encode_cursor(cls, key: Tuple) -> str:
+        return to_base64(KEYSET_PREFIX, json.dumps(list(key), separators=(",", ":")))
+
+    @classmethod
+    def decode_cursor(cls, cursor: str) -> Tuple:
+        prefix, value = from_base64(cursor)
+        if prefix != KEYSET_PREFIX:
+            raise ValueError("Invalid cursor")
+
+        key = json.loads(value)
+        if not isinstance(key, list):
+            raise ValueError("Invalid cursor")
+
+        return tuple(key)
+
+    @classmethod
+    def resolve_keyset(
+        cls,
+        nodes: NodeIterableType[Any],
+        *,
+        info: Info,
+        after: Optional[Tuple] = None,
+        before: Optional[Tuple] = None,
+        limit: int,
+        reverse: bool = False,
+        **kwargs: Any,
+    ) -> AwaitableOrValue[NodeIterableType[Any]]:
+        """Return the nodes of the page.
+
+        Args:
+            nodes: The nodes returned by the resolver of the connection field.
+            info: The strawberry execution info of the connection field.
+            after: When given, only nodes with a greater key are returned.
+            before: When given, only nodes with a smaller key are returned.
+            limit: The maximum number of nodes to return.
+            reverse: Whether to return the nodes with the greatest keys first,
+                when paginating backwards.
+            **kwargs: Additional arguments passed to the resolver.
+
+        Returns:
+            An iterable (or async iterable) of up to `limit` nodes, with the
+            smallest keys first, or the greatest keys first when `reverse` is
+            set.
+        """
+
+        def in_page(node: Any) -> bool:
+            key = tuple(cls.resolve_cursor_key(node, info=info, **kwargs))
+
+            return (after is None or key > after) and (before is None or key < before)
+
+        if isinstance(nodes, (AsyncIterator, AsyncIterable)):
+
+            async def resolve_page() -> List[Any]:
+                page: Deque[Any] = deque(maxlen=limit if reverse else None)
+
+                async for node in nodes:  # type: ignore[union-attr]
+                    if in_page(node):
+                        page.append(node)
+
+                        if not reverse and len(page) == limit:
+                            break
+
+                return list(reversed(page)) if reverse else list(page)
+
+            return resolve_page()
+
+        page = filter(in_page, cast(Iterable[Any], nodes))
+
+        if reverse:
+            # only the last nodes are needed
+            return list(reversed(deque(page, maxlen=limit)))
+
+        return list(itertools.islice(page, limit))
+
+    @classmethod
+    def resolve_connection(
+        cls,
+        nodes: NodeIterableType[NodeType],
+        *,
+        info: Info,
+        before: Optional[str] = None,
+        after: Optional[str] = None,
+        first: Optional[int] = None,
+        last: Optional[int] = None,
+        **kwargs: Any,
+    ) -> AwaitableOrValue[Self]:
+        """Resolve a connection from the nodes returned by `resolve_keyset`.
+
+        Args:
+            nodes: The nodes returned by the resolver of the connection field.
+            info: The strawberry execution info of the connection field.
+            before: Only returns the nodes with a key smaller than the one
+                encoded in this cursor.
+            after: Only returns the nodes with a key greater than the one
+                encoded in this cursor.
+            first: Returns the first n nodes of the page.
+            last: Returns the last n nodes of the page.
+            kwargs: Additional arguments passed to the resolver.
+
+        Returns:
+            The resolved `Connection`
+        """
+        max_results = info.schema.config.relay_max_results
+
+        for name, value in (("first", first), ("last", last)):
+            if value is None:
+                continue
+
+            if value < 0:
+                raise ValueError(f"Argument '{name}' must be a non-negative integer.")
+
+            if value > max_results:
+                raise ValueError(
+                    f"Argument '{name}' cannot be higher than {max_results}."
+                )
+
+        keys: Dict[str, Optional[Tuple]] = {"after": None, "before": None}
+        for name, cursor in (("after", after), ("before", before)):
+            if cursor:
+                try:
+                    keys[name] = cls.decode_cursor(cursor)
+                except ValueError as e:
+                    raise TypeError(
+                        f"Argument '{name}' contains a non-existing value."
+                    ) from e
+
+        if not should_resolve_list_connection_edges(info):
+            return cls(
+                edges=[],
+                page_info=PageInfo(
+                    start_cursor=None,
+                    end_cursor=None,
+                    has_previous_page=False,
+                    has_next_page=False,
+                ),
+            )
+
+        # paginate backwards only when `last` is the only limit, otherwise take
+        # the last nodes of the first page
+        reverse = last is not None and first is None
+        expected = (
+            cast(int, last) if reverse else max_results if first is None else first
+        )
+
+        # Overfetch by 1 to check if there are more nodes
+        page = cls.resolve_keyset(
+            nodes,
+            info=info,
+            after=keys["after"],
+            before=keys["before"],
+            limit=expected + 1,
+            reverse=reverse,
+            **kwargs,
+        )
+
+        edge_class = _get_edge_class(cls)
+
+        def build(page_nodes: List[Any]) -> Self:
+            has_more = len(page_nodes) > expected
+            page_nodes = page_nodes[:expected]
+
+            if reverse:
+                page_nodes.reverse()
+                has_previous_page, has_next_page = has_more, before is not None
+            else:
+                has_previous_page, has_next_page = after is not None, has_more
+
+                if last is not None and len(page_nodes) > last:
+                    page_nodes = page_nodes[len(page_nodes) - last :]
+                    has_previous_page = True
+
+            edges = [
+                edge_class(
+                    cursor=cls.encode_cursor(
+                        tuple(cls.resolve_cursor_key(node, info=info, **kwargs))
+                    ),
+                    node=cls.resolve_node(node, info=info, **kwargs),
+                )
+                for node in page_nodes
+            ]
+
+            return cls(
+                edges=edges,
+                page_info=PageInfo(
+                    start_cursor=edges[0].cursor if edges else None,
+                    end_cursor=edges[-1].cursor if edges else None,
+                    has_previous_page=has_previous_page,
+                    has_next_page=has_next_page,
+                ),
+            )
+
+        if inspect.isawaitable(page) or isinstance(
+            page, (AsyncIterator, AsyncIterable)
+        ):
+
+            async def resolver() -> Self:
+                resolved = await page if inspect.isawaitable(page) else page
+
+                if isinstance(resolved, (AsyncIterator, AsyncIterable)):
+                    return build([node async for node in resolved])
+
+                return build(list(cast(Iterable[Any], resolved)))
+
+            return resolver()
+
+        return build(list(cast(Iterable[Any], page)))
+
 
 __all__ = [
     "GlobalID",
@@ -948,4 +1530,8 @@ __all__ = [
     "Edge",
     "PageInfo",
     "ListConnection",
+    "ListConnectionWithTotalCount",
+    "SupportsRelayTail",
+    "KeysetConnection",
+    "KEYSET_PREFIX",
 ]
@@ -3,13 +3,16 @@ from __future__ import annotations
 import base64
 import dataclasses
 import sys
-from typing import TYPE_CHECKING, Any, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, Optional, Set, Tuple, Union
 from typing_extensions import Self, assert_never
 
+from graphql import FieldNode, FragmentSpreadNode, InlineFragmentNode
+
 from strawberry.types.base import StrawberryObjectDefinition
-from strawberry.types.nodes import InlineFragment, Selection
 
 if TYPE_CHECKING:
+    from graphql import FragmentDefinitionNode, SelectionSetNode
+
     from strawberry.types.info import Info
 
 
@@ -71,6 +74,84 @@ def to_base64(type_: Union[str, type, StrawberryObjectDefinition], node_id: Any)
     return base64.b64encode(f"{type_name}:{node_id}".encode()).decode()
 
 
+_CONNECTION_SELECTION_ATTRIBUTE = "_strawberry_connection_selection"
+
+
+@dataclasses.dataclass(frozen=True)
+class ConnectionSelection:
+    """The fields requested on a connection.
+
+    Attributes:
+        edges:
+            Whether `edges` was requested
+        page_info:
+            Whether `pageInfo` was requested
+        total_count:
+            Whether `totalCount` was requested
+    """
+
+    edges: bool
+    page_info: bool
+    total_count: bool
+
+
+def _collect_field_names(
+    selection_set: Optional[SelectionSetNode],
+    fragments: Dict[str, FragmentDefinitionNode],
+    names: Set[str],
+) -> None:
+    if selection_set is None:
+        return
+
+    for selection in selection_set.selections:
+        if isinstance(selection, FieldNode):
+            names.add(selection.name.value)
+        elif isinstance(selection, InlineFragmentNode):
+            _collect_field_names(selection.selection_set, fragments, names)
+        elif isinstance(selection, FragmentSpreadNode):
+            fragment = fragments.get(selection.name.value)
+            if fragment is not None:
+                _collect_field_names(fragment.selection_set, fragments, names)
+
+
+def get_connection_selection(info: Info) -> ConnectionSelection:
+    """Get the fields requested on the connection being resolved.
+
+    The result is cached on the field nodes of the operation, so that it is
+    only computed once for each field of a parsed document.
+
+    Args:
+        info:
+            The strawberry execution info of the connection field
+
+    Returns:
+        The `ConnectionSelection` of the current field.
+    """
+    field_nodes = info._raw_info.field_nodes
+    cache: Dict[Tuple[int, ...], ConnectionSelection] = field_nodes[
+        0
+    ].__dict__.setdefault(_CONNECTION_SELECTION_ATTRIBUTE, {})
+    # the same field node can be merged with different ones, when it's part
+    # of a fragment
+    key = tuple(id(field_node) for field_node in field_nodes)
+
+    selection = cache.get(key)
+    if selection is None:
+        names: Set[str] = set()
+        for field_node in field_nodes:
+            _collect_field_names(
+                field_node.selection_set, info._raw_info.fragments, names
+            )
+
+        selection = cache[key] = ConnectionSelection(
+            edges="edges" in names,
+            page_info=not names.isdisjoint(("pageInfo", "page_info")),
+            total_count=not names.isdisjoint(("totalCount", "total_count")),
+        )
+
+    return selection
+
+
 def should_resolve_list_connection_edges(info: Info) -> bool:
     """Check if the user requested to resolve the `edges` field of a connection.
 
@@ -82,33 +163,8 @@ def should_resolve_list_connection_edges(info: Info) -> bool:
         True if the user requested to resolve the `edges` field of a connection, False otherwise.
 
     """
-    resolve_for_field_names = {"edges", "pageInfo"}
-
-    def _check_selection(selection: Selection) -> bool:
-        """Recursively inspect the selection to check if the user requested to resolve the `edges` field.
-
-        Args:
-            selection (Selection): The selection to check.
-
-        Returns:
-            bool: True if the user requested to resolve the `edges` field of a connection, False otherwise.
-        """
-        if (
-            not isinstance(selection, InlineFragment)
-            and selection.name in resolve_for_field_names
-        ):
-            return True
-        if selection.selections:
-            return any(
-                _check_selection(selection) for selection in selection.selections
-            )
-        return False
-
-    for selection_field in info.selected_fields:
-        for selection in selection_field.selections:
-            if _check_selection(selection):
-                return True
-    return False
+    selection = get_connection_selection(info)
+    return selection.edges or selection.page_info
 
 
 @dataclasses.dataclass
@@ -193,6 +249,8 @@ class SliceMetadata:
 __all__ = [
     "from_base64",
     "to_base64",
+    "ConnectionSelection",
+    "get_connection_selection",
     "should_resolve_list_connection_edges",
     "SliceMetadata",
 ]
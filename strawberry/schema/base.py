@@ -43,6 +43,7 @@ class BaseSchema(Protocol):
         root_value: Optional[Any] = None,
         operation_name: Optional[str] = None,
         allowed_operation_types: Optional[Iterable[OperationType]] = None,
+        document_id: Optional[str] = None,
     ) -> Union[ExecutionResult, SubscriptionExecutionResult]:
         raise NotImplementedError
 
@@ -55,6 +56,7 @@ class BaseSchema(Protocol):
         root_value: Optional[Any] = None,
         operation_name: Optional[str] = None,
         allowed_operation_types: Optional[Iterable[OperationType]] = None,
+        document_id: Optional[str] = None,
     ) -> ExecutionResult:
         raise NotImplementedError
 
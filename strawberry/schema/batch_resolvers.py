@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+)
+
+from strawberry.dataloader import DataLoader, SyncDataLoader
+from strawberry.exceptions import WrongNumberOfResultsReturned
+from strawberry.utils.aio import resolve_awaitable
+from strawberry.utils.await_maybe import await_maybe
+
+if TYPE_CHECKING:
+    from graphql import GraphQLResolveInfo
+
+    from strawberry.types.info import Info
+
+LoaderClass = Union[Type[DataLoader], Type[SyncDataLoader]]
+
+# Called with the list of parents, the info of the first one and the arguments
+BatchResolver = Callable[[List[Any], "Info", Dict[str, Any]], Any]
+
+
+class _BatchScope:
+    __slots__ = ("loader_class", "loaders")
+
+    def __init__(self, loader_class: Optional[LoaderClass]) -> None:
+        self.loader_class = loader_class
+        self.loaders: Dict[Hashable, Union[DataLoader, SyncDataLoader]] = {}
+
+
+_batch_scope: ContextVar[Optional[_BatchScope]] = ContextVar(
+    "_batch_scope", default=None
+)
+
+
+@contextmanager
+def batch_resolver_scope(loader_class: Optional[LoaderClass]) -> Iterator[None]:
+    """Group the loads made inside the block, see `get_batch_loader`.
+
+    The loads are collected with a `DataLoader`, for async execution, or a
+    `SyncDataLoader`, for `SyncBatchingExecutionContext`. When `loader_class`
+    is `None`, nothing can wait for the other loads, and they aren't batched.
+    """
+    token = _batch_scope.set(_BatchScope(loader_class))
+
+    try:
+        yield
+    finally:
+        _batch_scope.reset(token)
+
+
+def get_batch_loader_class() -> Optional[LoaderClass]:
+    """Get the class of the loaders of the operation, `None` when not batching."""
+    scope = _batch_scope.get()
+
+    return None if scope is None else scope.loader_class
+
+
+def get_batch_loader(
+    key: Hashable,
+    load_fn: Callable[[List[Any]], Any],
+    *,
+    is_sync: bool = True,
+) -> Optional[Union[DataLoader, SyncDataLoader]]:
+    """Get the loader of `key` for the operation being executed.
+
+    The loader is created with `load_fn` the first time, which can return an
+    awaitable when the execution is async. Loaders don't cache their values,
+    as what they load could change during the operation.
+
+    Args:
+        key: Identifies the loader in the operation.
+        load_fn: Called with the list of keys, returns a list with the value
+            (or exception) for each of them.
+        is_sync: Whether `load_fn` can return its results without an awaitable,
+            which is required for sync execution.
+
+    Returns:
+        The loader, or `None` when loads can't be batched.
+    """
+    scope = _batch_scope.get()
+
+    if scope is None or scope.loader_class is None:
+        return None
+
+    loader = scope.loaders.get(key)
+
+    if loader is None:
+        if scope.loader_class is SyncDataLoader:
+            if not is_sync:
+                return None
+
+            loader = SyncDataLoader(load_fn=load_fn, cache=False)
+        else:
+
+            async def load(keys: List[Any]) -> List[Any]:
+                return await await_maybe(load_fn(keys))
+
+            loader = DataLoader(load_fn=load, cache=False)
+
+        scope.loaders[key] = loader
+
+    return loader
+
+
+def _check_results(parents: List[Any], results: Any) -> List[Any]:
+    results = list(results)
+
+    if len(results) != len(parents):
+        raise WrongNumberOfResultsReturned(expected=len(parents), received=len(results))
+
+    return results
+
+
+def _get_single_result(parents: List[Any], results: Any) -> Any:
+    [result] = _check_results(parents, results)
+
+    if isinstance(result, BaseException):
+        raise result
+
+    return result
+
+
+def create_batch_resolver(
+    resolve_batch: BatchResolver, get_info: Callable[[GraphQLResolveInfo], Info]
+) -> Callable[..., Any]:
+    """Create the resolver of a batch field, called once for each parent.
+
+    Inside `batch_resolver_scope`, the parents at the same level of the
+    response are collected with `get_batch_loader`, and `resolve_batch` is
+    called once with all of them, using the info and arguments of the first
+    parent. When parents can't be collected, `resolve_batch` is called with a
+    single parent.
+    """
+
+    def _batch_resolver(_source: Any, info: GraphQLResolveInfo, **kwargs: Any) -> Any:
+        # the arguments, and the path without the list indices, are the same
+        # for all the parents of a level
+        key = (
+            _batch_resolver,
+            info.parent_type.name,
+            tuple(key for key in info.path.as_list() if isinstance(key, str)),
+        )
+
+        def load(parents: List[Any]) -> Any:
+            results = resolve_batch(parents, get_info(info), kwargs)
+
+            if inspect.isawaitable(results):
+                return resolve_awaitable(
+                    results, lambda resolved: _check_results(parents, resolved)
+                )
+
+            return _check_results(parents, results)
+
+        loader = get_batch_loader(key, load)
+
+        if loader is not None:
+            return loader.load(_source)
+
+        parents = [_source]
+        results = resolve_batch(parents, get_info(info), kwargs)
+
+        if inspect.isawaitable(results):
+
+            async def await_result() -> Any:
+                return _get_single_result(parents, await results)
+
+            return await_result()
+
+        return _get_single_result(parents, results)
+
+    _batch_resolver._is_default = False  # type: ignore
+
+    return _batch_resolver
+
+
+__all__ = [
+    "batch_resolver_scope",
+    "create_batch_resolver",
+    "get_batch_loader",
+    "get_batch_loader_class",
+    "BatchResolver",
+]
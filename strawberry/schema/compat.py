@@ -1,8 +1,11 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Dict, Union
+from typing import TYPE_CHECKING, Dict, Tuple, Union
+
+import graphql
 
 from strawberry.scalars import is_scalar as is_strawberry_scalar
+from strawberry.schema.exceptions import UnsupportedGraphQLCoreVersionError
 from strawberry.types.base import StrawberryType, has_object_definition
 
 # TypeGuard is only available in typing_extensions => 3.10, we don't want
@@ -53,7 +56,24 @@ def is_graphql_generic(type_: Union[StrawberryType, type]) -> bool:
     return False
 
 
+def check_graphql_core_version(
+    feature: str, supported_version: Tuple[int, int] = (3, 2)
+) -> None:
+    """Fail when the installed graphql-core isn't the one `feature` supports.
+
+    Used by the execution contexts overriding graphql-core internals, whose
+    signatures and behaviour change between minor versions.
+    """
+    version = graphql.version_info
+
+    if (version.major, version.minor) != supported_version:
+        raise UnsupportedGraphQLCoreVersionError(
+            feature, ".".join(map(str, supported_version)), str(version)
+        )
+
+
 __all__ = [
+    "check_graphql_core_version",
     "is_input_type",
     "is_interface_type",
     "is_scalar",
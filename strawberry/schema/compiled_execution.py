@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import contextlib
+from enum import Enum
+from math import isfinite
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from graphql import (
+    GraphQLBoolean,
+    GraphQLError,
+    GraphQLFloat,
+    GraphQLID,
+    GraphQLInt,
+    GraphQLNonNull,
+    GraphQLString,
+    Undefined,
+    Visitor,
+    located_error,
+    visit,
+)
+from graphql.execution import ExecutionContext
+from graphql.execution.execute import get_field_def
+from graphql.execution.values import get_argument_values
+from graphql.language import DirectiveNode, VariableNode
+from graphql.type.scalars import GRAPHQL_MAX_INT, GRAPHQL_MIN_INT
+
+from .compat import check_graphql_core_version
+from .schema_converter import CustomGraphQLEnumType
+
+if TYPE_CHECKING:
+    from graphql import (
+        GraphQLField,
+        GraphQLLeafType,
+        GraphQLList,
+        GraphQLObjectType,
+        GraphQLOutputType,
+        GraphQLResolveInfo,
+    )
+    from graphql.language import FieldNode, FragmentDefinitionNode
+    from graphql.language.ast import OperationDefinitionNode
+    from graphql.pyutils import AwaitableOrValue, Path
+
+
+_PLANS_ATTRIBUTE = "_strawberry_execution_plans"
+
+FieldKey = Tuple[Any, ...]
+
+
+def _is_int(value: Any) -> bool:
+    return type(value) is int and GRAPHQL_MIN_INT <= value <= GRAPHQL_MAX_INT
+
+
+def _is_float(value: Any) -> bool:
+    return type(value) is float and isfinite(value)
+
+
+def _is_str(value: Any) -> bool:
+    return type(value) is str
+
+
+def _is_bool(value: Any) -> bool:
+    return type(value) is bool
+
+
+# Values passing these checks are already serialized, so calling the scalar's
+# `serialize` function on them would return them unchanged
+_SERIALIZED_CHECKS: Dict[GraphQLLeafType, Callable[[Any], bool]] = {
+    GraphQLString: _is_str,
+    GraphQLID: _is_str,
+    GraphQLInt: _is_int,
+    GraphQLFloat: _is_float,
+    GraphQLBoolean: _is_bool,
+}
+
+
+class _DirectiveVariablesVisitor(Visitor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.names: Set[str] = set()
+
+    def enter_directive(self, node: DirectiveNode, *_: Any) -> None:
+        if node.name.value not in ("skip", "include"):
+            return
+
+        for argument in node.arguments:
+            if isinstance(argument.value, VariableNode):
+                self.names.add(argument.value.name.value)
+
+
+class ExecutionPlan:
+    """What can be computed once per operation, instead of once per field."""
+
+    __slots__ = ("fields", "subfields")
+
+    def __init__(self) -> None:
+        self.subfields: Dict[Tuple, Dict[str, List[FieldNode]]] = {}
+        # field definition and, when they only use literals, argument values
+        self.fields: Dict[FieldKey, Tuple[GraphQLField, Optional[Dict[str, Any]]]] = {}
+
+
+class _OperationPlans:
+    __slots__ = ("directive_variables", "plans")
+
+    def __init__(
+        self,
+        operation: OperationDefinitionNode,
+        fragments: Dict[str, FragmentDefinitionNode],
+    ) -> None:
+        visitor = _DirectiveVariablesVisitor()
+        for node in (operation, *fragments.values()):
+            visit(node, visitor)
+
+        self.directive_variables = tuple(sorted(visitor.names))
+        self.plans: Dict[Tuple[Any, ...], ExecutionPlan] = {}
+
+    def get(self, variable_values: Dict[str, Any]) -> ExecutionPlan:
+        # @skip and @include are the only way variables change which fields get
+        # collected, so one plan is kept for each combination of their values
+        key = tuple(variable_values.get(name) for name in self.directive_variables)
+
+        plan = self.plans.get(key)
+        if plan is None:
+            plan = self.plans.setdefault(key, ExecutionPlan())
+
+        return plan
+
+
+def _has_only_literal_arguments(field_node: FieldNode) -> bool:
+    # nested variables can only appear in lists and input objects, which are
+    # not shared anyway, see `_is_immutable`
+    return not any(
+        isinstance(argument.value, VariableNode) for argument in field_node.arguments
+    )
+
+
+def _is_immutable(value: Any) -> bool:
+    return value is None or isinstance(value, (str, int, float, bool, Enum))
+
+
+class CompiledExecutionContext(ExecutionContext):
+    """An execution context that reuses its work across requests.
+
+    The first time an operation runs, the field collection for each selection
+    set (including the evaluation of `@skip` and `@include`), the field
+    definition lookups and the coercion of literal arguments are stored in an
+    execution plan attached to the parsed operation. The following requests
+    for the same document reuse the plan.
+
+    Leaf values that are already serialized, such as a `str` returned for a
+    `String` field, are returned as they are, and lists of them are copied in
+    one go instead of being completed item by item. Enum members, and lists of
+    them, are serialized with a single lookup.
+
+    As plans are attached to the parsed document, this is most useful when
+    documents are reused between requests, using an `OperationCache` or
+    trusted documents.
+
+    It overrides internals of graphql-core's `ExecutionContext` which change
+    between its minor versions, so it only supports graphql-core 3.2, and
+    raises `UnsupportedGraphQLCoreVersionError` with other versions.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.schema.compiled_execution import CompiledExecutionContext
+    from strawberry.schema.operation_cache import OperationCache
+
+    schema = strawberry.Schema(
+        Query,
+        operation_cache=OperationCache(),
+        execution_context_class=CompiledExecutionContext,
+    )
+    ```
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        check_graphql_core_version(type(self).__name__)
+
+        super().__init__(*args, **kwargs)
+
+        self.plan = self._get_plan()
+        self._subfields_cache = self.plan.subfields
+
+    def _get_plan(self) -> ExecutionPlan:
+        operation_plans = getattr(self.operation, _PLANS_ATTRIBUTE, None)
+
+        if operation_plans is None:
+            operation_plans = _OperationPlans(self.operation, self.fragments)
+            setattr(self.operation, _PLANS_ATTRIBUTE, operation_plans)
+
+        return operation_plans.get(self.variable_values)
+
+    def _get_field(
+        self, parent_type: GraphQLObjectType, field_node: FieldNode
+    ) -> Tuple[Optional[GraphQLField], Optional[Dict[str, Any]]]:
+        key = (parent_type, id(field_node))
+        cached = self.plan.fields.get(key)
+
+        if cached is not None:
+            return cached
+
+        field_def = get_field_def(self.schema, parent_type, field_node)
+        if not field_def:
+            return None, None
+
+        arguments = None
+        if _has_only_literal_arguments(field_node):
+            try:
+                arguments = get_argument_values(field_def, field_node)
+            except GraphQLError:
+                # let `execute_field` report the error
+                pass
+            else:
+                # mutable values could be changed by resolvers, so they can't
+                # be shared
+                if not all(_is_immutable(value) for value in arguments.values()):
+                    arguments = None
+
+        self.plan.fields[key] = field_def, arguments
+
+        return field_def, arguments
+
+    def execute_field(
+        self,
+        parent_type: GraphQLObjectType,
+        source: Any,
+        field_nodes: List[FieldNode],
+        path: Path,
+    ) -> AwaitableOrValue[Any]:
+        # Same as graphql-core's `execute_field`, but using the execution plan
+        # to get the field definition and the arguments
+        field_def, cached_arguments = self._get_field(parent_type, field_nodes[0])
+        if not field_def:
+            return Undefined
+
+        return_type = field_def.type
+        resolve_fn = field_def.resolve or self.field_resolver
+
+        if self.middleware_manager:
+            resolve_fn = self.middleware_manager.get_field_resolver(resolve_fn)
+
+        info = self.build_resolve_info(field_def, field_nodes, parent_type, path)
+
+        try:
+            args = (
+                get_argument_values(field_def, field_nodes[0], self.variable_values)
+                if cached_arguments is None
+                else cached_arguments
+            )
+
+            result = resolve_fn(source, info, **args)
+
+            if self.is_awaitable(result):
+
+                async def await_result() -> Any:
+                    try:
+                        completed = self.complete_value(
+                            return_type, field_nodes, info, path, await result
+                        )
+                        if self.is_awaitable(completed):
+                            return await completed
+                        return completed
+                    except Exception as raw_error:
+                        error = located_error(raw_error, field_nodes, path.as_list())
+                        self.handle_field_error(error, return_type)
+                        return None
+
+                return await_result()
+
+            completed = self.complete_value(
+                return_type, field_nodes, info, path, result
+            )
+            if self.is_awaitable(completed):
+
+                async def await_completed() -> Any:
+                    try:
+                        return await completed
+                    except Exception as raw_error:
+                        error = located_error(raw_error, field_nodes, path.as_list())
+                        self.handle_field_error(error, return_type)
+                        return None
+
+                return await_completed()
+
+            return completed
+        except Exception as raw_error:
+            error = located_error(raw_error, field_nodes, path.as_list())
+            self.handle_field_error(error, return_type)
+            return None
+
+    @staticmethod
+    def complete_leaf_value(return_type: GraphQLLeafType, result: Any) -> Any:
+        is_serialized = _SERIALIZED_CHECKS.get(return_type)
+
+        if is_serialized is not None and is_serialized(result):
+            return result
+
+        if isinstance(return_type, CustomGraphQLEnumType):
+            with contextlib.suppress(KeyError, TypeError):
+                return return_type.names_by_member[result]
+
+        return ExecutionContext.complete_leaf_value(return_type, result)
+
+    def complete_list_value(
+        self,
+        return_type: GraphQLList[GraphQLOutputType],
+        field_nodes: List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: Any,
+    ) -> AwaitableOrValue[List[Any]]:
+        item_type = return_type.of_type
+        nullable = not isinstance(item_type, GraphQLNonNull)
+        leaf_type = item_type if nullable else item_type.of_type
+
+        if type(result) in (list, tuple):
+            is_serialized = _SERIALIZED_CHECKS.get(leaf_type)
+
+            if is_serialized is not None:
+                if all(
+                    is_serialized(item) or (nullable and item is None)
+                    for item in result
+                ):
+                    return list(result)
+
+            elif isinstance(leaf_type, CustomGraphQLEnumType):
+                names = leaf_type.names_by_member
+
+                # anything that's not a member, including nulls for non null
+                # items, is completed as usual, to get the same errors
+                with contextlib.suppress(KeyError, TypeError):
+                    return [
+                        None if nullable and item is None else names[item]
+                        for item in result
+                    ]
+
+        return super().complete_list_value(return_type, field_nodes, info, path, result)
+
+
+__all__ = ["CompiledExecutionContext", "ExecutionPlan"]
@@ -15,4 +15,16 @@ class InvalidOperationTypeError(Exception):
         return f"{operation_type} are not allowed when using {method}"
 
 
-__all__ = ["InvalidOperationTypeError"]
+class UnsupportedGraphQLCoreVersionError(Exception):
+    def __init__(self, feature: str, supported_version: str, version: str) -> None:
+        self.feature = feature
+        self.supported_version = supported_version
+        self.version = version
+
+        super().__init__(
+            f"{feature} only supports graphql-core {supported_version}, "
+            f"but graphql-core {version} is installed"
+        )
+
+
+__all__ = ["InvalidOperationTypeError", "UnsupportedGraphQLCoreVersionError"]
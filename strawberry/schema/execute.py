@@ -4,6 +4,7 @@ from asyncio import ensure_future
 from inspect import isawaitable
 from typing import (
     TYPE_CHECKING,
+    AsyncIterator,
     Callable,
     Iterable,
     List,
@@ -26,18 +27,25 @@ from strawberry.types import ExecutionResult
 from strawberry.types.graphql import OperationType
 
 from .exceptions import InvalidOperationTypeError
+from .operation_cache import CachedOperation
 
 if TYPE_CHECKING:
     from typing_extensions import NotRequired, Unpack
 
     from graphql import ExecutionContext as GraphQLExecutionContext
-    from graphql import GraphQLSchema
+    from graphql import ExecutionResult as GraphQLExecutionResult
+    from graphql import GraphQLSchema, MiddlewareManager
     from graphql.language import DocumentNode
     from graphql.validation import ASTValidationRule
 
     from strawberry.extensions import SchemaExtension
+    from strawberry.extensions.context import ExtensionHooks
     from strawberry.types import ExecutionContext
     from strawberry.types.execution import SubscriptionExecutionResult
+    from strawberry.utils.await_maybe import AwaitableOrValue
+
+    from .operation_cache import OperationCache, OperationCacheKey
+    from .trusted_documents import TrustedDocuments
 
 
 # duplicated because of https://github.com/mkdocstrings/griffe-typingdoc/issues/7
@@ -65,10 +73,13 @@ def validate_document(
     )
 
 
-def _run_validation(execution_context: ExecutionContext) -> None:
-    # Check if there are any validation rules or if validation has
-    # already been run by an extension
-    if len(execution_context.validation_rules) > 0 and execution_context.errors is None:
+def _run_validation(execution_context: ExecutionContext) -> bool:
+    # Check if validation has already been run by an extension
+    if execution_context.errors is not None:
+        return False
+
+    # Check if there are any validation rules
+    if len(execution_context.validation_rules) > 0:
         assert execution_context.graphql_document
         execution_context.errors = validate_document(
             execution_context.schema._schema,
@@ -76,6 +87,368 @@ def _run_validation(execution_context: ExecutionContext) -> None:
             execution_context.validation_rules,
         )
 
+    return True
+
+
+def _get_cached_operation(
+    operation_cache: Optional[OperationCache],
+    execution_context: ExecutionContext,
+) -> Tuple[Optional[OperationCacheKey], Optional[CachedOperation]]:
+    # Documents or errors provided by an extension always take precedence
+    # over the cache
+    if (
+        operation_cache is None
+        or execution_context.graphql_document is not None
+        or execution_context.errors is not None
+    ):
+        return None, None
+
+    assert execution_context.query
+
+    cache_key = operation_cache.make_key(
+        execution_context.query,
+        execution_context.parse_options,
+        execution_context.validation_rules,
+    )
+
+    return cache_key, operation_cache.get(cache_key)
+
+
+def _get_trusted_operation(
+    trusted_documents: TrustedDocuments,
+    document_id: Optional[str],
+    execution_context: ExecutionContext,
+) -> CachedOperation:
+    if not execution_context.query and document_id is None:
+        raise MissingQueryError()
+
+    execution_context.query, operation = trusted_documents.get_operation(
+        execution_context.query, document_id, execution_context.validation_rules
+    )
+
+    return operation
+
+
+def _cache_operation(
+    operation_cache: Optional[OperationCache],
+    cache_key: Optional[OperationCacheKey],
+    execution_context: ExecutionContext,
+) -> None:
+    if operation_cache is None or cache_key is None:
+        return
+
+    assert execution_context.graphql_document
+
+    operation_cache.set(
+        cache_key,
+        CachedOperation(
+            document=execution_context.graphql_document,
+            errors=list(execution_context.errors or []),
+        ),
+    )
+
+
+def _get_operation(
+    *,
+    execution_context: ExecutionContext,
+    operation_cache: Optional[OperationCache],
+    trusted_documents: Optional[TrustedDocuments],
+    document_id: Optional[str],
+) -> Tuple[Optional[OperationCacheKey], Optional[CachedOperation]]:
+    """Find the trusted document or the cached operation of the request.
+
+    Returns the key to cache the operation with once it has been parsed and
+    validated, and the operation when parsing and validation can be skipped.
+    """
+    if trusted_documents is not None:
+        return None, _get_trusted_operation(
+            trusted_documents, document_id, execution_context
+        )
+
+    if not execution_context.query:
+        raise MissingQueryError()
+
+    return _get_cached_operation(operation_cache, execution_context)
+
+
+def _use_cached_operation(
+    cached_operation: CachedOperation,
+    *,
+    allowed_operation_types: Iterable[OperationType],
+    execution_context: ExecutionContext,
+    process_errors: Callable[[List[GraphQLError], Optional[ExecutionContext]], None],
+) -> Optional[ExecutionResult]:
+    """Use a parsed and validated operation, returning a result if it can't run."""
+    execution_context.graphql_document = cached_operation.document
+
+    operation_type = cached_operation.get_operation_type(
+        execution_context.operation_name
+    )
+    if operation_type not in allowed_operation_types:
+        raise InvalidOperationTypeError(operation_type)
+
+    if cached_operation.errors:
+        execution_context.errors = list(cached_operation.errors)
+        process_errors(execution_context.errors, execution_context)
+        return ExecutionResult(data=None, errors=execution_context.errors)
+
+    return None
+
+
+def _parse_operation(
+    execution_context: ExecutionContext,
+    process_errors: Callable[[List[GraphQLError], Optional[ExecutionContext]], None],
+) -> Optional[GraphQLError]:
+    """Parse the query, unless an extension already provided its document.
+
+    Returns the syntax error of the query, once processed, if it isn't valid.
+    """
+    try:
+        if not execution_context.graphql_document:
+            execution_context.graphql_document = parse_document(
+                execution_context.query,  # type: ignore[arg-type]
+                **execution_context.parse_options,
+            )
+    except GraphQLError as exc:
+        execution_context.errors = [exc]
+        process_errors([exc], execution_context)
+        return exc
+
+    return None
+
+
+def _check_operation_type(
+    allowed_operation_types: Iterable[OperationType],
+    execution_context: ExecutionContext,
+) -> None:
+    if execution_context.operation_type not in allowed_operation_types:
+        raise InvalidOperationTypeError(execution_context.operation_type)
+
+
+def _validate_operation(
+    *,
+    execution_context: ExecutionContext,
+    process_errors: Callable[[List[GraphQLError], Optional[ExecutionContext]], None],
+    operation_cache: Optional[OperationCache],
+    cache_key: Optional[OperationCacheKey],
+) -> Optional[ExecutionResult]:
+    """Validate the parsed operation, returning a result if it can't run."""
+    if _run_validation(execution_context):
+        _cache_operation(operation_cache, cache_key, execution_context)
+
+    if execution_context.errors:
+        process_errors(execution_context.errors, execution_context)
+        return ExecutionResult(data=None, errors=execution_context.errors)
+
+    return None
+
+
+def _prepare_operation(
+    *,
+    allowed_operation_types: Iterable[OperationType],
+    execution_context: ExecutionContext,
+    process_errors: Callable[[List[GraphQLError], Optional[ExecutionContext]], None],
+    operation_cache: Optional[OperationCache],
+    trusted_documents: Optional[TrustedDocuments],
+    document_id: Optional[str],
+) -> Optional[ExecutionResult]:
+    """Parse and validate the operation, returning a result if it can't run.
+
+    Same steps as the ones run by `execute` and `execute_sync` between the
+    extension hooks, for schemas without extensions.
+    """
+    cache_key, cached_operation = _get_operation(
+        execution_context=execution_context,
+        operation_cache=operation_cache,
+        trusted_documents=trusted_documents,
+        document_id=document_id,
+    )
+
+    if cached_operation is not None:
+        return _use_cached_operation(
+            cached_operation,
+            allowed_operation_types=allowed_operation_types,
+            execution_context=execution_context,
+            process_errors=process_errors,
+        )
+
+    error = _parse_operation(execution_context, process_errors)
+    if error is not None:
+        return ExecutionResult(data=None, errors=[error], extensions={})
+
+    _check_operation_type(allowed_operation_types, execution_context)
+
+    return _validate_operation(
+        execution_context=execution_context,
+        process_errors=process_errors,
+        operation_cache=operation_cache,
+        cache_key=cache_key,
+    )
+
+
+async def _subscribe(
+    schema: GraphQLSchema, execution_context: ExecutionContext
+) -> Union[AsyncIterator[GraphQLExecutionResult], GraphQLExecutionResult]:
+    return await subscribe(
+        schema,
+        execution_context.graphql_document,  # type: ignore[arg-type]
+        root_value=execution_context.root_value,
+        context_value=execution_context.context,
+        variable_values=execution_context.variables,
+        operation_name=execution_context.operation_name,
+    )
+
+
+def _execute_operation(
+    schema: GraphQLSchema,
+    execution_context: ExecutionContext,
+    *,
+    execution_context_class: Optional[Type[GraphQLExecutionContext]],
+    middleware: Optional[MiddlewareManager] = None,
+) -> AwaitableOrValue[GraphQLExecutionResult]:
+    return original_execute(
+        schema,
+        execution_context.graphql_document,  # type: ignore[arg-type]
+        root_value=execution_context.root_value,
+        middleware=middleware,
+        variable_values=execution_context.variables,
+        operation_name=execution_context.operation_name,
+        context_value=execution_context.context,
+        execution_context_class=execution_context_class,
+    )
+
+
+def _ensure_sync_result(
+    result: AwaitableOrValue[GraphQLExecutionResult],
+) -> GraphQLExecutionResult:
+    if isawaitable(result):
+        ensure_future(result).cancel()
+        raise RuntimeError("GraphQL execution failed to complete synchronously.")
+
+    return result
+
+
+def _set_result(
+    result: GraphQLExecutionResult,
+    execution_context: ExecutionContext,
+    process_errors: Callable[[List[GraphQLError], Optional[ExecutionContext]], None],
+) -> None:
+    execution_context.result = result
+    # Also set errors on the execution_context so that it's easier
+    # to access in extensions
+    if result.errors:
+        execution_context.errors = result.errors
+
+        # Run the `Schema.process_errors` function here before
+        # extensions have a chance to modify them (see the MaskErrors
+        # extension). That way we can log the original errors but
+        # only return a sanitised version to the client.
+        process_errors(result.errors, execution_context)
+
+
+def _set_error(
+    exc: Exception,
+    execution_context: ExecutionContext,
+    process_errors: Callable[[List[GraphQLError], Optional[ExecutionContext]], None],
+) -> GraphQLError:
+    error = (
+        exc
+        if isinstance(exc, GraphQLError)
+        else GraphQLError(str(exc), original_error=exc)
+    )
+    execution_context.errors = [error]
+    process_errors([error], execution_context)
+
+    return error
+
+
+async def _execute_without_extensions(
+    schema: GraphQLSchema,
+    *,
+    allowed_operation_types: Iterable[OperationType],
+    execution_context: ExecutionContext,
+    execution_context_class: Optional[Type[GraphQLExecutionContext]],
+    process_errors: Callable[[List[GraphQLError], Optional[ExecutionContext]], None],
+    operation_cache: Optional[OperationCache],
+    trusted_documents: Optional[TrustedDocuments],
+    document_id: Optional[str],
+) -> Union[ExecutionResult, SubscriptionExecutionResult]:
+    try:
+        early_result = _prepare_operation(
+            allowed_operation_types=allowed_operation_types,
+            execution_context=execution_context,
+            process_errors=process_errors,
+            operation_cache=operation_cache,
+            trusted_documents=trusted_documents,
+            document_id=document_id,
+        )
+        if early_result is not None:
+            return early_result
+
+        if execution_context.operation_type == OperationType.SUBSCRIPTION:
+            return await _subscribe(schema, execution_context)  # type: ignore
+
+        result = _execute_operation(
+            schema,
+            execution_context,
+            execution_context_class=execution_context_class,
+        )
+
+        if isawaitable(result):
+            result = await result
+
+        _set_result(result, execution_context, process_errors)
+
+    except (MissingQueryError, InvalidOperationTypeError):
+        raise
+    except Exception as exc:
+        error = _set_error(exc, execution_context, process_errors)
+        return ExecutionResult(data=None, errors=[error], extensions={})
+
+    return ExecutionResult(data=result.data, errors=result.errors, extensions={})
+
+
+def _execute_sync_without_extensions(
+    schema: GraphQLSchema,
+    *,
+    allowed_operation_types: Iterable[OperationType],
+    execution_context: ExecutionContext,
+    execution_context_class: Optional[Type[GraphQLExecutionContext]],
+    process_errors: Callable[[List[GraphQLError], Optional[ExecutionContext]], None],
+    operation_cache: Optional[OperationCache],
+    trusted_documents: Optional[TrustedDocuments],
+    document_id: Optional[str],
+) -> ExecutionResult:
+    try:
+        early_result = _prepare_operation(
+            allowed_operation_types=allowed_operation_types,
+            execution_context=execution_context,
+            process_errors=process_errors,
+            operation_cache=operation_cache,
+            trusted_documents=trusted_documents,
+            document_id=document_id,
+        )
+        if early_result is not None:
+            return early_result
+
+        result = _ensure_sync_result(
+            _execute_operation(
+                schema,
+                execution_context,
+                execution_context_class=execution_context_class,
+            )
+        )
+
+        _set_result(result, execution_context, process_errors)
+
+    except (MissingQueryError, InvalidOperationTypeError):
+        raise
+    except Exception as exc:
+        error = _set_error(exc, execution_context, process_errors)
+        return ExecutionResult(data=None, errors=[error], extensions={})
+
+    return ExecutionResult(data=result.data, errors=result.errors, extensions={})
+
 
 async def execute(
     schema: GraphQLSchema,
@@ -85,94 +458,96 @@ async def execute(
     execution_context: ExecutionContext,
     execution_context_class: Optional[Type[GraphQLExecutionContext]] = None,
     process_errors: Callable[[List[GraphQLError], Optional[ExecutionContext]], None],
+    operation_cache: Optional[OperationCache] = None,
+    trusted_documents: Optional[TrustedDocuments] = None,
+    document_id: Optional[str] = None,
+    extension_hooks: Optional[ExtensionHooks] = None,
 ) -> Union[ExecutionResult, SubscriptionExecutionResult]:
+    if not extensions:
+        return await _execute_without_extensions(
+            schema,
+            allowed_operation_types=allowed_operation_types,
+            execution_context=execution_context,
+            execution_context_class=execution_context_class,
+            process_errors=process_errors,
+            operation_cache=operation_cache,
+            trusted_documents=trusted_documents,
+            document_id=document_id,
+        )
+
     extensions_runner = SchemaExtensionsRunner(
         execution_context=execution_context,
         extensions=list(extensions),
+        hooks=extension_hooks,
     )
 
     try:
         async with extensions_runner.operation():
             # Note: In graphql-core the schema would be validated here but in
             # Strawberry we are validating it at initialisation time instead
-            if not execution_context.query:
-                raise MissingQueryError()
-
-            async with extensions_runner.parsing():
-                try:
-                    if not execution_context.graphql_document:
-                        execution_context.graphql_document = parse_document(
-                            execution_context.query, **execution_context.parse_options
+            cache_key, cached_operation = _get_operation(
+                execution_context=execution_context,
+                operation_cache=operation_cache,
+                trusted_documents=trusted_documents,
+                document_id=document_id,
+            )
+
+            if cached_operation is not None:
+                # A cache hit or a trusted document skips both the parsing and
+                # the validation phases, including the extension hooks for them
+                early_result = _use_cached_operation(
+                    cached_operation,
+                    allowed_operation_types=allowed_operation_types,
+                    execution_context=execution_context,
+                    process_errors=process_errors,
+                )
+                if early_result is not None:
+                    return early_result
+            else:
+                async with extensions_runner.parsing():
+                    error = _parse_operation(execution_context, process_errors)
+                    if error is not None:
+                        return ExecutionResult(
+                            data=None,
+                            errors=[error],
+                            extensions=await extensions_runner.get_extensions_results(),
                         )
 
-                except GraphQLError as exc:
-                    execution_context.errors = [exc]
-                    process_errors([exc], execution_context)
-                    return ExecutionResult(
-                        data=None,
-                        errors=[exc],
-                        extensions=await extensions_runner.get_extensions_results(),
-                    )
-
-            if execution_context.operation_type not in allowed_operation_types:
-                raise InvalidOperationTypeError(execution_context.operation_type)
+                _check_operation_type(allowed_operation_types, execution_context)
 
-            async with extensions_runner.validation():
-                _run_validation(execution_context)
-                if execution_context.errors:
-                    process_errors(execution_context.errors, execution_context)
-                    return ExecutionResult(data=None, errors=execution_context.errors)
+                async with extensions_runner.validation():
+                    early_result = _validate_operation(
+                        execution_context=execution_context,
+                        process_errors=process_errors,
+                        operation_cache=operation_cache,
+                        cache_key=cache_key,
+                    )
+                    if early_result is not None:
+                        return early_result
 
             async with extensions_runner.executing():
                 if not execution_context.result:
                     if execution_context.operation_type == OperationType.SUBSCRIPTION:
                         # TODO: should we process errors here?
                         # TODO: make our own wrapper?
-                        return await subscribe(  # type: ignore
-                            schema,
-                            execution_context.graphql_document,
-                            root_value=execution_context.root_value,
-                            context_value=execution_context.context,
-                            variable_values=execution_context.variables,
-                            operation_name=execution_context.operation_name,
-                        )
-                    else:
-                        result = original_execute(
-                            schema,
-                            execution_context.graphql_document,
-                            root_value=execution_context.root_value,
-                            middleware=extensions_runner.as_middleware_manager(),
-                            variable_values=execution_context.variables,
-                            operation_name=execution_context.operation_name,
-                            context_value=execution_context.context,
-                            execution_context_class=execution_context_class,
-                        )
+                        return await _subscribe(schema, execution_context)  # type: ignore
+
+                    result = _execute_operation(
+                        schema,
+                        execution_context,
+                        execution_context_class=execution_context_class,
+                        middleware=extensions_runner.as_middleware_manager(),
+                    )
 
                     if isawaitable(result):
                         result = await result
 
-                    execution_context.result = result
-                    # Also set errors on the execution_context so that it's easier
-                    # to access in extensions
-                    if result.errors:
-                        execution_context.errors = result.errors
-
-                        # Run the `Schema.process_errors` function here before
-                        # extensions have a chance to modify them (see the MaskErrors
-                        # extension). That way we can log the original errors but
-                        # only return a sanitised version to the client.
-                        process_errors(result.errors, execution_context)
+                    _set_result(result, execution_context, process_errors)
 
     except (MissingQueryError, InvalidOperationTypeError) as e:
         raise e
     except Exception as exc:
-        error = (
-            exc
-            if isinstance(exc, GraphQLError)
-            else GraphQLError(str(exc), original_error=exc)
-        )
-        execution_context.errors = [error]
-        process_errors([error], execution_context)
+        error = _set_error(exc, execution_context, process_errors)
         return ExecutionResult(
             data=None,
             errors=[error],
@@ -194,85 +569,90 @@ def execute_sync(
     execution_context: ExecutionContext,
     execution_context_class: Optional[Type[GraphQLExecutionContext]] = None,
     process_errors: Callable[[List[GraphQLError], Optional[ExecutionContext]], None],
+    operation_cache: Optional[OperationCache] = None,
+    trusted_documents: Optional[TrustedDocuments] = None,
+    document_id: Optional[str] = None,
+    extension_hooks: Optional[ExtensionHooks] = None,
 ) -> ExecutionResult:
+    if not extensions:
+        return _execute_sync_without_extensions(
+            schema,
+            allowed_operation_types=allowed_operation_types,
+            execution_context=execution_context,
+            execution_context_class=execution_context_class,
+            process_errors=process_errors,
+            operation_cache=operation_cache,
+            trusted_documents=trusted_documents,
+            document_id=document_id,
+        )
+
     extensions_runner = SchemaExtensionsRunner(
         execution_context=execution_context,
         extensions=list(extensions),
+        hooks=extension_hooks,
     )
 
     try:
         with extensions_runner.operation():
             # Note: In graphql-core the schema would be validated here but in
             # Strawberry we are validating it at initialisation time instead
-            if not execution_context.query:
-                raise MissingQueryError()
-
-            with extensions_runner.parsing():
-                try:
-                    if not execution_context.graphql_document:
-                        execution_context.graphql_document = parse_document(
-                            execution_context.query, **execution_context.parse_options
+            cache_key, cached_operation = _get_operation(
+                execution_context=execution_context,
+                operation_cache=operation_cache,
+                trusted_documents=trusted_documents,
+                document_id=document_id,
+            )
+
+            if cached_operation is not None:
+                # A cache hit or a trusted document skips both the parsing and
+                # the validation phases, including the extension hooks for them
+                early_result = _use_cached_operation(
+                    cached_operation,
+                    allowed_operation_types=allowed_operation_types,
+                    execution_context=execution_context,
+                    process_errors=process_errors,
+                )
+                if early_result is not None:
+                    return early_result
+            else:
+                with extensions_runner.parsing():
+                    error = _parse_operation(execution_context, process_errors)
+                    if error is not None:
+                        return ExecutionResult(
+                            data=None,
+                            errors=[error],
+                            extensions=extensions_runner.get_extensions_results_sync(),
                         )
 
-                except GraphQLError as exc:
-                    execution_context.errors = [exc]
-                    process_errors([exc], execution_context)
-                    return ExecutionResult(
-                        data=None,
-                        errors=[exc],
-                        extensions=extensions_runner.get_extensions_results_sync(),
-                    )
-
-            if execution_context.operation_type not in allowed_operation_types:
-                raise InvalidOperationTypeError(execution_context.operation_type)
+                _check_operation_type(allowed_operation_types, execution_context)
 
-            with extensions_runner.validation():
-                _run_validation(execution_context)
-                if execution_context.errors:
-                    process_errors(execution_context.errors, execution_context)
-                    return ExecutionResult(data=None, errors=execution_context.errors)
+                with extensions_runner.validation():
+                    early_result = _validate_operation(
+                        execution_context=execution_context,
+                        process_errors=process_errors,
+                        operation_cache=operation_cache,
+                        cache_key=cache_key,
+                    )
+                    if early_result is not None:
+                        return early_result
 
             with extensions_runner.executing():
                 if not execution_context.result:
-                    result = original_execute(
-                        schema,
-                        execution_context.graphql_document,
-                        root_value=execution_context.root_value,
-                        middleware=extensions_runner.as_middleware_manager(),
-                        variable_values=execution_context.variables,
-                        operation_name=execution_context.operation_name,
-                        context_value=execution_context.context,
-                        execution_context_class=execution_context_class,
-                    )
-
-                    if isawaitable(result):
-                        ensure_future(result).cancel()
-                        raise RuntimeError(
-                            "GraphQL execution failed to complete synchronously."
+                    result = _ensure_sync_result(
+                        _execute_operation(
+                            schema,
+                            execution_context,
+                            execution_context_class=execution_context_class,
+                            middleware=extensions_runner.as_middleware_manager(),
                         )
+                    )
 
-                    execution_context.result = result
-                    # Also set errors on the execution_context so that it's easier
-                    # to access in extensions
-                    if result.errors:
-                        execution_context.errors = result.errors
-
-                        # Run the `Schema.process_errors` function here before
-                        # extensions have a chance to modify them (see the MaskErrors
-                        # extension). That way we can log the original errors but
-                        # only return a sanitised version to the client.
-                        process_errors(result.errors, execution_context)
+                    _set_result(result, execution_context, process_errors)
 
     except (MissingQueryError, InvalidOperationTypeError) as e:
         raise e
     except Exception as exc:
-        error = (
-            exc
-            if isinstance(exc, GraphQLError)
-            else GraphQLError(str(exc), original_error=exc)
-        )
-        execution_context.errors = [error]
-        process_errors([error], execution_context)
+        error = _set_error(exc, execution_context, process_errors)
         return ExecutionResult(
             data=None,
             errors=[error],
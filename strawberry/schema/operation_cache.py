@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import dataclasses
+import threading
+from collections import OrderedDict
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from strawberry.utils.operation import get_operation_type
+
+if TYPE_CHECKING:
+    from graphql import GraphQLError
+    from graphql.language import DocumentNode
+    from graphql.validation import ASTValidationRule
+
+    from strawberry.types.execution import ParseOptions
+    from strawberry.types.graphql import OperationType
+
+
+OperationCacheKey = Tuple[str, Tuple[Tuple[str, Any], ...], Tuple[Hashable, ...]]
+
+
+class OperationCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: Optional[int]
+    currsize: int
+    max_bytes: Optional[int]
+    currbytes: int
+
+
+@dataclasses.dataclass
+class CachedOperation:
+    """The result of parsing and validating a single GraphQL document."""
+
+    document: DocumentNode
+    errors: List[GraphQLError]
+    weight: int = 0
+    operation_types: Dict[Optional[str], OperationType] = dataclasses.field(
+        default_factory=dict
+    )
+
+    def get_operation_type(self, operation_name: Optional[str]) -> OperationType:
+        try:
+            return self.operation_types[operation_name]
+        except KeyError:
+            operation_type = get_operation_type(self.document, operation_name)
+            self.operation_types[operation_name] = operation_type
+
+            return operation_type
+
+
+class OperationCache:
+    """LRU cache for parsed and validated GraphQL documents.
+
+    Entries are keyed by the query text, the parse options and the validation
+    rules used for the request, so that a repeated operation can skip both
+    the parsing and the validation phases.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.schema.operation_cache import OperationCache
+
+    schema = strawberry.Schema(
+        Query,
+        operation_cache=OperationCache(maxsize=1000),
+    )
+    ```
+    """
+
+    def __init__(
+        self, maxsize: Optional[int] = 1000, max_bytes: Optional[int] = None
+    ) -> None:
+        """Initialize the OperationCache.
+
+        Args:
+            maxsize: The maximum number of operations to keep. If `maxsize` is
+                set to `None` the number of entries is not bounded.
+            max_bytes: The maximum total size, in bytes of query text, of the
+                cached operations. The size of the source text is used as an
+                approximation of the memory used by the parsed document. If
+                `max_bytes` is set to `None` the size is not bounded.
+        """
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries: OrderedDict[OperationCacheKey, CachedOperation] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        query: str,
+        parse_options: ParseOptions,
+        validation_rules: Tuple[Type[ASTValidationRule], ...],
+    ) -> OperationCacheKey:
+        return (query, tuple(sorted(parse_options.items())), validation_rules)
+
+    def get(self, key: OperationCacheKey) -> Optional[CachedOperation]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return entry
+
+    def set(self, key: OperationCacheKey, entry: CachedOperation) -> None:
+        entry.weight = len(key[0].encode())
+
+        if self.max_bytes is not None and entry.weight > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.weight
+
+            self._entries[key] = entry
+            self._bytes += entry.weight
+
+            while (self.maxsize is not None and len(self._entries) > self.maxsize) or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.weight
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def cache_info(self) -> OperationCacheInfo:
+        with self._lock:
+            return OperationCacheInfo(
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                maxsize=self.maxsize,
+                currsize=len(self._entries),
+                max_bytes=self.max_bytes,
+                currbytes=self._bytes,
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+__all__ = ["OperationCache", "OperationCacheInfo", "CachedOperation"]
@@ -30,11 +30,16 @@ from graphql.type.directives import specified_directives
 
 from strawberry import relay
 from strawberry.annotation import StrawberryAnnotation
+from strawberry.dataloader import DataLoader, SyncDataLoader
+from strawberry.extensions.context import ExtensionHooks
 from strawberry.extensions.directives import (
     DirectivesExtension,
     DirectivesExtensionSync,
 )
+from strawberry.schema.batch_resolvers import batch_resolver_scope
+from strawberry.schema.compiled_execution import CompiledExecutionContext
 from strawberry.schema.schema_converter import GraphQLCoreConverter
+from strawberry.schema.sync_batching_execution import SyncBatchingExecutionContext
 from strawberry.schema.types.scalar import DEFAULT_SCALAR_REGISTRY
 from strawberry.types import ExecutionContext
 from strawberry.types.base import StrawberryObjectDefinition, has_object_definition
@@ -53,6 +58,8 @@ if TYPE_CHECKING:
 
     from strawberry.directive import StrawberryDirective
     from strawberry.extensions import SchemaExtension
+    from strawberry.schema.operation_cache import OperationCache
+    from strawberry.schema.trusted_documents import TrustedDocuments
     from strawberry.types import ExecutionResult, SubscriptionExecutionResult
     from strawberry.types.base import StrawberryType
     from strawberry.types.enum import EnumDefinition
@@ -84,6 +91,8 @@ class Schema(BaseSchema):
             Dict[object, Union[Type, ScalarWrapper, ScalarDefinition]],
         ] = None,
         schema_directives: Iterable[object] = (),
+        operation_cache: Optional[OperationCache] = None,
+        trusted_documents: Optional[TrustedDocuments] = None,
     ) -> None:
         """Default Schema to be to be used in a Strawberry application.
 
@@ -106,6 +115,12 @@ class Schema(BaseSchema):
             config: The configuration for the schema.
             scalar_overrides: A dictionary of overrides for scalars.
             schema_directives: A list of schema directives for the schema.
+            operation_cache: An optional cache for parsed and validated operations.
+                When set, repeated operations skip the parsing and validation
+                steps, including the extension hooks for those steps.
+            trusted_documents: An optional allowlist of operations. When set,
+                the documents are parsed and validated when the schema is
+                created and any other operation is rejected.
 
         Example:
         ```python
@@ -125,7 +140,17 @@ class Schema(BaseSchema):
         self.subscription = subscription
 
         self.extensions = extensions
+        # these contexts override graphql-core internals, fail now rather than
+        # when executing operations
+        if execution_context_class is not None and issubclass(
+            execution_context_class,
+            (CompiledExecutionContext, SyncBatchingExecutionContext),
+        ):
+            compat.check_graphql_core_version(execution_context_class.__name__)
+
         self.execution_context_class = execution_context_class
+        self.operation_cache = operation_cache
+        self.trusted_documents = trusted_documents
         self.config = config or StrawberryConfig()
 
         SCALAR_OVERRIDES_DICT_TYPE = Dict[
@@ -214,6 +239,14 @@ class Schema(BaseSchema):
             formatted_errors = "\n\n".join(f"❌ {error.message}" for error in errors)
             raise ValueError(f"Invalid Schema. Errors:\n\n{formatted_errors}")
 
+        if self.trusted_documents is not None:
+            self.trusted_documents.compile(self._schema)
+
+        self._extension_hooks = {
+            sync: ExtensionHooks(self.get_extensions(sync=sync))
+            for sync in (False, True)
+        }
+
     def get_extensions(
         self, sync: bool = False
     ) -> List[Union[Type[SchemaExtension], SchemaExtension]]:
@@ -224,6 +257,19 @@ class Schema(BaseSchema):
 
         return extensions
 
+    def _get_extension_hooks(
+        self,
+        extensions: List[Union[Type[SchemaExtension], SchemaExtension]],
+        sync: bool = False,
+    ) -> ExtensionHooks:
+        hooks = self._extension_hooks[sync]
+
+        # `extensions` can be changed after the schema has been created
+        if hooks.extensions != tuple(extensions):
+            hooks = ExtensionHooks(extensions)
+
+        return hooks
+
     @lru_cache
     def get_type_by_name(
         self, name: str
@@ -284,6 +330,7 @@ class Schema(BaseSchema):
         root_value: Optional[Any] = None,
         operation_name: Optional[str] = None,
         allowed_operation_types: Optional[Iterable[OperationType]] = None,
+        document_id: Optional[str] = None,
     ) -> Union[ExecutionResult, SubscriptionExecutionResult]:
         if allowed_operation_types is None:
             allowed_operation_types = DEFAULT_ALLOWED_OPERATION_TYPES
@@ -298,14 +345,21 @@ class Schema(BaseSchema):
             provided_operation_name=operation_name,
         )
 
-        result = await execute(
-            self._schema,
-            extensions=self.get_extensions(),
-            execution_context_class=self.execution_context_class,
-            execution_context=execution_context,
-            allowed_operation_types=allowed_operation_types,
-            process_errors=self._process_errors,
-        )
+        extensions = self.get_extensions()
+
+        with batch_resolver_scope(DataLoader):
+            result = await execute(
+                self._schema,
+                extensions=extensions,
+                extension_hooks=self._get_extension_hooks(extensions),
+                execution_context_class=self.execution_context_class,
+                execution_context=execution_context,
+                allowed_operation_types=allowed_operation_types,
+                process_errors=self._process_errors,
+                operation_cache=self.operation_cache,
+                trusted_documents=self.trusted_documents,
+                document_id=document_id,
+            )
 
         return result
 
@@ -317,6 +371,7 @@ class Schema(BaseSchema):
         root_value: Optional[Any] = None,
         operation_name: Optional[str] = None,
         allowed_operation_types: Optional[Iterable[OperationType]] = None,
+        document_id: Optional[str] = None,
     ) -> ExecutionResult:
         if allowed_operation_types is None:
             allowed_operation_types = DEFAULT_ALLOWED_OPERATION_TYPES
@@ -330,15 +385,27 @@ class Schema(BaseSchema):
             provided_operation_name=operation_name,
         )
 
-        result = execute_sync(
-            self._schema,
-            extensions=self.get_extensions(sync=True),
-            execution_context_class=self.execution_context_class,
-            execution_context=execution_context,
-            allowed_operation_types=allowed_operation_types,
-            process_errors=self._process_errors,
+        extensions = self.get_extensions(sync=True)
+
+        # only `SyncBatchingExecutionContext` can wait for the other parents
+        sync_batching = self.execution_context_class is not None and issubclass(
+            self.execution_context_class, SyncBatchingExecutionContext
         )
 
+        with batch_resolver_scope(SyncDataLoader if sync_batching else None):
+            result = execute_sync(
+                self._schema,
+                extensions=extensions,
+                extension_hooks=self._get_extension_hooks(extensions, sync=True),
+                execution_context_class=self.execution_context_class,
+                execution_context=execution_context,
+                allowed_operation_types=allowed_operation_types,
+                process_errors=self._process_errors,
+                operation_cache=self.operation_cache,
+                trusted_documents=self.trusted_documents,
+                document_id=document_id,
+            )
+
         return result
 
     async def subscribe(
@@ -437,7 +504,18 @@ class Schema(BaseSchema):
         Raises:
             ValueError: If the introspection query fails due to an invalid schema
         """
-        introspection = self.execute_sync(get_introspection_query())
+        # Not using `self.execute_sync` as the introspection query is usually
+        # not part of the trusted documents
+        introspection = execute_sync(
+            self._schema,
+            extensions=self.get_extensions(sync=True),
+            execution_context_class=self.execution_context_class,
+            execution_context=ExecutionContext(
+                query=get_introspection_query(), schema=self
+            ),
+            allowed_operation_types=DEFAULT_ALLOWED_OPERATION_TYPES,
+            process_errors=self._process_errors,
+        )
         if introspection.errors or not introspection.data:
             raise ValueError(f"Invalid Schema. Errors {introspection.errors!r}")
 
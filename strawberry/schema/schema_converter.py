@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import contextlib
 import dataclasses
 import sys
 from functools import partial, reduce
@@ -35,7 +36,6 @@ from graphql import (
     GraphQLNamedType,
     GraphQLNonNull,
     GraphQLObjectType,
-    GraphQLType,
     GraphQLUnionType,
     Undefined,
     ValueNode,
@@ -52,8 +52,14 @@ from strawberry.exceptions import (
     ScalarAlreadyRegisteredError,
     UnresolvedFieldTypeError,
 )
+from strawberry.schema.batch_resolvers import create_batch_resolver
 from strawberry.schema.types.scalar import _make_scalar_type
-from strawberry.types.arguments import StrawberryArgument, convert_arguments
+from strawberry.types.arguments import (
+    ArgumentConverter,
+    StrawberryArgument,
+    compile_arguments_converter,
+    convert_arguments,
+)
 from strawberry.types.base import (
     StrawberryList,
     StrawberryObjectDefinition,
@@ -74,7 +80,7 @@ from strawberry.utils.await_maybe import await_maybe
 
 from ..extensions.field_extension import build_field_extension_resolvers
 from . import compat
-from .types.concrete_type import ConcreteType
+from .types.concrete_type import ConcreteType, ConcreteTypeIndex
 
 if TYPE_CHECKING:
     from graphql import (
@@ -157,8 +163,35 @@ class CustomGraphQLEnumType(GraphQLEnumType):
         super().__init__(*args, **kwargs)
         self.wrapped_cls = enum.wrapped_cls
 
+        # lookup tables used to serialize enum members, the first name is used
+        # when more than one has the same value, like `values` is scanned
+        self.names_by_member: Dict[Any, str] = {}
+        self.names_by_value: Dict[Any, str] = {}
+
+        for name, value in self.values.items():
+            # unhashable values are looked up by scanning `values`
+            with contextlib.suppress(TypeError):
+                self.names_by_value.setdefault(value.value, name)
+
+            try:
+                member = self.wrapped_cls(value.value)
+            except ValueError:
+                continue
+
+            self.names_by_member.setdefault(member, name)
+
     def serialize(self, output_value: Any) -> str:
+        try:
+            return self.names_by_member[output_value]
+        except (KeyError, TypeError):
+            pass
+
         if isinstance(output_value, self.wrapped_cls):
+            try:
+                return self.names_by_value[output_value.value]
+            except (KeyError, TypeError):
+                pass
+
             for name, value in self.values.items():
                 if output_value.value == value.value:
                     return name
@@ -178,15 +211,7 @@ class CustomGraphQLEnumType(GraphQLEnumType):
         return self.wrapped_cls(super().parse_literal(value_node, _variables))
 
 
-def get_arguments(
-    *,
-    field: StrawberryField,
-    source: Any,
-    info: Info,
-    kwargs: Any,
-    config: StrawberryConfig,
-    scalar_registry: Dict[object, Union[ScalarWrapper, ScalarDefinition]],
-) -> Tuple[List[Any], Dict[str, Any]]:
+def get_field_arguments(field: StrawberryField) -> List[StrawberryArgument]:
     # TODO: An extension might have changed the resolver arguments,
     # but we need them here since we are calling it.
     # This is a bit of a hack, but it's the easiest way to get the arguments
@@ -202,6 +227,20 @@ def get_arguments(
             ]
         )
 
+    return field_arguments
+
+
+def get_arguments(
+    *,
+    field: StrawberryField,
+    source: Any,
+    info: Info,
+    kwargs: Any,
+    config: StrawberryConfig,
+    scalar_registry: Dict[object, Union[ScalarWrapper, ScalarDefinition]],
+) -> Tuple[List[Any], Dict[str, Any]]:
+    field_arguments = get_field_arguments(field)
+
     kwargs = convert_arguments(
         kwargs,
         field_arguments,
@@ -246,9 +285,11 @@ class GraphQLCoreConverter:
         get_fields: Callable[[StrawberryObjectDefinition], List[StrawberryField]],
     ) -> None:
         self.type_map: Dict[str, ConcreteType] = {}
+        self.type_index = ConcreteTypeIndex(self.type_map)
         self.config = config
         self.scalar_registry = scalar_registry
         self.get_fields = get_fields
+        self.argument_converters: Dict[type, ArgumentConverter] = {}
 
     def from_argument(self, argument: StrawberryArgument) -> GraphQLArgument:
         argument_type = cast(
@@ -537,27 +578,12 @@ class GraphQLCoreConverter:
                     if not type_definition.is_graphql_generic:
                         return type_definition.name
 
-                    # here we don't all the implementations of the generic
-                    # we need to find a way to find them, for now maybe
-                    # we can follow the union's approach and iterate over
-                    # all the types in the schema, but we should probably
-                    # optimize this
-
-                    return_type: Optional[GraphQLType] = None
-
-                    for possible_concrete_type in self.type_map.values():
-                        possible_type = possible_concrete_type.definition
-
-                        if not isinstance(
-                            possible_type, StrawberryObjectDefinition
-                        ):  # pragma: no cover
-                            continue
+                    # find the specialisation of the generic implemented by
+                    # the object
+                    concrete_type = self.type_index.find(obj)
 
-                        if possible_type.is_implemented_by(obj):
-                            return_type = possible_concrete_type.implementation
-                            break
-
-                    if return_type:
+                    if concrete_type:
+                        return_type = concrete_type.implementation
                         assert isinstance(return_type, GraphQLNamedType)
 
                         return return_type.name
@@ -669,70 +695,103 @@ class GraphQLCoreConverter:
                 _field=field,
             )
 
-        def _get_result(
-            _source: Any,
-            info: Info,
-            field_args: List[Any],
-            field_kwargs: Dict[str, Any],
-        ) -> Any:
-            return field.get_result(
-                _source, info=info, args=field_args, kwargs=field_kwargs
-            )
-
         def wrap_field_extensions() -> Callable[..., Any]:
             """Wrap the provided field resolver with the middleware."""
             for extension in field.extensions:
                 extension.apply(field)
 
-            extension_functions = build_field_extension_resolvers(field)
+            # extensions can replace the resolver, so we need to inspect it
+            # after applying them
+            base_resolver = field.base_resolver
+            resolver_requested_self = bool(
+                base_resolver and base_resolver.self_parameter
+            )
+            resolver_requested_info = bool(
+                base_resolver
+                and base_resolver.info_parameter
+                and base_resolver.info_parameter.name == "info"
+            )
+
+            # the following code allows to omit info and root arguments
+            # by inspecting the original resolver arguments,
+            # if it asks for self, the source will be passed as first argument
+            # if it asks for root or parent, the source will be passed as kwarg
+            # if it asks for info, the info will be passed as kwarg, unless it
+            # is called `info`, in which case it is passed to the extensions
+            # explicitly and added back by `_get_result`
+            source_kwargs = []
+            info_kwarg = None
+
+            if base_resolver:
+                if parent_parameter := base_resolver.parent_parameter:
+                    source_kwargs.append(parent_parameter.name)
+
+                if root_parameter := base_resolver.root_parameter:
+                    source_kwargs.append(root_parameter.name)
+
+                if (
+                    info_parameter := base_resolver.info_parameter
+                ) and not resolver_requested_info:
+                    info_kwarg = info_parameter.name
+
+            # parse field arguments into Strawberry input types and convert
+            # field names to Python equivalents
+            convert_field_arguments = compile_arguments_converter(
+                get_field_arguments(field),
+                self.scalar_registry,
+                self.config,
+                self.argument_converters,
+            )
+
+            def _get_result(_source: Any, info: Info, **kwargs: Any) -> Any:
+                # if the resolver function requested the info object info
+                # then put it back in the kwargs dictionary
+                if resolver_requested_info:
+                    kwargs["info"] = info
+
+                return field.get_result(
+                    _source,
+                    info=info,
+                    args=[_source] if resolver_requested_self else [],
+                    kwargs=kwargs,
+                )
+
+            # combine all the extension resolvers once, when the schema is
+            # built, so that resolving the field is a call through the chain
+            resolve_with_extensions = reduce(
+                lambda chained_fn, next_fn: partial(next_fn, chained_fn),
+                build_field_extension_resolvers(field),
+                _get_result,
+            )
 
             def extension_resolver(
                 _source: Any,
                 info: Info,
                 **kwargs: Any,
             ) -> Any:
-                # parse field arguments into Strawberry input types and convert
-                # field names to Python equivalents
-                field_args, field_kwargs = get_arguments(
-                    field=field,
-                    source=_source,
-                    info=info,
-                    kwargs=kwargs,
-                    config=self.config,
-                    scalar_registry=self.scalar_registry,
-                )
+                field_kwargs = convert_field_arguments(kwargs)
+
+                for name in source_kwargs:
+                    field_kwargs[name] = _source
 
-                resolver_requested_info = False
-                if "info" in field_kwargs:
-                    resolver_requested_info = True
-                    # remove info from field_kwargs because we're passing it
-                    # explicitly to the extensions
-                    field_kwargs.pop("info")
-
-                # `_get_result` expects `field_args` and `field_kwargs` as
-                # separate arguments so we have to wrap the function so that we
-                # can pass them in
-                def wrapped_get_result(_source: Any, info: Info, **kwargs: Any) -> Any:
-                    # if the resolver function requested the info object info
-                    # then put it back in the kwargs dictionary
-                    if resolver_requested_info:
-                        kwargs["info"] = info
-
-                    return _get_result(
-                        _source, info, field_args=field_args, field_kwargs=kwargs
-                    )
-
-                # combine all the extension resolvers
-                return reduce(
-                    lambda chained_fn, next_fn: partial(next_fn, chained_fn),
-                    extension_functions,
-                    wrapped_get_result,
-                )(_source, info, **field_kwargs)
+                if info_kwarg:
+                    field_kwargs[info_kwarg] = info
+
+                return resolve_with_extensions(_source, info, **field_kwargs)
 
             return extension_resolver
 
         _get_result_with_extensions = wrap_field_extensions()
 
+        if field.is_batch:
+            # the list of parents is passed where the parent would be
+            return create_batch_resolver(
+                lambda parents, info, kwargs: _get_result_with_extensions(
+                    parents, info, **kwargs
+                ),
+                _strawberry_info_from_graphql,
+            )
+
         def _resolver(_source: Any, info: GraphQLResolveInfo, **kwargs: Any) -> Any:
             strawberry_info = _strawberry_info_from_graphql(info)
 
@@ -878,7 +937,7 @@ class GraphQLCoreConverter:
             name=union_name,
             types=graphql_types,
             description=union.description,
-            resolve_type=union.get_type_resolver(self.type_map),
+            resolve_type=union.get_type_resolver(self.type_map, self.type_index),
             extensions={
                 GraphQLCoreConverter.DEFINITION_BACKREF: union,
             },
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import asyncio
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+)
+
+from graphql import Undefined, located_error
+from graphql.execution import ExecutionContext
+from graphql.pyutils import Path, is_iterable
+
+from strawberry.dataloader import SyncFuture, run_sync
+from strawberry.schema.compat import check_graphql_core_version
+
+if TYPE_CHECKING:
+    from graphql import (
+        GraphQLList,
+        GraphQLObjectType,
+        GraphQLOutputType,
+        GraphQLResolveInfo,
+    )
+    from graphql.language import FieldNode
+    from graphql.language.ast import OperationDefinitionNode
+    from graphql.pyutils import AwaitableOrValue
+
+
+def _is_event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+
+    return True
+
+
+class _GatherSync:
+    """Like `asyncio.gather`, but stepping the awaitables itself.
+
+    Each time it is resumed, every pending awaitable is resumed once, and it
+    only suspends once all of them are either done or suspended, so that the
+    loaders they wait on are dispatched together.
+    """
+
+    __slots__ = ("awaitables",)
+
+    def __init__(self, awaitables: Sequence[Awaitable[Any]]) -> None:
+        self.awaitables = awaitables
+
+    def __await__(self) -> Generator[Any, None, List[Any]]:
+        iterators = [awaitable.__await__() for awaitable in self.awaitables]
+        results: List[Any] = [None] * len(iterators)
+        pending = list(range(len(iterators)))
+
+        try:
+            while True:
+                yielded = None
+                still_pending = []
+
+                for index in pending:
+                    try:
+                        step = iterators[index].send(None)
+                    except StopIteration as stop:
+                        results[index] = stop.value
+                        continue
+
+                    still_pending.append(index)
+
+                    # anything else than a `SyncFuture` can't be handled by
+                    # `run_sync`, so it gets to see it
+                    if yielded is None or isinstance(yielded, SyncFuture):
+                        yielded = step
+
+                pending = still_pending
+
+                if not pending:
+                    return results
+
+                yield yielded
+        finally:
+            for index in pending:
+                iterators[index].close()  # type: ignore[attr-defined]
+
+
+class SyncBatchingExecutionContext(ExecutionContext):
+    """An execution context batching `SyncDataLoader` loads in sync execution.
+
+    Resolvers can return the `SyncFuture` returned by `SyncDataLoader.load`,
+    or be coroutines awaiting them. Instead of requiring an event loop, the
+    operation is stepped one level at a time: once all the fields of the
+    current level have been resolved, the loaders with pending keys are
+    dispatched, each with a single call to its `load_fn`.
+
+    When the operation is executed asynchronously, this behaves like the
+    default execution context, and awaiting a `SyncFuture` loads it right away.
+
+    It overrides internals of graphql-core's `ExecutionContext` which change
+    between its minor versions, so it only supports graphql-core 3.2, and
+    raises `UnsupportedGraphQLCoreVersionError` with other versions.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.schema.sync_batching_execution import (
+        SyncBatchingExecutionContext,
+    )
+
+    schema = strawberry.Schema(
+        Query, execution_context_class=SyncBatchingExecutionContext
+    )
+    ```
+    """
+
+    batching = False
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        check_graphql_core_version(type(self).__name__)
+
+        super().__init__(*args, **kwargs)
+
+    def execute_operation(
+        self, operation: OperationDefinitionNode, root_value: Any
+    ) -> Optional[AwaitableOrValue[Any]]:
+        self.batching = not _is_event_loop_running()
+
+        result = super().execute_operation(operation, root_value)
+
+        if self.batching and self.is_awaitable(result):
+            return run_sync(result)  # type: ignore[arg-type]
+
+        return result
+
+    def execute_fields(
+        self,
+        parent_type: GraphQLObjectType,
+        source_value: Any,
+        path: Optional[Path],
+        fields: Dict[str, List[FieldNode]],
+    ) -> AwaitableOrValue[Dict[str, Any]]:
+        if not self.batching:
+            return super().execute_fields(parent_type, source_value, path, fields)
+
+        # Same as graphql-core's `execute_fields`, but without `asyncio.gather`
+        results = {}
+        awaitable_fields: List[str] = []
+
+        for response_name, field_nodes in fields.items():
+            field_path = Path(path, response_name, parent_type.name)
+            result = self.execute_field(
+                parent_type, source_value, field_nodes, field_path
+            )
+            if result is not Undefined:
+                results[response_name] = result
+                if self.is_awaitable(result):
+                    awaitable_fields.append(response_name)
+
+        if not awaitable_fields:
+            return results
+
+        async def get_results() -> Dict[str, Any]:
+            results.update(
+                zip(
+                    awaitable_fields,
+                    await _GatherSync([results[field] for field in awaitable_fields]),
+                )
+            )
+            return results
+
+        return get_results()
+
+    def complete_list_value(
+        self,
+        return_type: GraphQLList[GraphQLOutputType],
+        field_nodes: List[FieldNode],
+        info: GraphQLResolveInfo,
+        path: Path,
+        result: Iterable[Any],
+    ) -> AwaitableOrValue[List[Any]]:
+        if not self.batching or not is_iterable(result):
+            return super().complete_list_value(
+                return_type, field_nodes, info, path, result
+            )
+
+        # Same as graphql-core's `complete_list_value`, but without
+        # `asyncio.gather`
+        item_type = return_type.of_type
+        awaitable_indices: List[int] = []
+        completed_results: List[Any] = []
+
+        async def await_completed(item: Any, item_path: Path, resolved: bool) -> Any:
+            try:
+                completed = item if resolved else await item
+
+                if not resolved:
+                    completed = self.complete_value(
+                        item_type, field_nodes, info, item_path, completed
+                    )
+
+                if self.is_awaitable(completed):
+                    return await completed
+
+                return completed
+            except Exception as raw_error:
+                error = located_error(raw_error, field_nodes, item_path.as_list())
+                self.handle_field_error(error, item_type)
+                return None
+
+        for index, item in enumerate(result):
+            item_path = path.add_key(index, None)
+            completed_item: AwaitableOrValue[Any]
+
+            if self.is_awaitable(item):
+                completed_item = await_completed(item, item_path, resolved=False)
+            else:
+                try:
+                    completed_item = self.complete_value(
+                        item_type, field_nodes, info, item_path, item
+                    )
+                    if self.is_awaitable(completed_item):
+                        completed_item = await_completed(
+                            completed_item, item_path, resolved=True
+                        )
+                except Exception as raw_error:
+                    error = located_error(raw_error, field_nodes, item_path.as_list())
+                    self.handle_field_error(error, item_type)
+                    completed_item = None
+
+            if self.is_awaitable(completed_item):
+                awaitable_indices.append(index)
+            completed_results.append(completed_item)
+
+        if not awaitable_indices:
+            return completed_results
+
+        async def get_completed_results() -> List[Any]:
+            values = await _GatherSync(
+                [completed_results[index] for index in awaitable_indices]
+            )
+            for index, value in zip(awaitable_indices, values):
+                completed_results[index] = value
+            return completed_results
+
+        return get_completed_results()
+
+
+__all__ = ["SyncBatchingExecutionContext"]
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Tuple, Type, Union
+
+from graphql import GraphQLError, parse, specified_rules
+from graphql.language import OperationDefinitionNode
+
+from .execute import validate_document
+from .operation_cache import CachedOperation
+
+if TYPE_CHECKING:
+    from graphql import GraphQLSchema
+    from graphql.validation import ASTValidationRule
+
+_DEFAULT_VALIDATION_RULES: Tuple[Type[ASTValidationRule], ...] = tuple(specified_rules)
+
+
+class TrustedDocuments:
+    """An allowlist of precompiled operations.
+
+    Every document in the manifest is parsed and validated once, when the
+    schema is created. Requests can then reference a document by its id,
+    skipping parsing and validation entirely, while any operation that is
+    not part of the manifest is rejected.
+
+    When extensions change the validation rules of a request, for example
+    with `AddValidationRules`, a document is validated again with these rules
+    the first time it's requested with them, and the result is cached.
+
+    Example:
+
+    ```python
+    import strawberry
+    from strawberry.schema.trusted_documents import TrustedDocuments
+
+    schema = strawberry.Schema(
+        Query,
+        trusted_documents=TrustedDocuments.from_file("trusted_documents.json"),
+    )
+    ```
+    """
+
+    def __init__(self, documents: Mapping[str, str]) -> None:
+        """Initialize the TrustedDocuments.
+
+        Args:
+            documents: A mapping of document ids, usually the sha256 hash of the
+                document, to GraphQL documents.
+        """
+        self.documents = dict(documents)
+
+        self._schema: Optional[GraphQLSchema] = None
+        self._operations: Dict[str, CachedOperation] = {}
+        self._operations_by_rules: Dict[
+            Tuple[str, Tuple[Type[ASTValidationRule], ...]], CachedOperation
+        ] = {}
+        self._ids_by_query: Dict[str, str] = {}
+
+    @classmethod
+    def from_file(cls, path: Union[str, Path]) -> TrustedDocuments:
+        """Load a JSON manifest mapping document ids to documents."""
+        documents = json.loads(Path(path).read_text())
+
+        if not isinstance(documents, dict):
+            raise ValueError(f"Invalid trusted documents manifest: {path}")
+
+        return cls(documents)
+
+    @staticmethod
+    def hash_document(document: str) -> str:
+        return hashlib.sha256(document.encode()).hexdigest()
+
+    def compile(self, schema: GraphQLSchema) -> None:
+        """Parse, validate and analyse all the documents in the manifest.
+
+        Documents are validated with the default rules of `execute`.
+
+        Raises:
+            ValueError: If any of the documents is not valid for the schema
+        """
+        self._schema = schema
+        invalid_documents = []
+
+        for document_id, query in self.documents.items():
+            try:
+                document = parse(query)
+            except GraphQLError as error:
+                invalid_documents.append(f"❌ {document_id}: {error.message}")
+                continue
+
+            errors = validate_document(schema, document, _DEFAULT_VALIDATION_RULES)
+            if errors:
+                invalid_documents.extend(
+                    f"❌ {document_id}: {error.message}" for error in errors
+                )
+                continue
+
+            operation = CachedOperation(document=document, errors=[])
+
+            # Resolve the operation types upfront, so that nothing is left to
+            # be computed at request time
+            operation.get_operation_type(None)
+            for definition in document.definitions:
+                if isinstance(definition, OperationDefinitionNode) and definition.name:
+                    operation.get_operation_type(definition.name.value)
+
+            self._operations[document_id] = operation
+            self._ids_by_query[query] = document_id
+
+        if invalid_documents:
+            formatted_errors = "\n\n".join(invalid_documents)
+            raise ValueError(
+                f"Invalid trusted documents. Errors:\n\n{formatted_errors}"
+            )
+
+    def get_operation(
+        self,
+        query: Optional[str],
+        document_id: Optional[str],
+        validation_rules: Tuple[
+            Type[ASTValidationRule], ...
+        ] = _DEFAULT_VALIDATION_RULES,
+    ) -> Tuple[str, CachedOperation]:
+        """Return the query text and precompiled operation for a request.
+
+        Args:
+            query: The query text of the request, used when no id is given.
+            document_id: The id of the requested document.
+            validation_rules: The validation rules of the request. The
+                operation holds the errors of the document for these rules.
+
+        Raises:
+            GraphQLError: If the operation is not part of the trusted documents
+        """
+        if document_id is None and query is not None:
+            document_id = self._ids_by_query.get(query)
+
+        operation = self._operations.get(document_id) if document_id else None
+
+        if operation is None:
+            raise GraphQLError(
+                "Only trusted documents are allowed",
+                extensions={"code": "TRUSTED_DOCUMENT_NOT_FOUND"},
+            )
+
+        if validation_rules != _DEFAULT_VALIDATION_RULES:
+            operation = self._get_operation_for_rules(
+                document_id,  # type: ignore[arg-type]
+                operation,
+                validation_rules,
+            )
+
+        return self.documents[document_id], operation  # type: ignore[index]
+
+    def _get_operation_for_rules(
+        self,
+        document_id: str,
+        operation: CachedOperation,
+        validation_rules: Tuple[Type[ASTValidationRule], ...],
+    ) -> CachedOperation:
+        key = (document_id, validation_rules)
+        operation_for_rules = self._operations_by_rules.get(key)
+
+        if operation_for_rules is None:
+            assert self._schema is not None
+
+            # validation is disabled when there are no rules
+            errors = (
+                validate_document(self._schema, operation.document, validation_rules)
+                if validation_rules
+                else []
+            )
+            operation_for_rules = self._operations_by_rules[key] = CachedOperation(
+                document=operation.document,
+                errors=errors,
+                operation_types=operation.operation_types,
+            )
+
+        return operation_for_rules
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+
+__all__ = ["TrustedDocuments"]
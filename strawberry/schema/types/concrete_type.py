@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
-from typing import TYPE_CHECKING, Dict, Union
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Optional, Tuple, Union
 
 from graphql import GraphQLField, GraphQLInputField, GraphQLType
 
@@ -25,4 +25,66 @@ class ConcreteType:
 TypeMap = Dict[str, ConcreteType]
 
 
-__all__ = ["ConcreteType", "Field", "GraphQLType", "TypeMap"]
+class ConcreteTypeIndex:
+    """Index of the object types of a `TypeMap` by Python class.
+
+    Used to resolve the concrete type of unions and interfaces without
+    scanning the whole type map for each resolved object. The index is filled
+    lazily, when a class is first seen, so that it can be created while the
+    type map is still being built.
+    """
+
+    def __init__(self, type_map: TypeMap) -> None:
+        self.type_map = type_map
+        self._candidates: Dict[type, Tuple[ConcreteType, ...]] = {}
+
+    def get_candidates(self, cls: type) -> Tuple[ConcreteType, ...]:
+        """Return the object types that can be implemented by instances of `cls`.
+
+        That's the type of `cls` itself or, for generic types, all of their
+        specialisations in the schema.
+        """
+        candidates = self._candidates.get(cls)
+
+        if candidates is None:
+            from strawberry.types.base import StrawberryObjectDefinition
+
+            definition = cls.__strawberry_definition__  # type: ignore[attr-defined]
+            candidates = tuple(
+                concrete_type
+                for concrete_type in self.type_map.values()
+                if isinstance(concrete_type.definition, StrawberryObjectDefinition)
+                and (
+                    concrete_type.definition is definition
+                    or concrete_type.definition.concrete_of is definition
+                )
+            )
+            self._candidates[cls] = candidates
+
+        return candidates
+
+    def find(
+        self, root: Any, preferred: Iterable[GraphQLType] = ()
+    ) -> Optional[ConcreteType]:
+        """Find the object type implemented by `root`.
+
+        Types in `preferred` are checked first, in case an instance of a
+        generic type matches more than one of its specialisations.
+        """
+        candidates = self.get_candidates(type(root))
+
+        if len(candidates) > 1:
+            preferred = set(preferred)
+            candidates = sorted(
+                candidates,
+                key=lambda candidate: candidate.implementation not in preferred,
+            )
+
+        for candidate in candidates:
+            if candidate.definition.is_implemented_by(root):  # type: ignore[union-attr]
+                return candidate
+
+        return None
+
+
+__all__ = ["ConcreteType", "ConcreteTypeIndex", "Field", "GraphQLType", "TypeMap"]
@@ -5,11 +5,13 @@ import warnings
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
     List,
     Mapping,
     Optional,
+    Tuple,
     Union,
     cast,
 )
@@ -230,6 +232,147 @@ def convert_arguments(
     return kwargs
 
 
+ArgumentConverter = Callable[[Any], Any]
+ArgumentsConverter = Callable[[Mapping[str, Any]], Dict[str, Any]]
+
+
+def compile_argument_converter(
+    type_: Union[StrawberryType, type],
+    scalar_registry: Dict[object, Union[ScalarWrapper, ScalarDefinition]],
+    config: StrawberryConfig,
+    converters: Dict[type, ArgumentConverter],
+) -> Optional[ArgumentConverter]:
+    """Build a function doing the same as `convert_argument` for `type_`.
+
+    All the type inspection is done once, here. `None` is returned when values
+    of the type don't need to be converted. Converters for input types are
+    stored in `converters`, so that they are shared between all the fields
+    using them, and so that recursive input types can be compiled.
+    """
+    if isinstance(type_, StrawberryOptional):
+        return compile_argument_converter(
+            type_.of_type, scalar_registry, config, converters
+        )
+
+    if isinstance(type_, StrawberryList):
+        convert_item = compile_argument_converter(
+            type_.of_type, scalar_registry, config, converters
+        )
+
+        if convert_item is None:
+            return None
+
+        def convert_list(value: Any) -> Any:
+            if value is None or value is _deprecated_UNSET:
+                return value
+
+            return [convert_item(item) for item in value]
+
+        return convert_list
+
+    if is_scalar(type_, scalar_registry) or isinstance(type_, EnumDefinition):
+        return None
+
+    if isinstance(type_, LazyType):
+        return compile_argument_converter(
+            type_.resolve_type(), scalar_registry, config, converters
+        )
+
+    if hasattr(type_, "_enum_definition"):
+        return None
+
+    if has_object_definition(type_):
+        input_type = cast(type, type_)
+
+        if input_type in converters:
+            return converters[input_type]
+
+        fields: List[Tuple[str, str, Optional[ArgumentConverter]]] = []
+
+        def convert_input(value: Any) -> Any:
+            if value is None or value is _deprecated_UNSET:
+                return value
+
+            kwargs = {}
+
+            for graphql_name, python_name, convert_field in fields:
+                if graphql_name in value:
+                    field_value = value[graphql_name]
+                    kwargs[python_name] = (
+                        field_value
+                        if convert_field is None
+                        else convert_field(field_value)
+                    )
+
+            return input_type(**kwargs)
+
+        # registered before compiling the fields, as they can reference the
+        # input type itself
+        converters[input_type] = convert_input
+
+        type_definition = type_.__strawberry_definition__
+        fields.extend(
+            (
+                config.name_converter.from_field(field),
+                field.python_name,
+                compile_argument_converter(
+                    field.resolve_type(type_definition=type_definition),
+                    scalar_registry,
+                    config,
+                    converters,
+                ),
+            )
+            for field in type_definition.fields
+        )
+
+        return convert_input
+
+    # unsupported types are reported when converting the schema, or when
+    # calling `convert_argument`, as before
+    def convert_unsupported(value: Any) -> Any:
+        return convert_argument(value, type_, scalar_registry, config)
+
+    return convert_unsupported
+
+
+def compile_arguments_converter(
+    arguments: List[StrawberryArgument],
+    scalar_registry: Dict[object, Union[ScalarWrapper, ScalarDefinition]],
+    config: StrawberryConfig,
+    converters: Optional[Dict[type, ArgumentConverter]] = None,
+) -> ArgumentsConverter:
+    """Build a function doing the same as `convert_arguments` for `arguments`."""
+    if converters is None:
+        converters = {}
+
+    plan = [
+        (
+            config.name_converter.from_argument(argument),
+            argument.python_name,
+            compile_argument_converter(
+                argument.type, scalar_registry, config, converters
+            ),
+        )
+        for argument in arguments
+    ]
+
+    def convert(value: Mapping[str, Any]) -> Dict[str, Any]:
+        kwargs = {}
+
+        for name, python_name, convert_value in plan:
+            if name in value:
+                current_value = value[name]
+                kwargs[python_name] = (
+                    current_value
+                    if convert_value is None
+                    else convert_value(current_value)
+                )
+
+        return kwargs
+
+    return convert
+
+
 def argument(
     description: Optional[str] = None,
     name: Optional[str] = None,
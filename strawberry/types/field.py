@@ -23,8 +23,13 @@ from typing import (
 )
 
 from strawberry.annotation import StrawberryAnnotation
-from strawberry.exceptions import InvalidArgumentTypeError, InvalidDefaultFactoryError
+from strawberry.exceptions import (
+    InvalidArgumentTypeError,
+    InvalidBatchResolverError,
+    InvalidDefaultFactoryError,
+)
 from strawberry.types.base import (
+    StrawberryList,
     StrawberryType,
     WithStrawberryObjectDefinition,
     has_object_definition,
@@ -94,6 +99,7 @@ class StrawberryField(dataclasses.Field):
         deprecation_reason: Optional[str] = None,
         directives: Sequence[object] = (),
         extensions: List[FieldExtension] = (),  # type: ignore
+        batch: bool = False,
     ) -> None:
         # basic fields are fields with no provided resolver
         is_basic_field = not base_resolver
@@ -141,6 +147,8 @@ class StrawberryField(dataclasses.Field):
                 raise InvalidDefaultFactoryError from exc
 
         self.is_subscription = is_subscription
+        # batch resolvers are called with the list of parents at once
+        self.is_batch = batch
 
         self.permission_classes: List[Type[BasePermission]] = list(permission_classes)
         self.directives = list(directives)
@@ -181,6 +189,7 @@ class StrawberryField(dataclasses.Field):
             deprecation_reason=self.deprecation_reason,
             directives=self.directives[:] if self.directives is not None else [],
             extensions=self.extensions[:] if self.extensions is not None else [],
+            batch=self.is_batch,
         )
         new_field._arguments = (
             self._arguments[:] if self._arguments is not None else None
@@ -357,6 +366,20 @@ class StrawberryField(dataclasses.Field):
                 # which is the same behaviour as having no type information.
                 resolved = self.base_resolver.type
 
+            # batch resolvers return a list, with the value for each parent,
+            # the resolver's annotation is added to the class when the field
+            # doesn't have one
+            if (
+                self.is_batch
+                and self.base_resolver is not None
+                and self.type_annotation in (None, self.base_resolver.type_annotation)
+                and resolved is not UNRESOLVED
+            ):
+                if not isinstance(resolved, StrawberryList):
+                    raise InvalidBatchResolverError(self.base_resolver.name)
+
+                resolved = resolved.of_type
+
         # If this is a generic field, try to resolve it using its origin's
         # specialized type_var_map
         # TODO: should we check arguments here too?
@@ -439,6 +462,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[List[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    batch: bool = False,
 ) -> T: ...
 
 
@@ -458,6 +482,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[List[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    batch: bool = False,
 ) -> T: ...
 
 
@@ -476,6 +501,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[List[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    batch: bool = False,
 ) -> Any: ...
 
 
@@ -494,6 +520,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[List[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    batch: bool = False,
 ) -> StrawberryField: ...
 
 
@@ -512,6 +539,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[List[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    batch: bool = False,
 ) -> StrawberryField: ...
 
 
@@ -529,6 +557,7 @@ def field(
     directives: Optional[Sequence[object]] = (),
     extensions: Optional[List[FieldExtension]] = None,
     graphql_type: Optional[Any] = None,
+    batch: bool = False,
     # This init parameter is used by PyRight to determine whether this field
     # is added in the constructor or not. It is not used to change
     # any behavior at the moment.
@@ -550,6 +579,10 @@ def field(
         extensions: The extensions for the field.
         graphql_type: The GraphQL type for the field, useful when you want to use a
             different type in the resolver than the one in the schema.
+        batch: Whether the resolver is called once with all the parents of the
+            field at the same level of the response, instead of once per
+            parent. It receives the list of parents instead of the parent, and
+            returns a list with the value for each of them.
         init: This parameter is used by PyRight to determine whether this field is
             added in the constructor or not. It is not used to change any behavior
             at the moment.
@@ -589,6 +622,7 @@ def field(
         metadata=metadata,
         directives=directives or (),
         extensions=extensions or [],
+        batch=batch,
     )
 
     if resolver:
@@ -17,6 +17,7 @@ from typing import (
 from typing_extensions import dataclass_transform
 
 from strawberry.exceptions import (
+    InvalidBatchResolverError,
     MissingFieldAnnotationError,
     MissingReturnAnnotationError,
     ObjectIsNotClassError,
@@ -63,6 +64,10 @@ def _check_field_annotations(cls: Type[Any]) -> None:
         # If the field is a StrawberryField we need to do a bit of extra work
         # to make sure dataclasses.dataclass is ready for it
         if isinstance(field_, StrawberryField):
+            # Batch fields call their resolver with the list of parents
+            if field_.is_batch and not field_.base_resolver:
+                raise InvalidBatchResolverError(field_name)
+
             # If the field has a type override then use that instead of using
             # the class annotations or resolver annotation
             if field_.type_annotation is not None:
@@ -3,7 +3,6 @@ from __future__ import annotations
 import itertools
 import sys
 import warnings
-from itertools import chain
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -46,7 +45,7 @@ if TYPE_CHECKING:
         GraphQLTypeResolver,
     )
 
-    from strawberry.schema.types.concrete_type import TypeMap
+    from strawberry.schema.types.concrete_type import ConcreteTypeIndex, TypeMap
 
 
 class StrawberryUnion(StrawberryType):
@@ -167,14 +166,19 @@ class StrawberryUnion(StrawberryType):
         """
         raise ValueError("Cannot use union type directly")
 
-    def get_type_resolver(self, type_map: TypeMap) -> GraphQLTypeResolver:
+    def get_type_resolver(
+        self, type_map: TypeMap, type_index: Optional[ConcreteTypeIndex] = None
+    ) -> GraphQLTypeResolver:
+        if type_index is None:
+            from strawberry.schema.types.concrete_type import ConcreteTypeIndex
+
+            type_index = ConcreteTypeIndex(type_map)
+
         def _resolve_union_type(
             root: Any, info: GraphQLResolveInfo, type_: GraphQLAbstractType
         ) -> str:
             assert isinstance(type_, GraphQLUnionType)
 
-            from strawberry.types.base import StrawberryObjectDefinition
-
             # If the type given is not an Object type, try resolving using `is_type_of`
             # defined on the union's inner types
             if not has_object_definition(root):
@@ -187,24 +191,13 @@ class StrawberryUnion(StrawberryType):
                 # Couldn't resolve using `is_type_of`
                 raise WrongReturnTypeForUnion(info.field_name, str(type(root)))
 
-            return_type: Optional[GraphQLType]
-
-            # Iterate over all of our known types and find the first concrete
-            # type that implements the type. We prioritise checking types named in the
-            # Union in case a nested generic object matches against more than one type.
-            concrete_types_for_union = (type_map[x.name] for x in type_.types)
-
-            for possible_concrete_type in chain(
-                concrete_types_for_union, type_map.values()
-            ):
-                possible_type = possible_concrete_type.definition
-                if not isinstance(possible_type, StrawberryObjectDefinition):
-                    continue
-                if possible_type.is_implemented_by(root):
-                    return_type = possible_concrete_type.implementation
-                    break
-            else:
-                return_type = None
+            # Find the concrete type that implements the type. We prioritise
+            # types named in the Union in case a nested generic object matches
+            # against more than one type.
+            concrete_type = type_index.find(root, preferred=type_.types)
+            return_type: Optional[GraphQLType] = (
+                concrete_type.implementation if concrete_type else None
+            )
 
             # Make sure the found type is expected by the Union
             if return_type is None or return_type not in type_.types:
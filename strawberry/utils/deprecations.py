@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import os
+import sys
 import warnings
+from pathlib import Path
 from typing import Any, Optional, Type
 
+_STRAWBERRY_DIR = f"{Path(__file__).parent.parent}{os.sep}"
+
 
 class DEPRECATION_MESSAGES:
     _TYPE_DEFINITION = (
@@ -27,4 +32,24 @@ class DeprecatedDescriptor:
         setattr(klass, self.attr_name, self)
 
 
-__all__ = ["DEPRECATION_MESSAGES", "DeprecatedDescriptor"]
+def get_user_stacklevel() -> int:
+    """Return the `stacklevel` of the first caller outside of strawberry.
+
+    Warnings raised from deep inside strawberry, for example while creating
+    the schema, can be reached through different call paths, so a fixed
+    `stacklevel` can't point at the user code that triggered them.
+    """
+    # 1 is the caller of this function, which calls `warnings.warn`
+    stacklevel = 1
+    frame = sys._getframe(1)
+
+    while frame.f_back is not None and frame.f_code.co_filename.startswith(
+        _STRAWBERRY_DIR
+    ):
+        frame = frame.f_back
+        stacklevel += 1
+
+    return stacklevel
+
+
+__all__ = ["DEPRECATION_MESSAGES", "DeprecatedDescriptor", "get_user_stacklevel"]
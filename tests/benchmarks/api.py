@@ -2,6 +2,8 @@ from typing import AsyncIterator, List
 
 import strawberry
 from strawberry.directive import DirectiveLocation
+from strawberry.schema.compiled_execution import CompiledExecutionContext
+from strawberry.schema.operation_cache import OperationCache
 
 
 @strawberry.type
@@ -88,3 +90,9 @@ schema = strawberry.Schema(query=Query, subscription=Subscription)
 schema_with_directives = strawberry.Schema(
     query=Query, directives=[uppercase], subscription=Subscription
 )
+compiled_schema = strawberry.Schema(
+    query=Query,
+    subscription=Subscription,
+    operation_cache=OperationCache(),
+    execution_context_class=CompiledExecutionContext,
+)
@@ -3,7 +3,7 @@ from pathlib import Path
 import pytest
 from pytest_codspeed.plugin import BenchmarkFixture
 
-from .api import schema, schema_with_directives
+from .api import compiled_schema, schema, schema_with_directives
 
 ROOT = Path(__file__).parent / "queries"
 
@@ -41,3 +41,8 @@ def test_execute_with_100_items(benchmark: BenchmarkFixture):
 @pytest.mark.benchmark
 def test_execute_with_1000_items(benchmark: BenchmarkFixture):
     benchmark(schema.execute_sync, items_query, variable_values={"count": 1000})
+
+
+@pytest.mark.benchmark
+def test_execute_with_100_items_compiled(benchmark: BenchmarkFixture):
+    benchmark(compiled_schema.execute_sync, items_query, variable_values={"count": 100})
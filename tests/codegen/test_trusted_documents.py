@@ -0,0 +1,56 @@
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict
+
+from strawberry.codegen import QueryCodegen
+from strawberry.codegen.plugins.trusted_documents import TrustedDocumentsPlugin
+from strawberry.schema.trusted_documents import TrustedDocuments
+
+HERE = Path(__file__).parent
+
+
+def test_generates_manifest_for_all_queries(schema):
+    queries = [HERE / "queries" / "basic.graphql", HERE / "queries" / "enum.graphql"]
+    documents: Dict[str, str] = {}
+
+    for query in queries:
+        generator = QueryCodegen(
+            schema, plugins=[TrustedDocumentsPlugin(query, documents=documents)]
+        )
+        result = generator.run(query.read_text())
+
+    assert [file.path for file in result.files] == ["trusted_documents.json"]
+
+    manifest = json.loads(result.files[0].content)
+
+    assert manifest == {
+        hashlib.sha256(query.read_text().encode()).hexdigest(): query.read_text()
+        for query in queries
+    }
+
+
+def test_manifest_can_be_loaded_as_trusted_documents(schema, tmp_path: Path):
+    query = HERE / "queries" / "basic.graphql"
+
+    generator = QueryCodegen(schema, plugins=[TrustedDocumentsPlugin(query)])
+    generator.run(query.read_text()).write(tmp_path)
+
+    trusted_documents = TrustedDocuments.from_file(tmp_path / "trusted_documents.json")
+
+    assert len(trusted_documents) == 1
+    trusted_documents.compile(schema._schema)
+
+
+def test_plugins_only_share_the_documents_they_are_given(schema):
+    basic = HERE / "queries" / "basic.graphql"
+    enum = HERE / "queries" / "enum.graphql"
+
+    QueryCodegen(schema, plugins=[TrustedDocumentsPlugin(basic)]).run(basic.read_text())
+    result = QueryCodegen(schema, plugins=[TrustedDocumentsPlugin(enum)]).run(
+        enum.read_text()
+    )
+
+    assert json.loads(result.files[0].content) == {
+        hashlib.sha256(enum.read_text().encode()).hexdigest(): enum.read_text()
+    }
@@ -1,3 +1,4 @@
+import asyncio
 import typing
 
 from graphql import located_error
@@ -495,3 +496,196 @@ async def test_can_use_async_resolve_reference_multiple_representations():
     assert not result.errors
 
     assert result.data == {"_entities": [{"upc": "B00005N5PF"}, {"upc": "B00005N5PG"}]}
+
+
+def test_resolve_references_is_called_once_per_type():
+    calls = []
+
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+        @classmethod
+        def resolve_references(
+            cls, representations: typing.List[typing.Dict[str, typing.Any]]
+        ) -> typing.List[typing.Union["Product", Exception]]:
+            calls.append([representation["upc"] for representation in representations])
+
+            return [
+                Product(upc=representation["upc"])
+                if representation["upc"]
+                else ValueError("Missing upc")
+                for representation in representations
+            ]
+
+    @strawberry.federation.type(keys=["id"])
+    class Review:
+        id: strawberry.ID
+
+        @classmethod
+        def resolve_reference(cls, id: strawberry.ID) -> "Review":
+            return Review(id=id)
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self, first: int) -> typing.List[Product]:
+            return []
+
+    schema = strawberry.federation.Schema(
+        query=Query, types=[Review], enable_federation_2=True
+    )
+
+    query = """
+        query ($representations: [_Any!]!) {
+            _entities(representations: $representations) {
+                ... on Product { upc }
+                ... on Review { id }
+            }
+        }
+    """
+
+    result = schema.execute_sync(
+        query,
+        variable_values={
+            "representations": [
+                {"__typename": "Product", "upc": "1"},
+                {"__typename": "Review", "id": "2"},
+                {"__typename": "Product", "upc": ""},
+                {"__typename": "Product", "upc": "3"},
+            ]
+        },
+    )
+
+    assert result.data == {"_entities": [{"upc": "1"}, {"id": "2"}, None, {"upc": "3"}]}
+    assert [error.message for error in result.errors] == ["Missing upc"]
+    assert result.errors[0].path == ["_entities", 2]
+    assert calls == [["1", "", "3"]]
+
+
+async def test_async_resolve_references_run_concurrently():
+    product_started = asyncio.Event()
+
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+        @classmethod
+        async def resolve_references(
+            cls,
+            representations: typing.List[typing.Dict[str, typing.Any]],
+            info: strawberry.Info,
+        ) -> typing.List["Product"]:
+            assert info.field_name == "_entities"
+            product_started.set()
+            return [
+                Product(upc=representation["upc"]) for representation in representations
+            ]
+
+    @strawberry.federation.type(keys=["id"])
+    class Review:
+        id: strawberry.ID
+
+        @classmethod
+        async def resolve_references(
+            cls, representations: typing.List[typing.Dict[str, typing.Any]]
+        ) -> typing.List["Review"]:
+            # only finishes if the products are resolved at the same time
+            await asyncio.wait_for(product_started.wait(), timeout=1)
+            return [
+                Review(id=representation["id"]) for representation in representations
+            ]
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self, first: int) -> typing.List[Product]:
+            return []
+
+    schema = strawberry.federation.Schema(
+        query=Query, types=[Review], enable_federation_2=True
+    )
+
+    query = """
+        query ($representations: [_Any!]!) {
+            _entities(representations: $representations) {
+                ... on Product { upc }
+                ... on Review { id }
+            }
+        }
+    """
+
+    result = await schema.execute(
+        query,
+        variable_values={
+            "representations": [
+                {"__typename": "Review", "id": "1"},
+                {"__typename": "Product", "upc": "2"},
+            ]
+        },
+    )
+
+    assert not result.errors
+    assert result.data == {"_entities": [{"id": "1"}, {"upc": "2"}]}
+
+
+async def test_failing_resolve_references():
+    @strawberry.federation.type(keys=["upc"])
+    class Product:
+        upc: str
+
+        @classmethod
+        async def resolve_references(
+            cls, representations: typing.List[typing.Dict[str, typing.Any]]
+        ) -> typing.List["Product"]:
+            raise ValueError("Failed")
+
+    @strawberry.federation.type(keys=["id"])
+    class Review:
+        id: strawberry.ID
+
+        @classmethod
+        def resolve_references(
+            cls, representations: typing.List[typing.Dict[str, typing.Any]]
+        ) -> typing.List["Review"]:
+            return []
+
+    @strawberry.federation.type(extend=True)
+    class Query:
+        @strawberry.field
+        def top_products(self, first: int) -> typing.List[Product]:
+            return []
+
+    schema = strawberry.federation.Schema(
+        query=Query, types=[Review], enable_federation_2=True
+    )
+
+    query = """
+        query ($representations: [_Any!]!) {
+            _entities(representations: $representations) {
+                ... on Product { upc }
+                ... on Review { id }
+            }
+        }
+    """
+
+    result = await schema.execute(
+        query,
+        variable_values={
+            "representations": [
+                {"__typename": "Product", "upc": "1"},
+                {"__typename": "Review", "id": "2"},
+                {"__typename": "Product", "upc": "3"},
+            ]
+        },
+    )
+
+    assert result.data == {"_entities": [None, None, None]}
+    assert sorted((error.path[1], error.message) for error in result.errors) == [
+        (0, "Failed"),
+        (
+            1,
+            "Received wrong number of results in dataloader, expected: 1, received: 0",
+        ),
+        (2, "Failed"),
+    ]
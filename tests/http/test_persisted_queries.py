@@ -0,0 +1,165 @@
+import gc
+import hashlib
+import json
+import warnings
+from typing import Optional
+from urllib.parse import urlencode
+
+import pytest
+from pytest_mock import MockFixture
+
+from strawberry.http.persisted_queries import InMemoryPersistedQueryStore
+
+from .clients.base import HttpClient
+
+QUERY = "{ hello }"
+QUERY_HASH = hashlib.sha256(QUERY.encode()).hexdigest()
+
+
+@pytest.fixture()
+def store(mocker: MockFixture) -> InMemoryPersistedQueryStore:
+    store = InMemoryPersistedQueryStore()
+
+    mocker.patch("strawberry.http.base.BaseView.persisted_query_store", store)
+
+    return store
+
+
+def _extensions(sha256_hash: str = QUERY_HASH) -> dict:
+    return {"persistedQuery": {"version": 1, "sha256Hash": sha256_hash}}
+
+
+async def test_unknown_hash_returns_persisted_query_not_found(
+    http_client: HttpClient, store: InMemoryPersistedQueryStore
+):
+    response = await http_client.post(
+        url="/graphql",
+        json={"extensions": _extensions()},
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] is None
+    assert response.json["errors"] == [
+        {
+            "message": "PersistedQueryNotFound",
+            "extensions": {"code": "PERSISTED_QUERY_NOT_FOUND"},
+        }
+    ]
+
+
+async def test_registers_and_uses_persisted_query_via_post(
+    http_client: HttpClient, store: InMemoryPersistedQueryStore
+):
+    response = await http_client.post(
+        url="/graphql",
+        json={"query": QUERY, "extensions": _extensions()},
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello world"}
+    assert store.get(QUERY_HASH) == QUERY
+
+    response = await http_client.post(
+        url="/graphql",
+        json={"extensions": _extensions()},
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello world"}
+
+
+async def test_uses_persisted_query_via_get(
+    http_client: HttpClient, store: InMemoryPersistedQueryStore
+):
+    store.set(QUERY_HASH, QUERY)
+
+    params = urlencode({"extensions": json.dumps(_extensions())})
+    response = await http_client.get(
+        url=f"/graphql?{params}", headers={"Accept": "application/json"}
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello world"}
+
+
+async def test_rejects_query_that_does_not_match_hash(
+    http_client: HttpClient, store: InMemoryPersistedQueryStore
+):
+    response = await http_client.post(
+        url="/graphql",
+        json={"query": QUERY, "extensions": _extensions("not-the-hash")},
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 400
+    assert "Provided sha does not match query" in response.text
+    assert len(store) == 0
+
+
+async def test_persisted_queries_are_disabled_by_default(http_client: HttpClient):
+    response = await http_client.post(
+        url="/graphql",
+        json={"extensions": _extensions()},
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 400
+    assert "No GraphQL query found in the request" in response.text
+
+
+def test_in_memory_store_evicts_least_recently_used():
+    store = InMemoryPersistedQueryStore(maxsize=2)
+
+    store.set("a", "{ a }")
+    store.set("b", "{ b }")
+    assert store.get("a") == "{ a }"
+
+    store.set("c", "{ c }")
+
+    assert store.get("b") is None
+    assert store.get("a") == "{ a }"
+    assert store.get("c") == "{ c }"
+
+
+class AsyncStore:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def get(self, sha256_hash: str) -> Optional[str]:  # pragma: no cover
+        self.calls += 1
+        return QUERY
+
+    async def set(self, sha256_hash: str, query: str) -> None:  # pragma: no cover
+        self.calls += 1
+
+
+@pytest.mark.parametrize("query", [None, QUERY])
+def test_sync_view_rejects_async_store_without_calling_it(query: Optional[str]):
+    pytest.importorskip("flask")
+
+    from strawberry.flask.views import GraphQLView
+    from strawberry.http import GraphQLRequestData
+    from tests.views.schema import schema
+
+    class View(GraphQLView):
+        persisted_query_store = AsyncStore()
+
+    request_data = GraphQLRequestData(
+        query=query, variables=None, operation_name=None, extensions=_extensions()
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+
+        with pytest.raises(
+            RuntimeError,
+            match="Async persisted query stores are not supported in sync mode",
+        ):
+            View(schema=schema).resolve_persisted_query(request_data)
+
+        gc.collect()
+
+    assert View.persisted_query_store.calls == 0
@@ -0,0 +1,68 @@
+import json
+from urllib.parse import urlencode
+
+import pytest
+from pytest_mock import MockFixture
+
+from strawberry.schema.trusted_documents import TrustedDocuments
+from tests.views.schema import schema
+
+from .clients.base import HttpClient
+
+QUERY = "{ hello }"
+QUERY_ID = TrustedDocuments.hash_document(QUERY)
+
+
+@pytest.fixture(autouse=True)
+def trusted_documents(mocker: MockFixture) -> TrustedDocuments:
+    trusted_documents = TrustedDocuments({QUERY_ID: QUERY})
+    trusted_documents.compile(schema._schema)
+
+    mocker.patch.object(schema, "trusted_documents", trusted_documents)
+
+    return trusted_documents
+
+
+async def test_executes_document_id_via_post(http_client: HttpClient):
+    response = await http_client.post(
+        url="/graphql",
+        json={"documentId": QUERY_ID},
+        headers={"Content-Type": "application/json"},
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello world"}
+
+
+async def test_executes_document_id_via_get(http_client: HttpClient):
+    params = urlencode({"documentId": QUERY_ID})
+    response = await http_client.get(
+        url=f"/graphql?{params}", headers={"Accept": "application/json"}
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello world"}
+
+
+async def test_executes_persisted_query_hash(http_client: HttpClient):
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": QUERY_ID}}
+    params = urlencode({"extensions": json.dumps(extensions)})
+    response = await http_client.get(
+        url=f"/graphql?{params}", headers={"Accept": "application/json"}
+    )
+
+    assert response.status_code == 200
+    assert response.json["data"] == {"hello": "Hello world"}
+
+
+async def test_rejects_untrusted_query(http_client: HttpClient):
+    response = await http_client.query(query="{ helloAsync }")
+
+    assert response.status_code == 200
+    assert response.json["data"] is None
+    assert response.json["errors"] == [
+        {
+            "message": "Only trusted documents are allowed",
+            "extensions": {"code": "TRUSTED_DOCUMENT_NOT_FOUND"},
+        }
+    ]
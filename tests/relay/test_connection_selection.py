@@ -0,0 +1,197 @@
+from typing import Any, AsyncGenerator, Iterable, List
+
+import pytest
+
+import strawberry
+from strawberry import relay
+from strawberry.relay.utils import ConnectionSelection, get_connection_selection
+from strawberry.schema.operation_cache import OperationCache
+from strawberry.types import Info
+
+
+@strawberry.type
+class Item(relay.Node):
+    id: relay.NodeID[int]
+
+
+class CountableItems:
+    """Mimics a django queryset, counted with a query."""
+
+    def __init__(self, size: int) -> None:
+        self.items = [Item(id=i) for i in range(size)]
+        self.count_calls = 0
+        self.iterations = 0
+
+    def __iter__(self):
+        self.iterations += 1
+        return iter(self.items)
+
+    def __getitem__(self, key: slice) -> List[Item]:
+        self.iterations += 1
+        return self.items[key]
+
+    def count(self) -> int:
+        self.count_calls += 1
+        return len(self.items)
+
+
+selections: List[ConnectionSelection] = []
+
+
+@strawberry.type(name="RecordingConnection")
+class RecordingConnection(relay.ListConnection[relay.NodeType]):
+    @classmethod
+    def resolve_connection(cls, nodes: Any, *, info: Info, **kwargs: Any) -> Any:
+        selections.append(get_connection_selection(info))
+        return super().resolve_connection(nodes, info=info, **kwargs)
+
+
+countable_items = CountableItems(0)
+
+
+@strawberry.type
+class Query:
+    @relay.connection(relay.ListConnectionWithTotalCount[Item])
+    def items(self) -> List[Item]:
+        return [Item(id=i) for i in range(5)]
+
+    @relay.connection(relay.ListConnectionWithTotalCount[Item])
+    def countable_items(self) -> Iterable[Item]:
+        return countable_items
+
+    @relay.connection(relay.ListConnectionWithTotalCount[Item])
+    def generated_items(self) -> Iterable[Item]:
+        return (Item(id=i) for i in range(5))
+
+    @relay.connection(relay.ListConnectionWithTotalCount[Item])
+    async def async_items(self) -> AsyncGenerator[Item, None]:
+        for i in range(5):
+            yield Item(id=i)
+
+    @relay.connection(RecordingConnection[Item])
+    def recorded_items(self) -> List[Item]:
+        return [Item(id=i) for i in range(5)]
+
+
+schema = strawberry.Schema(query=Query, operation_cache=OperationCache())
+
+
+@pytest.fixture(autouse=True)
+def reset():
+    global countable_items
+    countable_items = CountableItems(7)
+    selections.clear()
+
+
+def test_connections_with_and_without_total_count_can_be_used_together():
+    @strawberry.type
+    class Query:
+        @relay.connection(relay.ListConnection[Item])
+        def items(self) -> List[Item]:
+            return [Item(id=i) for i in range(5)]
+
+        @relay.connection(relay.ListConnectionWithTotalCount[Item])
+        def counted_items(self) -> List[Item]:
+            return [Item(id=i) for i in range(5)]
+
+    schema = strawberry.Schema(query=Query)
+
+    assert schema.get_type_by_name("ItemConnection") is not None
+    assert schema.get_type_by_name("ItemCountableConnection") is not None
+
+    result = schema.execute_sync(
+        "{ items { edges { node { id } } } countedItems { totalCount } }"
+    )
+
+    assert result.errors is None
+    assert len(result.data["items"]["edges"]) == 5
+    assert result.data["countedItems"] == {"totalCount": 5}
+
+
+def test_total_count():
+    result = schema.execute_sync(
+        "{ items(first: 2) { totalCount edges { node { id } } } }"
+    )
+
+    assert result.errors is None
+    assert result.data["items"]["totalCount"] == 5
+    assert len(result.data["items"]["edges"]) == 2
+
+
+def test_total_count_is_only_computed_when_requested():
+    result = schema.execute_sync(
+        "{ countableItems(first: 2) { pageInfo { hasNextPage } } }"
+    )
+
+    assert result.errors is None
+    assert countable_items.count_calls == 0
+    assert countable_items.iterations == 1
+
+    result = schema.execute_sync("{ countableItems { totalCount } }")
+
+    assert result.errors is None
+    assert result.data == {"countableItems": {"totalCount": 7}}
+    assert countable_items.count_calls == 1
+    # the page isn't fetched when only the count is requested
+    assert countable_items.iterations == 1
+
+
+def test_total_count_of_an_iterator():
+    result = schema.execute_sync("{ generatedItems { totalCount } }")
+
+    assert result.errors is None
+    assert result.data == {"generatedItems": {"totalCount": None}}
+
+
+async def test_total_count_async():
+    result = await schema.execute(
+        "{ asyncItems(last: 2) { totalCount edges { node { id } } } }"
+    )
+
+    assert result.errors is None
+    assert result.data["asyncItems"]["totalCount"] is None
+    assert len(result.data["asyncItems"]["edges"]) == 2
+
+
+@pytest.mark.parametrize(
+    ("query", "expected"),
+    [
+        ("{ recordedItems { edges { cursor } } }", (True, False, False)),
+        ("{ recordedItems { pageInfo { hasNextPage } } }", (False, True, False)),
+        ("{ recordedItems { __typename } }", (False, False, False)),
+        (
+            "{ recordedItems { ... on ItemRecordingConnection { edges { cursor } } } }",
+            (True, False, False),
+        ),
+        (
+            """
+            { recordedItems { ...Page } }
+            fragment Page on ItemRecordingConnection { ...Info }
+            fragment Info on ItemRecordingConnection { pageInfo { endCursor } }
+            """,
+            (False, True, False),
+        ),
+        (
+            "{ a: recordedItems { edges { cursor } } a: recordedItems { pageInfo { endCursor } } }",
+            (True, True, False),
+        ),
+    ],
+)
+def test_connection_selection(query: str, expected: Any):
+    result = schema.execute_sync(query)
+
+    assert result.errors is None
+    assert len(selections) == 1
+    selection = selections[0]
+    assert (selection.edges, selection.page_info, selection.total_count) == expected
+
+
+def test_connection_selection_is_cached():
+    query = "{ recordedItems { edges { cursor } } }"
+
+    for _ in range(2):
+        result = schema.execute_sync(query)
+        assert result.errors is None
+
+    assert len(selections) == 2
+    assert selections[0] is selections[1]
@@ -0,0 +1,202 @@
+from typing import Any, AsyncGenerator, Iterable, List, Optional, Tuple
+
+import pytest
+
+import strawberry
+from strawberry import relay
+from strawberry.relay.types import KEYSET_PREFIX
+from strawberry.relay.utils import to_base64
+from strawberry.types import Info
+
+
+@strawberry.type
+class Book(relay.Node):
+    id: relay.NodeID[int]
+    year: int
+
+
+BOOKS = [Book(id=id_, year=2000 + id_ // 2) for id_ in range(1, 11)]
+
+
+@strawberry.type(name="BookConnection")
+class BookConnection(relay.KeysetConnection[Book]):
+    @classmethod
+    def resolve_cursor_key(cls, node: Book, *, info: Info, **kwargs: Any) -> Tuple:
+        return (node.year, node.id)
+
+
+@strawberry.type(name="RecordingConnection")
+class RecordingConnection(BookConnection):
+    calls = []
+
+    @classmethod
+    def resolve_keyset(cls, nodes: Any, **kwargs: Any) -> Any:
+        cls.calls.append(
+            {key: kwargs[key] for key in ("after", "before", "limit", "reverse")}
+        )
+        return super().resolve_keyset(nodes, **kwargs)
+
+
+@strawberry.type
+class Query:
+    @relay.connection(BookConnection)
+    def books(self) -> Iterable[Book]:
+        return iter(BOOKS)
+
+    @relay.connection(BookConnection)
+    async def books_async(self) -> AsyncGenerator[Book, None]:
+        for book in BOOKS:
+            yield book
+
+    @relay.connection(RecordingConnection)
+    def recorded_books(self) -> List[Book]:
+        return BOOKS
+
+
+schema = strawberry.Schema(query=Query)
+
+QUERY = """
+query ($first: Int, $last: Int, $after: String, $before: String) {
+    %s(first: $first, last: $last, after: $after, before: $before) {
+        edges { cursor node { id } }
+        pageInfo { hasNextPage hasPreviousPage startCursor endCursor }
+    }
+}
+"""
+
+
+def cursor(book_id: int) -> str:
+    return BookConnection.encode_cursor((BOOKS[book_id - 1].year, book_id))
+
+
+def execute(field: str = "books", **variables: Optional[Any]) -> Any:
+    result = schema.execute_sync(QUERY % field, variable_values=variables)
+    assert result.errors is None
+    return result.data[field]
+
+
+def get_ids(connection: Any) -> List[int]:
+    return [
+        int(relay.GlobalID.from_id(edge["node"]["id"]).node_id)
+        for edge in connection["edges"]
+    ]
+
+
+def test_can_be_used_with_list_connections_of_the_same_type():
+    @strawberry.type
+    class Query:
+        @relay.connection(relay.ListConnection[Book])
+        def books(self) -> List[Book]:
+            return BOOKS
+
+        @relay.connection(relay.KeysetConnection[Book])
+        def books_by_key(self) -> List[Book]:
+            return BOOKS
+
+    schema = strawberry.Schema(query=Query)
+
+    assert schema.get_type_by_name("BookConnection") is not None
+    assert schema.get_type_by_name("BookKeysetConnection") is not None
+
+
+def test_cursors_encode_the_key():
+    assert BookConnection.decode_cursor(cursor(3)) == (2001, 3)
+
+    connection = execute(first=2)
+
+    assert get_ids(connection) == [1, 2]
+    assert connection["edges"][0]["cursor"] == cursor(1)
+    assert connection["pageInfo"] == {
+        "hasNextPage": True,
+        "hasPreviousPage": False,
+        "startCursor": cursor(1),
+        "endCursor": cursor(2),
+    }
+
+
+def test_first_with_after():
+    connection = execute(first=3, after=cursor(2))
+
+    assert get_ids(connection) == [3, 4, 5]
+    assert connection["pageInfo"]["hasNextPage"] is True
+    assert connection["pageInfo"]["hasPreviousPage"] is True
+
+    connection = execute(first=3, after=cursor(8))
+
+    assert get_ids(connection) == [9, 10]
+    assert connection["pageInfo"]["hasNextPage"] is False
+
+
+def test_last():
+    connection = execute(last=3)
+
+    assert get_ids(connection) == [8, 9, 10]
+    assert connection["pageInfo"]["hasNextPage"] is False
+    assert connection["pageInfo"]["hasPreviousPage"] is True
+
+
+def test_last_with_before_and_after():
+    connection = execute(last=3, before=cursor(5))
+
+    assert get_ids(connection) == [2, 3, 4]
+    assert connection["pageInfo"]["hasNextPage"] is True
+    assert connection["pageInfo"]["hasPreviousPage"] is True
+
+    connection = execute(last=3, before=cursor(5), after=cursor(2))
+
+    assert get_ids(connection) == [3, 4]
+    assert connection["pageInfo"]["hasPreviousPage"] is False
+
+
+def test_first_and_last():
+    connection = execute(first=4, last=2)
+
+    assert get_ids(connection) == [3, 4]
+    assert connection["pageInfo"]["hasNextPage"] is True
+    assert connection["pageInfo"]["hasPreviousPage"] is True
+
+
+async def test_async_iterable():
+    result = await schema.execute(
+        QUERY % "booksAsync", variable_values={"last": 2, "before": cursor(4)}
+    )
+
+    assert result.errors is None
+    assert get_ids(result.data["booksAsync"]) == [2, 3]
+
+    result = await schema.execute(
+        QUERY % "booksAsync", variable_values={"first": 2, "after": cursor(4)}
+    )
+
+    assert result.errors is None
+    assert get_ids(result.data["booksAsync"]) == [5, 6]
+
+
+def test_resolve_keyset_receives_the_decoded_keys():
+    RecordingConnection.calls.clear()
+
+    execute("recordedBooks", first=2, after=cursor(2))
+    execute("recordedBooks", last=5, before=cursor(9))
+    execute("recordedBooks")
+
+    assert RecordingConnection.calls == [
+        {"after": (2001, 2), "before": None, "limit": 3, "reverse": False},
+        {"after": None, "before": (2004, 9), "limit": 6, "reverse": True},
+        {"after": None, "before": None, "limit": 101, "reverse": False},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("variables", "message"),
+    [
+        ({"after": to_base64("arrayconnection", 1)}, "Argument 'after' contains"),
+        ({"before": to_base64(KEYSET_PREFIX, "{}")}, "Argument 'before' contains"),
+        ({"first": -1}, "Argument 'first' must be a non-negative integer."),
+        ({"last": 101}, "Argument 'last' cannot be higher than 100."),
+    ],
+)
+def test_invalid_arguments(variables: Any, message: str):
+    result = schema.execute_sync(QUERY % "books", variable_values=variables)
+
+    assert result.errors is not None
+    assert result.errors[0].message.startswith(message)
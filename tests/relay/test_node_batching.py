@@ -0,0 +1,217 @@
+from typing import Any, Iterable, List, Optional
+
+import pytest
+
+import strawberry
+from strawberry import relay
+from strawberry.relay.utils import to_base64
+from strawberry.schema.sync_batching_execution import SyncBatchingExecutionContext
+from strawberry.types import Info
+
+calls: List[Any] = []
+selections: List[Any] = []
+
+
+@strawberry.type
+class Author(relay.Node):
+    id: relay.NodeID[int]
+
+    @classmethod
+    def resolve_nodes(
+        cls, *, info: Info, node_ids: Iterable[str], required: bool = False
+    ) -> List[Optional["Author"]]:
+        node_ids = list(node_ids)
+        calls.append(("Author", node_ids, required))
+        selections.append(
+            [selection.name for selection in info.selected_fields[0].selections]
+        )
+
+        if required and "0" in node_ids:
+            raise ValueError("Author not found")
+
+        return [
+            Author(id=int(node_id)) if node_id != "0" else None for node_id in node_ids
+        ]
+
+
+@strawberry.type
+class Book(relay.Node):
+    id: relay.NodeID[int]
+
+    @classmethod
+    async def resolve_nodes(
+        cls, *, info: Info, node_ids: Iterable[str], required: bool = False
+    ) -> List[Optional["Book"]]:
+        node_ids = list(node_ids)
+        calls.append(("Book", node_ids, required))
+        return [Book(id=int(node_id)) for node_id in node_ids]
+
+    @strawberry.field
+    async def author(self, info: Info) -> Author:
+        return await relay.GlobalID("Author", str(self.id * 10)).resolve_node(
+            info, ensure_type=Author
+        )
+
+
+@strawberry.type
+class Chapter(relay.Node):
+    id: relay.NodeID[int]
+
+    @classmethod
+    def resolve_node(
+        cls, node_id: str, *, info: Info, required: bool = False
+    ) -> "Chapter":
+        calls.append(("Chapter", node_id, required))
+        return Chapter(id=int(node_id))
+
+
+def create_schema(**kwargs: Any) -> strawberry.Schema:
+    @strawberry.type
+    class Query:
+        node: relay.Node = relay.node()
+        optional_node: Optional[relay.Node] = relay.node()
+        nodes: List[relay.Node] = relay.node()
+
+    return strawberry.Schema(query=Query, types=[Author, Book, Chapter], **kwargs)
+
+
+schema = create_schema()
+sync_batching_schema = create_schema(
+    execution_context_class=SyncBatchingExecutionContext
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_calls():
+    calls.clear()
+    selections.clear()
+
+
+def gid(type_name: str, node_id: int) -> str:
+    return to_base64(type_name, node_id)
+
+
+async def test_node_fields_are_batched_by_type():
+    result = await schema.execute(
+        f"""{{
+            a: node(id: "{gid("Author", 1)}") {{ id }}
+            b: node(id: "{gid("Book", 1)}") {{ id }}
+            c: node(id: "{gid("Author", 2)}") {{ id }}
+            d: node(id: "{gid("Book", 2)}") {{ id }}
+            e: node(id: "{gid("Author", 1)}") {{ id }}
+            f: nodes(ids: ["{gid("Author", 3)}", "{gid("Book", 3)}"]) {{ id }}
+        }}"""
+    )
+
+    assert result.errors is None
+    assert result.data == {
+        "a": {"id": gid("Author", 1)},
+        "b": {"id": gid("Book", 1)},
+        "c": {"id": gid("Author", 2)},
+        "d": {"id": gid("Book", 2)},
+        "e": {"id": gid("Author", 1)},
+        "f": [{"id": gid("Author", 3)}, {"id": gid("Book", 3)}],
+    }
+    assert sorted(calls) == [
+        ("Author", ["1", "2", "3"], False),
+        ("Book", ["1", "2", "3"], False),
+    ]
+
+
+async def test_fields_with_different_selections_are_not_batched_together():
+    result = await schema.execute(
+        f"""{{
+            a: node(id: "{gid("Author", 1)}") {{ id }}
+            b: node(id: "{gid("Author", 2)}") {{ id __typename }}
+            c: node(id: "{gid("Author", 3)}") {{ id }}
+        }}"""
+    )
+
+    assert result.errors is None
+    assert sorted(zip(calls, selections)) == [
+        (("Author", ["1", "3"], False), ["id"]),
+        (("Author", ["2"], False), ["id", "__typename"]),
+    ]
+
+
+async def test_global_ids_resolved_in_nested_fields_are_batched():
+    result = await schema.execute(
+        f"""{{
+            nodes(ids: ["{gid("Book", 1)}", "{gid("Book", 2)}"]) {{
+                ... on Book {{ author {{ id }} }}
+            }}
+        }}"""
+    )
+
+    assert result.errors is None
+    assert result.data == {
+        "nodes": [
+            {"author": {"id": gid("Author", 10)}},
+            {"author": {"id": gid("Author", 20)}},
+        ]
+    }
+    assert calls == [("Book", ["1", "2"], False), ("Author", ["10", "20"], False)]
+
+
+async def test_missing_nodes_only_fail_their_field():
+    result = await schema.execute(
+        f"""{{
+            a: optionalNode(id: "{gid("Author", 1)}") {{ id }}
+            b: optionalNode(id: "{gid("Author", 0)}") {{ id }}
+            c: node(id: "{gid("Author", 0)}") {{ id }}
+        }}"""
+    )
+
+    assert result.data is None
+    assert [error.message for error in result.errors] == ["Author not found"]
+    assert result.errors[0].path == ["c"]
+    assert calls == [("Author", ["1", "0"], False), ("Author", ["0"], True)]
+
+    calls.clear()
+    result = await schema.execute(
+        f"""{{
+            a: optionalNode(id: "{gid("Author", 1)}") {{ id }}
+            b: optionalNode(id: "{gid("Author", 0)}") {{ id }}
+        }}"""
+    )
+
+    assert result.errors is None
+    assert result.data == {"a": {"id": gid("Author", 1)}, "b": None}
+
+
+async def test_types_overriding_resolve_node_are_not_batched():
+    result = await schema.execute(
+        f"""{{
+            a: node(id: "{gid("Chapter", 1)}") {{ id }}
+            b: node(id: "{gid("Chapter", 2)}") {{ id }}
+        }}"""
+    )
+
+    assert result.errors is None
+    assert calls == [("Chapter", "1", True), ("Chapter", "2", True)]
+
+
+def test_sync_batching_execution():
+    result = sync_batching_schema.execute_sync(
+        f"""{{
+            a: node(id: "{gid("Author", 1)}") {{ id }}
+            b: node(id: "{gid("Author", 2)}") {{ id }}
+            c: nodes(ids: ["{gid("Author", 3)}"]) {{ id }}
+        }}"""
+    )
+
+    assert result.errors is None
+    assert result.data["c"] == [{"id": gid("Author", 3)}]
+    assert calls == [("Author", ["1", "2", "3"], False)]
+
+
+def test_sync_execution_resolves_each_field():
+    result = schema.execute_sync(
+        f"""{{
+            a: node(id: "{gid("Author", 1)}") {{ id }}
+            b: node(id: "{gid("Author", 2)}") {{ id }}
+        }}"""
+    )
+
+    assert result.errors is None
+    assert calls == [("Author", ["1"], True), ("Author", ["2"], True)]
@@ -321,3 +321,127 @@ def test_list_connection_with_nested_fragments():
             ]
         }
     }
+
+
+@strawberry.type
+class TailNode(relay.Node):
+    id: relay.NodeID[int]
+
+
+class TailNodes:
+    """Nodes that can only be fetched through `relay_tail`."""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.tail_counts = []
+
+    def __iter__(self):
+        raise AssertionError("All the nodes were iterated")
+
+    def relay_tail(self, count: int):
+        self.tail_counts.append(count)
+        first_index = max(0, self.size - count)
+        return first_index, [TailNode(id=i) for i in range(first_index, self.size)]
+
+
+class AsyncTailNodes(TailNodes):
+    def __aiter__(self):
+        raise AssertionError("All the nodes were iterated")
+
+    async def relay_tail(self, count: int):
+        first_index, nodes = super().relay_tail(count)
+
+        async def iterate():
+            for node in nodes:
+                yield node
+
+        return first_index, iterate()
+
+
+def _tail_page(connection: Any) -> Any:
+    return (
+        [int(edge.node.id) for edge in connection.edges],
+        [edge.cursor for edge in connection.edges],
+        connection.page_info.has_previous_page,
+        connection.page_info.has_next_page,
+    )
+
+
+def _expected_tail_page(ids: Any, has_previous_page: bool) -> Any:
+    return (
+        list(ids),
+        [to_base64("arrayconnection", i) for i in ids],
+        has_previous_page,
+        False,
+    )
+
+
+@pytest.mark.parametrize(
+    "nodes",
+    [
+        lambda: [TailNode(id=i) for i in range(1000)],
+        lambda: tuple(TailNode(id=i) for i in range(1000)),
+        lambda: (TailNode(id=i) for i in range(1000)),
+        lambda: TailNodes(1000),
+    ],
+)
+def test_list_connection_last_without_before(mocker: MagicMock, nodes: Any):
+    resolve_edge = mocker.spy(relay.Edge, "resolve_edge")
+    mocker.patch(
+        "strawberry.relay.types.should_resolve_list_connection_edges",
+        return_value=True,
+    )
+
+    connection = relay.ListConnection[TailNode].resolve_connection(
+        nodes(), info=fake_info, last=3
+    )
+
+    assert _tail_page(connection) == _expected_tail_page(range(997, 1000), True)
+    # only the returned nodes are wrapped in edges
+    assert resolve_edge.call_count == 3
+
+    connection = relay.ListConnection[TailNode].resolve_connection(
+        nodes(), info=fake_info, last=3, after=to_base64("arrayconnection", 997)
+    )
+
+    assert _tail_page(connection) == _expected_tail_page(range(998, 1000), False)
+
+    connection = relay.ListConnection[TailNode].resolve_connection(
+        [TailNode(id=0)], info=fake_info, last=3
+    )
+
+    assert _tail_page(connection) == _expected_tail_page([0], False)
+
+
+def test_list_connection_last_uses_relay_tail(mocker: MagicMock):
+    mocker.patch(
+        "strawberry.relay.types.should_resolve_list_connection_edges",
+        return_value=True,
+    )
+    nodes = TailNodes(10)
+
+    relay.ListConnection[TailNode].resolve_connection(nodes, info=fake_info, last=2)
+
+    assert nodes.tail_counts == [2]
+
+
+@pytest.mark.parametrize("tail_nodes", [True, False])
+async def test_list_connection_last_without_before_async(
+    mocker: MagicMock, tail_nodes: bool
+):
+    mocker.patch(
+        "strawberry.relay.types.should_resolve_list_connection_edges",
+        return_value=True,
+    )
+
+    async def generate():
+        for i in range(1000):
+            yield TailNode(id=i)
+
+    nodes = AsyncTailNodes(1000) if tail_nodes else generate()
+
+    connection = await relay.ListConnection[TailNode].resolve_connection(
+        nodes, info=fake_info, last=3
+    )
+
+    assert _tail_page(connection) == _expected_tail_page(range(997, 1000), True)
@@ -0,0 +1,123 @@
+from typing import List, Optional
+
+import pytest
+
+import strawberry
+from strawberry.dataloader import DataLoader, SyncDataLoader
+from strawberry.extensions import DataLoaderMetrics
+from strawberry.schema.sync_batching_execution import SyncBatchingExecutionContext
+from strawberry.types import Info
+
+USERS_LOADER = f"{__name__}.load_users"
+
+
+async def load_users(keys: List[int]) -> List[Optional[int]]:
+    return [ValueError("Not found") if key < 0 else key for key in keys]
+
+
+async def load_nothing(keys: List[int]) -> List[int]:
+    return []
+
+
+def load_users_sync(keys: List[int]) -> List[int]:
+    return keys
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    async def user(self, info: Info, id: int) -> Optional[int]:
+        return await info.context["users"].load(id)
+
+    @strawberry.field
+    async def broken(self, info: Info) -> Optional[int]:
+        return await info.context["broken"].load(1)
+
+    @strawberry.field
+    def sync_user(self, info: Info, id: int) -> int:
+        return info.context["sync_users"].load(id)
+
+
+@pytest.fixture
+def context():
+    return {
+        "users": DataLoader(load_users),
+        "broken": DataLoader(load_nothing),
+        "sync_users": SyncDataLoader(load_users_sync),
+    }
+
+
+async def test_reports_batches_and_cache_hits(context):
+    schema = strawberry.Schema(query=Query, extensions=[DataLoaderMetrics])
+
+    result = await schema.execute(
+        "{ a: user(id: 1) b: user(id: 2) c: user(id: 1) d: user(id: -1) }",
+        context_value=context,
+    )
+
+    assert result.data == {"a": 1, "b": 2, "c": 1, "d": None}
+
+    metrics = result.extensions["dataloaders"][USERS_LOADER]
+
+    assert metrics["loads"] == 4
+    assert metrics["cacheHits"] == 1
+    assert metrics["cacheMisses"] == 3
+    assert metrics["cacheHitRatio"] == 0.25
+    assert metrics["batches"] == 1
+    assert metrics["batchSizes"] == {"3": 1}
+    assert metrics["errors"] == 0
+    assert 0 <= metrics["waitTime"]["max"] <= metrics["waitTime"]["total"]
+    assert 0 <= metrics["loadTime"]["max"] <= metrics["loadTime"]["total"]
+
+
+async def test_reports_wrong_number_of_results(context):
+    schema = strawberry.Schema(query=Query, extensions=[DataLoaderMetrics])
+
+    result = await schema.execute("{ broken }", context_value=context)
+
+    assert result.errors
+    metrics = result.extensions["dataloaders"][f"{__name__}.load_nothing"]
+
+    assert metrics["errors"] == 1
+    assert metrics["wrongNumberOfResults"] == 1
+
+
+async def test_metrics_are_collected_per_operation(context):
+    schema = strawberry.Schema(query=Query, extensions=[DataLoaderMetrics])
+
+    await schema.execute("{ user(id: 1) }", context_value=context)
+    result = await schema.execute("{ user(id: 1) }", context_value=context)
+
+    metrics = result.extensions["dataloaders"][USERS_LOADER]
+
+    assert metrics["loads"] == 1
+    assert metrics["cacheHits"] == 1
+    assert metrics["batches"] == 0
+
+
+def test_sync_loaders(context):
+    schema = strawberry.Schema(
+        query=Query,
+        extensions=[DataLoaderMetrics],
+        execution_context_class=SyncBatchingExecutionContext,
+    )
+
+    result = schema.execute_sync(
+        "{ a: syncUser(id: 1) b: syncUser(id: 2) }", context_value=context
+    )
+
+    assert result.data == {"a": 1, "b": 2}
+
+    metrics = result.extensions["dataloaders"][f"{__name__}.load_users_sync"]
+
+    assert metrics["loads"] == 2
+    assert metrics["batchSizes"] == {"2": 1}
+
+
+async def test_loaders_are_not_instrumented_without_the_extension(context):
+    schema = strawberry.Schema(query=Query)
+
+    result = await schema.execute("{ user(id: 1) }", context_value=context)
+
+    assert result.data == {"user": 1}
+    assert result.extensions == {}
@@ -12,7 +12,7 @@ from graphql import execute as original_execute
 
 import strawberry
 from strawberry.exceptions import StrawberryGraphQLError
-from strawberry.extensions import SchemaExtension
+from strawberry.extensions import ResolveScope, SchemaExtension
 
 
 def test_base_extension():
@@ -608,6 +608,21 @@ async def test_legacy_only_end():
         assert "Event driven styled extensions for" in w[0].message.args[0]
 
 
+def test_legacy_hooks_warning_points_at_the_schema_creation():
+    class CompatExtension(SchemaExtension):
+        def on_request_start(self):
+            pass
+
+    @strawberry.type
+    class Query:
+        hello: str = "world"
+
+    with pytest.warns(DeprecationWarning, match="Event driven styled") as record:
+        strawberry.Schema(query=Query, extensions=[CompatExtension])
+
+    assert {warning.filename for warning in record} == {__file__}
+
+
 def test_warning_about_async_get_results_hooks_in_sync_context():
     class MyExtension(SchemaExtension):
         async def get_results(self):
@@ -1205,3 +1220,232 @@ def test_raise_if_hook_is_not_callable():
     assert isinstance(result.errors[0].original_error, ValueError)
     assert result.errors[0].message.startswith("Hook on_operation on <")
     assert result.errors[0].message.endswith("> must be callable, received 'ABC'")
+
+
+def test_hooks_are_found_once_per_schema():
+    from strawberry.extensions.context import OperationContextManager
+
+    class MyExtension(SchemaExtension):
+        def on_operation(self):
+            yield
+
+        def on_execute(self):
+            yield
+
+    @strawberry.type
+    class Query:
+        hi: str = "👋"
+
+    with patch.object(
+        OperationContextManager,
+        "get_hook_factory",
+        wraps=OperationContextManager.get_hook_factory,
+    ) as get_hook_factory:
+        schema = strawberry.Schema(query=Query, extensions=[MyExtension])
+        # once for the sync table, once for the async one
+        assert get_hook_factory.call_count == 2
+
+        for _ in range(3):
+            result = schema.execute_sync("{ hi }", root_value=Query())
+            assert not result.errors
+
+        assert get_hook_factory.call_count == 2
+
+
+async def test_hooks_get_a_new_extension_instance_per_operation():
+    instances = []
+
+    class MyExtension(SchemaExtension):
+        def on_operation(self):
+            instances.append(self)
+            yield
+
+    @strawberry.type
+    class Query:
+        hi: str = "👋"
+
+    schema = strawberry.Schema(query=Query, extensions=[MyExtension])
+
+    await schema.execute("{ hi }", root_value=Query())
+    await schema.execute("{ hi }", root_value=Query())
+
+    assert len(instances) == 2
+    assert instances[0] is not instances[1]
+
+
+async def test_extension_instances_are_shared_between_operations():
+    class CountOperations(SchemaExtension):
+        def __init__(self) -> None:
+            self.count = 0
+
+        def on_operation(self):
+            self.count += 1
+            yield
+
+    @strawberry.type
+    class Query:
+        hi: str = "👋"
+
+    extension = CountOperations()
+    schema = strawberry.Schema(query=Query, extensions=[extension])
+
+    await schema.execute("{ hi }", root_value=Query())
+    schema.execute_sync("{ hi }", root_value=Query())
+
+    assert extension.count == 2
+
+
+def test_hooks_are_updated_when_extensions_change():
+    called = []
+
+    class MyExtension(SchemaExtension):
+        def on_operation(self):
+            called.append(self)
+            yield
+
+    @strawberry.type
+    class Query:
+        hi: str = "👋"
+
+    schema = strawberry.Schema(query=Query)
+    schema.extensions = [MyExtension]
+
+    result = schema.execute_sync("{ hi }", root_value=Query())
+
+    assert not result.errors
+    assert len(called) == 1
+
+
+def test_extensions_without_resolve_are_not_used_as_middleware():
+    class MyExtension(SchemaExtension):
+        def on_operation(self):
+            yield
+
+    @strawberry.type
+    class Query:
+        hi: str = "👋"
+
+    schema = strawberry.Schema(query=Query, extensions=[MyExtension])
+
+    with patch("strawberry.schema.execute.original_execute") as mock_original_execute:
+        mock_original_execute.return_value = GraphQLExecutionResult(
+            data={"hi": "👋"}, errors=None
+        )
+        schema.execute_sync("{ hi }")
+
+    assert mock_original_execute.call_args.kwargs["middleware"] is None
+
+
+def _resolved_fields_extension(scope: ResolveScope) -> Type[SchemaExtension]:
+    class ResolvedFields(SchemaExtension):
+        resolve_scope = scope
+        fields: List[str] = []
+
+        def resolve(self, _next, root, info, *args: str, **kwargs: Any):
+            self.fields.append(f"{info.parent_type.name}.{info.field_name}")
+            return _next(root, info, *args, **kwargs)
+
+    return ResolvedFields
+
+
+@strawberry.type
+class Book:
+    title: str
+
+    @strawberry.field
+    def author(self) -> str:
+        return "Ann"
+
+
+@strawberry.type
+class BookQuery:
+    @strawberry.field
+    def book(self) -> Book:
+        return Book(title="Strawberry")
+
+    book_count: int = 1
+
+
+@pytest.mark.parametrize(
+    ("scope", "expected"),
+    [
+        (
+            ResolveScope.ALL_FIELDS,
+            ["BookQuery.book", "Book.title", "Book.author", "BookQuery.bookCount"],
+        ),
+        (ResolveScope.RESOLVER_FIELDS, ["BookQuery.book", "Book.author"]),
+        (ResolveScope.ROOT_FIELDS, ["BookQuery.book", "BookQuery.bookCount"]),
+    ],
+)
+def test_resolve_scope(scope: ResolveScope, expected: List[str]):
+    extension = _resolved_fields_extension(scope)
+    schema = strawberry.Schema(query=BookQuery, extensions=[extension])
+
+    result = schema.execute_sync(
+        "{ book { title author } bookCount }", root_value=BookQuery()
+    )
+
+    assert not result.errors
+    assert extension.fields == expected
+
+
+async def test_resolve_scope_async():
+    extension = _resolved_fields_extension(ResolveScope.RESOLVER_FIELDS)
+    schema = strawberry.Schema(query=BookQuery, extensions=[extension])
+
+    result = await schema.execute("{ book { title author } }")
+
+    assert not result.errors
+    assert extension.fields == ["BookQuery.book", "Book.author"]
+
+
+def test_wrapped_resolvers_are_reused_for_shared_extensions():
+    from strawberry.extensions import runner
+
+    class MyExtension(SchemaExtension):
+        def resolve(self, _next, root, info, *args: str, **kwargs: Any):
+            return _next(root, info, *args, **kwargs)
+
+    schema = strawberry.Schema(
+        query=BookQuery,
+        extensions=[MyExtension(execution_context=None)],  # type: ignore
+    )
+
+    with patch.object(runner, "reduce", wraps=runner.reduce) as mock_reduce:
+        for _ in range(3):
+            result = schema.execute_sync("{ book { title author } }")
+            assert not result.errors
+
+    # one for each resolver, only the first time
+    assert mock_reduce.call_count == 3
+
+
+def test_wrapped_resolvers_are_not_shared_between_extension_instances():
+    from strawberry.extensions import runner
+
+    class MyExtension(SchemaExtension):
+        def resolve(self, _next, root, info, *args: str, **kwargs: Any):
+            return _next(root, info, *args, **kwargs)
+
+    schema = strawberry.Schema(query=BookQuery, extensions=[MyExtension])
+
+    with patch.object(runner, "reduce", wraps=runner.reduce) as mock_reduce:
+        for _ in range(3):
+            result = schema.execute_sync("{ book { title author } }")
+            assert not result.errors
+
+    assert mock_reduce.call_count == 9
+
+
+def test_resolve_scope_does_not_use_graphql_core_private_state():
+    from graphql import MiddlewareManager
+
+    extension = _resolved_fields_extension(ResolveScope.RESOLVER_FIELDS)
+    schema = strawberry.Schema(query=BookQuery, extensions=[extension])
+
+    # leaves the private attributes of the manager unset
+    with patch.object(MiddlewareManager, "__init__", lambda self, *middlewares: None):
+        result = schema.execute_sync("{ book { title author } }")
+
+    assert not result.errors
+    assert extension.fields == ["BookQuery.book", "Book.author"]
@@ -1,4 +1,5 @@
 import re
+from functools import partial
 from typing import Any, Callable, Optional
 from typing_extensions import Annotated
 
@@ -380,3 +381,31 @@ def test_extension_access_argument_metadata():
         },
         "another_input": {},
     }
+
+
+def test_extension_chain_is_built_once(mocker):
+    @strawberry.type
+    class Query:
+        name: str = "query"
+
+        @strawberry.field(extensions=[UpperCaseExtension(), IdentityExtension()])
+        def string(self, info: strawberry.Info, value: str) -> str:
+            assert info.field_name == "string"
+            return f"{self.name} {value}"
+
+    chain_partial = mocker.patch(
+        "strawberry.schema.schema_converter.partial", wraps=partial
+    )
+    schema = strawberry.Schema(query=Query)
+
+    assert chain_partial.call_count == 2
+
+    for value in ("a", "b"):
+        result = schema.execute_sync(
+            f'query {{ string(value: "{value}") }}', root_value=Query()
+        )
+
+        assert not result.errors
+        assert result.data == {"string": f"QUERY {value.upper()}"}
+
+    assert chain_partial.call_count == 2
@@ -0,0 +1,214 @@
+from typing import List, Optional
+
+import pytest
+
+import strawberry
+from strawberry.exceptions import InvalidBatchResolverError
+from strawberry.schema.sync_batching_execution import SyncBatchingExecutionContext
+from strawberry.types import Info
+
+
+@strawberry.type
+class Post:
+    id: int
+
+    @strawberry.field(batch=True)
+    def title(self: List["Post"], info: Info, prefix: str = "Post") -> List[str]:
+        info.context["calls"].append(("title", [post.id for post in self]))
+        return [f"{prefix} {post.id}" for post in self]
+
+
+@strawberry.type
+class User:
+    id: int
+
+    @strawberry.field(batch=True)
+    def posts(self: List["User"], info: Info) -> List[List[Post]]:
+        info.context["calls"].append(("posts", [user.id for user in self]))
+        return [[Post(id=user.id * 10 + i) for i in range(2)] for user in self]
+
+    @strawberry.field(batch=True)
+    async def best_friend(self: List["User"], info: Info) -> List[Optional["User"]]:
+        info.context["calls"].append(("best_friend", [user.id for user in self]))
+        return [
+            ValueError("No friends") if user.id < 0 else User(id=user.id + 10)
+            for user in self
+        ]
+
+    @strawberry.field(batch=True)
+    def broken(self: List["User"], info: Info) -> List[int]:
+        info.context["calls"].append(("broken", [user.id for user in self]))
+        return [1]
+
+    @strawberry.field(batch=True)
+    def failing(self: List["User"], info: Info) -> List[Optional[int]]:
+        info.context["calls"].append(("failing", [user.id for user in self]))
+        raise ValueError("Failed")
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def users(self, ids: List[int]) -> List[User]:
+        return [User(id=id_) for id_ in ids]
+
+
+schema = strawberry.Schema(query=Query)
+sync_batching_schema = strawberry.Schema(
+    query=Query, execution_context_class=SyncBatchingExecutionContext
+)
+
+
+async def test_batch_resolver_is_called_once_per_level():
+    calls = []
+
+    result = await schema.execute(
+        "{ users(ids: [1, 2, 3]) { id posts { id title } } }",
+        context_value={"calls": calls},
+    )
+
+    assert not result.errors
+    assert result.data == {
+        "users": [
+            {
+                "id": id_,
+                "posts": [
+                    {"id": id_ * 10, "title": f"Post {id_ * 10}"},
+                    {"id": id_ * 10 + 1, "title": f"Post {id_ * 10 + 1}"},
+                ],
+            }
+            for id_ in (1, 2, 3)
+        ]
+    }
+    assert calls == [
+        ("posts", [1, 2, 3]),
+        ("title", [10, 11, 20, 21, 30, 31]),
+    ]
+
+
+async def test_arguments_and_aliases():
+    calls = []
+
+    result = await schema.execute(
+        """{
+            users(ids: [1, 2]) {
+                posts { a: title(prefix: "A") b: title(prefix: "B") }
+            }
+        }""",
+        context_value={"calls": calls},
+    )
+
+    assert not result.errors
+    assert result.data["users"][1]["posts"][0] == {"a": "A 20", "b": "B 20"}
+    assert sorted(calls) == [
+        ("posts", [1, 2]),
+        ("title", [10, 11, 20, 21]),
+        ("title", [10, 11, 20, 21]),
+    ]
+
+
+async def test_async_batch_resolver_and_errors():
+    calls = []
+
+    result = await schema.execute(
+        "{ users(ids: [1, -1]) { bestFriend { id bestFriend { id } } } }",
+        context_value={"calls": calls},
+    )
+
+    assert result.data == {
+        "users": [
+            {"bestFriend": {"id": 11, "bestFriend": {"id": 21}}},
+            {"bestFriend": None},
+        ]
+    }
+    assert [error.message for error in result.errors] == ["No friends"]
+    assert result.errors[0].path == ["users", 1, "bestFriend"]
+    assert calls == [("best_friend", [1, -1]), ("best_friend", [11])]
+
+
+async def test_errors_are_reported_for_each_parent():
+    calls = []
+
+    result = await schema.execute(
+        "{ users(ids: [1, 2]) { id failing } }", context_value={"calls": calls}
+    )
+
+    assert result.data == {
+        "users": [{"id": 1, "failing": None}, {"id": 2, "failing": None}]
+    }
+    assert [error.path for error in result.errors] == [
+        ["users", 0, "failing"],
+        ["users", 1, "failing"],
+    ]
+    assert {error.message for error in result.errors} == {"Failed"}
+    assert calls == [("failing", [1, 2])]
+
+
+async def test_wrong_number_of_results():
+    result = await schema.execute(
+        "{ users(ids: [1, 2]) { broken } }", context_value={"calls": []}
+    )
+
+    assert result.errors[0].message == (
+        "Received wrong number of results in dataloader, expected: 2, received: 1"
+    )
+
+
+def test_sync_batching_execution():
+    calls = []
+
+    result = sync_batching_schema.execute_sync(
+        "{ users(ids: [1, 2]) { posts { title } } }", context_value={"calls": calls}
+    )
+
+    assert not result.errors
+    assert result.data["users"][1] == {
+        "posts": [{"title": "Post 20"}, {"title": "Post 21"}]
+    }
+    assert calls == [("posts", [1, 2]), ("title", [10, 11, 20, 21])]
+
+
+def test_sync_execution_resolves_each_parent():
+    calls = []
+
+    result = schema.execute_sync(
+        "{ users(ids: [1, 2]) { posts { title } } }", context_value={"calls": calls}
+    )
+
+    assert not result.errors
+    assert result.data["users"][0] == {
+        "posts": [{"title": "Post 10"}, {"title": "Post 11"}]
+    }
+    assert calls == [
+        ("posts", [1]),
+        ("title", [10]),
+        ("title", [11]),
+        ("posts", [2]),
+        ("title", [20]),
+        ("title", [21]),
+    ]
+
+    result = schema.execute_sync(
+        "{ users(ids: [1]) { broken } }", context_value={"calls": []}
+    )
+
+    assert not result.errors
+    assert result.data == {"users": [{"broken": 1}]}
+
+
+def test_batch_resolver_must_return_a_list():
+    with pytest.raises(InvalidBatchResolverError):
+
+        @strawberry.type
+        class Query:
+            @strawberry.field(batch=True)
+            def name(self: List["Query"]) -> str:
+                return "name"
+
+
+def test_batch_field_must_have_a_resolver():
+    with pytest.raises(InvalidBatchResolverError):
+
+        @strawberry.type
+        class Query:
+            name: str = strawberry.field(batch=True)
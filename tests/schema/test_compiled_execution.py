@@ -0,0 +1,214 @@
+from enum import Enum
+from typing import List, Optional
+from unittest.mock import patch
+
+import pytest
+from graphql.execution.collect_fields import collect_sub_fields
+from graphql.execution.values import get_argument_values
+from graphql.version import VersionInfo
+
+import strawberry
+from strawberry.schema.compiled_execution import CompiledExecutionContext
+from strawberry.schema.exceptions import UnsupportedGraphQLCoreVersionError
+from strawberry.schema.operation_cache import OperationCache
+
+
+@strawberry.enum
+class Color(Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+@strawberry.input
+class Filter:
+    prefix: str
+
+
+@strawberry.type
+class Item:
+    name: str
+    index: int
+    score: float
+    active: bool
+    color: Color
+    tags: List[str]
+    maybe_tags: List[Optional[str]]
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def items(self, count: int, color: Color = Color.RED) -> List[Item]:
+        return [
+            Item(
+                name=f"Item {i}",
+                index=i,
+                score=i / 2,
+                active=i % 2 == 0,
+                color=color,
+                tags=["a", "b"],
+                maybe_tags=["a", None],
+            )
+            for i in range(count)
+        ]
+
+    @strawberry.field
+    def filtered(self, filter: Filter, names: List[str]) -> List[str]:
+        return [name for name in names if name.startswith(filter.prefix)]
+
+    @strawberry.field
+    def big_number(self) -> int:
+        return 2**40
+
+    @strawberry.field
+    def wrong_type(self) -> List[int]:
+        return ["a"]  # type: ignore
+
+
+@pytest.fixture()
+def schema() -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query,
+        operation_cache=OperationCache(),
+        execution_context_class=CompiledExecutionContext,
+    )
+
+
+QUERY = """
+    query Items($count: Int!, $withTags: Boolean!) {
+        items(count: $count, color: BLUE) {
+            name
+            index
+            score
+            active
+            color
+            ... on Item {
+                tags @include(if: $withTags)
+                maybeTags @skip(if: $withTags)
+            }
+        }
+    }
+"""
+
+
+def test_results_match_default_execution(schema):
+    default_schema = strawberry.Schema(query=Query)
+
+    for with_tags in (True, False, True):
+        variables = {"count": 3, "withTags": with_tags}
+
+        result = schema.execute_sync(QUERY, variable_values=variables)
+        expected = default_schema.execute_sync(QUERY, variable_values=variables)
+
+        assert not result.errors
+        assert result.data == expected.data
+
+
+async def test_results_match_default_execution_async(schema):
+    default_schema = strawberry.Schema(query=Query)
+    variables = {"count": 3, "withTags": False}
+
+    result = await schema.execute(QUERY, variable_values=variables)
+    expected = await default_schema.execute(QUERY, variable_values=variables)
+
+    assert not result.errors
+    assert result.data == expected.data
+
+
+@patch(
+    "strawberry.schema.compiled_execution.get_argument_values",
+    wraps=get_argument_values,
+)
+@patch(
+    "graphql.execution.execute.collect_sub_fields",
+    wraps=collect_sub_fields,
+)
+def test_plan_is_reused_across_requests(mock_collect, mock_arguments, schema):
+    variables = {"count": 10, "withTags": True}
+
+    schema.execute_sync(QUERY, variable_values=variables)
+
+    # `items` uses a variable, so its arguments are coerced on each request,
+    # the arguments of the 6 selected item fields are only coerced once
+    assert mock_collect.call_count == 1
+    assert mock_arguments.call_count == 1 + 6
+
+    schema.execute_sync(QUERY, variable_values={"count": 5, "withTags": True})
+
+    assert mock_collect.call_count == 1
+    assert mock_arguments.call_count == 1 + 6 + 1
+
+    # a different value for a @skip/@include variable uses another plan
+    result = schema.execute_sync(QUERY, variable_values={"count": 1, "withTags": False})
+
+    assert result.data["items"][0]["maybeTags"] == ["a", None]
+    assert mock_collect.call_count == 2
+
+
+def test_plans_are_attached_to_the_document():
+    schema = strawberry.Schema(
+        query=Query, execution_context_class=CompiledExecutionContext
+    )
+    query = "{ items(count: 2) { name } }"
+
+    with patch(
+        "graphql.execution.execute.collect_sub_fields", wraps=collect_sub_fields
+    ) as mock_collect:
+        schema.execute_sync(query)
+        schema.execute_sync(query)
+
+    # without an operation cache each request parses a new document
+    assert mock_collect.call_count == 2
+
+
+def test_mutable_literal_arguments_are_not_shared(schema):
+    query = '{ filtered(filter: { prefix: "a" }, names: ["ab", "b"]) }'
+
+    for _ in range(2):
+        result = schema.execute_sync(query)
+
+        assert not result.errors
+        assert result.data == {"filtered": ["ab"]}
+
+
+def test_falls_back_to_serialize():
+    query = "{ bigNumber }"
+
+    schema = strawberry.Schema(
+        query=Query, execution_context_class=CompiledExecutionContext
+    )
+    result = schema.execute_sync(query)
+
+    assert result.data is None
+    assert result.errors[0].message.startswith(
+        "Int cannot represent non 32-bit signed integer value"
+    )
+
+
+def test_list_fast_path_falls_back_on_invalid_items():
+    schema = strawberry.Schema(
+        query=Query, execution_context_class=CompiledExecutionContext
+    )
+    result = schema.execute_sync("{ wrongType }")
+
+    assert result.data is None
+    assert result.errors[0].message == "Int cannot represent non-integer value: 'a'"
+    assert result.errors[0].path == ["wrongType", 0]
+
+
+def test_requires_graphql_core_3_2(schema):
+    version = VersionInfo.from_str("3.3.0a6")
+
+    with patch("graphql.version_info", version):
+        with pytest.raises(
+            UnsupportedGraphQLCoreVersionError,
+            match="CompiledExecutionContext only supports graphql-core 3.2, "
+            "but graphql-core 3.3.0a6 is installed",
+        ):
+            strawberry.Schema(Query, execution_context_class=CompiledExecutionContext)
+
+        result = schema.execute_sync("{ items(count: 1) { name } }")
+
+    assert result.errors[0].message.startswith(
+        "CompiledExecutionContext only supports graphql-core 3.2"
+    )
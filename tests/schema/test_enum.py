@@ -432,3 +432,76 @@ def test_can_use_enum_values_in_input():
     assert result.data["a"] == "TestEnum.A"
     assert result.data["b"] == "TestEnum.B"
     assert result.data["c"] == "TestEnum.C"
+
+
+def test_enum_serialization_uses_lookup_tables():
+    @strawberry.enum
+    class Size(Enum):
+        SMALL = "s"
+        LARGE = "l"
+        BIG = "l"  # noqa: PIE796 alias of LARGE
+        CUSTOM = ["c"]  # unhashable value
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def sizes(self) -> List[Optional[Size]]:
+            return [Size.SMALL, Size.BIG, None, "s", Size.CUSTOM]
+
+    schema = strawberry.Schema(query=Query)
+    enum_type = schema.schema_converter.type_map["Size"].implementation
+
+    assert enum_type.names_by_member == {
+        Size.SMALL: "SMALL",
+        Size.LARGE: "LARGE",
+        Size.CUSTOM: "CUSTOM",
+    }
+
+    result = schema.execute_sync("{ sizes }")
+
+    assert not result.errors
+    assert result.data == {"sizes": ["SMALL", "LARGE", None, "SMALL", "CUSTOM"]}
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_list_of_enums(compiled: bool):
+    from strawberry.schema.compiled_execution import CompiledExecutionContext
+
+    @strawberry.enum
+    class Flavour(Enum):
+        VANILLA = "vanilla"
+        CHOCOLATE = "chocolate"
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def flavours(self) -> List[Flavour]:
+            return [Flavour.VANILLA, Flavour.CHOCOLATE] * 3
+
+        @strawberry.field
+        def flavour(self) -> Flavour:
+            return Flavour.CHOCOLATE
+
+        @strawberry.field
+        def invalid(self) -> List[Flavour]:
+            return [Flavour.VANILLA, None]  # type: ignore
+
+    schema = strawberry.Schema(
+        query=Query,
+        execution_context_class=CompiledExecutionContext if compiled else None,
+    )
+
+    result = schema.execute_sync("{ flavours flavour }")
+
+    assert not result.errors
+    assert result.data == {
+        "flavours": ["VANILLA", "CHOCOLATE"] * 3,
+        "flavour": "CHOCOLATE",
+    }
+
+    result = schema.execute_sync("{ invalid }")
+
+    assert result.errors[0].message == (
+        "Cannot return null for non-nullable field Query.invalid."
+    )
+    assert result.errors[0].path == ["invalid", 1]
@@ -0,0 +1,218 @@
+import typing
+from unittest.mock import patch
+
+import pytest
+from graphql import execute as original_execute
+
+import strawberry
+from strawberry.directive import DirectiveLocation
+from strawberry.exceptions import MissingQueryError
+from strawberry.extensions import SchemaExtension
+from strawberry.extensions.runner import SchemaExtensionsRunner
+from strawberry.schema.exceptions import InvalidOperationTypeError
+from strawberry.schema.operation_cache import OperationCache
+from strawberry.schema.trusted_documents import TrustedDocuments
+from strawberry.types.graphql import OperationType
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self, name: str = "world") -> str:
+        return f"Hello {name}"
+
+    @strawberry.field
+    def fail(self) -> typing.Optional[str]:
+        raise ValueError("You shall not pass")
+
+    @strawberry.field
+    async def hello_async(self) -> str:
+        return "async"
+
+
+@strawberry.type
+class Subscription:
+    @strawberry.subscription
+    async def count(self) -> typing.AsyncGenerator[int, None]:
+        for i in range(2):
+            yield i
+
+
+@strawberry.directive(locations=[DirectiveLocation.FIELD])
+def uppercase(value: str) -> str:
+    return value.upper()
+
+
+@pytest.fixture
+def spy_runner():
+    with patch(
+        "strawberry.schema.execute.SchemaExtensionsRunner",
+        wraps=SchemaExtensionsRunner,
+    ) as mock:
+        yield mock
+
+
+@pytest.fixture
+def spy_execute():
+    with patch(
+        "strawberry.schema.execute.original_execute", wraps=original_execute
+    ) as mock:
+        yield mock
+
+
+def test_sync_execution_skips_extensions_runner(spy_runner, spy_execute):
+    schema = strawberry.Schema(query=Query)
+
+    result = schema.execute_sync('{ hello(name: "Patrick") }')
+
+    assert not result.errors
+    assert result.data == {"hello": "Hello Patrick"}
+    assert result.extensions == {}
+
+    spy_runner.assert_not_called()
+    assert spy_execute.call_args.kwargs.get("middleware") is None
+
+
+async def test_async_execution_skips_extensions_runner(spy_runner, spy_execute):
+    schema = strawberry.Schema(query=Query)
+
+    result = await schema.execute("{ hello helloAsync }")
+
+    assert not result.errors
+    assert result.data == {"hello": "Hello world", "helloAsync": "async"}
+    assert result.extensions == {}
+
+    spy_runner.assert_not_called()
+    assert spy_execute.call_args.kwargs.get("middleware") is None
+
+
+async def test_subscription_skips_extensions_runner(spy_runner):
+    schema = strawberry.Schema(query=Query, subscription=Subscription)
+
+    generator = await schema.subscribe("subscription { count }")
+
+    assert [item.data async for item in generator] == [{"count": 0}, {"count": 1}]
+    spy_runner.assert_not_called()
+
+
+def test_extensions_use_the_runner(spy_runner):
+    class MyExtension(SchemaExtension):
+        pass
+
+    schema = strawberry.Schema(query=Query, extensions=[MyExtension])
+
+    result = schema.execute_sync("{ hello }")
+
+    assert result.data == {"hello": "Hello world"}
+    spy_runner.assert_called_once()
+
+
+def test_directives_use_the_runner(spy_runner):
+    schema = strawberry.Schema(query=Query, directives=[uppercase])
+
+    result = schema.execute_sync("{ hello @uppercase }")
+
+    assert result.data == {"hello": "HELLO WORLD"}
+    spy_runner.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "{ hello",
+        "{ unknown }",
+        "{ fail }",
+        '{ hello(name: "Patrick") fail }',
+    ],
+)
+async def test_results_match_execution_with_extensions(query):
+    class NoopExtension(SchemaExtension):
+        pass
+
+    fast_schema = strawberry.Schema(query=Query)
+    schema = strawberry.Schema(query=Query, extensions=[NoopExtension])
+
+    fast_result = await fast_schema.execute(query)
+    result = await schema.execute(query)
+
+    assert fast_result.data == result.data
+    assert fast_result.errors == result.errors
+    assert fast_result.extensions == result.extensions
+
+    fast_result = fast_schema.execute_sync(query)
+    result = schema.execute_sync(query)
+
+    assert fast_result.data == result.data
+    assert fast_result.errors == result.errors
+    assert fast_result.extensions == result.extensions
+
+
+def test_errors_are_processed():
+    schema = strawberry.Schema(query=Query)
+
+    with patch.object(schema, "process_errors") as process_errors:
+        result = schema.execute_sync("{ fail }")
+
+    assert result.errors[0].message == "You shall not pass"
+    process_errors.assert_called_once()
+    assert process_errors.call_args.args[0] == result.errors
+
+
+def test_missing_query_is_raised():
+    schema = strawberry.Schema(query=Query)
+
+    with pytest.raises(MissingQueryError):
+        schema.execute_sync(None)
+
+
+def test_invalid_operation_type_is_raised():
+    schema = strawberry.Schema(query=Query)
+
+    with pytest.raises(InvalidOperationTypeError):
+        schema.execute_sync(
+            "{ hello }", allowed_operation_types=[OperationType.MUTATION]
+        )
+
+
+def test_sync_execution_of_async_resolvers_fails():
+    schema = strawberry.Schema(query=Query)
+
+    result = schema.execute_sync("{ helloAsync }")
+
+    assert result.errors[0].message == (
+        "GraphQL execution failed to complete synchronously."
+    )
+
+
+def test_operation_cache_is_used(spy_runner):
+    cache = OperationCache()
+    schema = strawberry.Schema(query=Query, operation_cache=cache)
+
+    for _ in range(2):
+        result = schema.execute_sync("{ hello }")
+        assert result.data == {"hello": "Hello world"}
+
+    for _ in range(2):
+        result = schema.execute_sync("{ unknown }")
+        assert result.errors[0].message == (
+            "Cannot query field 'unknown' on type 'Query'."
+        )
+
+    assert len(cache) == 2
+    spy_runner.assert_not_called()
+
+
+def test_trusted_documents_are_used(spy_runner):
+    query = "{ hello }"
+    document_id = TrustedDocuments.hash_document(query)
+    schema = strawberry.Schema(
+        query=Query, trusted_documents=TrustedDocuments({document_id: query})
+    )
+
+    result = schema.execute_sync(None, document_id=document_id)
+    assert result.data == {"hello": "Hello world"}
+
+    result = schema.execute_sync("{ fail }")
+    assert result.errors[0].message == "Only trusted documents are allowed"
+
+    spy_runner.assert_not_called()
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import Any, List
+from typing import Any, Generic, List, TypeVar
 
 import pytest
 from pytest_mock import MockerFixture
@@ -423,3 +423,33 @@ def test_resolve_type_on_interface_returning_interface():
     assert result.data
     assert result.data["one"] == {"id": "1", "__typename": "Video"}
     assert result.data["two"] == {"id": "2", "__typename": "Image"}
+
+
+def test_interface_resolves_generic_implementations():
+    T = TypeVar("T")
+
+    @strawberry.interface
+    class Named:
+        name: str
+
+    @strawberry.type
+    class Tagged(Named, Generic[T]):
+        tag: T
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def named(self) -> List[Named]:
+            return [Tagged(name="a", tag=1), Tagged(name="b", tag="b")]
+
+    schema = strawberry.Schema(query=Query, types=[Tagged[int], Tagged[str]])
+
+    result = schema.execute_sync("{ named { __typename name } }")
+
+    assert not result.errors
+    assert result.data == {
+        "named": [
+            {"__typename": "IntTagged", "name": "a"},
+            {"__typename": "StrTagged", "name": "b"},
+        ]
+    }
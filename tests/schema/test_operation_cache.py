@@ -0,0 +1,226 @@
+from typing import Any, Iterator
+from unittest.mock import patch
+
+import pytest
+from graphql import parse, validate
+
+import strawberry
+from strawberry.extensions import AddValidationRules, SchemaExtension
+from strawberry.schema.exceptions import InvalidOperationTypeError
+from strawberry.schema.operation_cache import CachedOperation, OperationCache
+from strawberry.types.graphql import OperationType
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self) -> str:
+        return "world"
+
+    @strawberry.field
+    def ping(self) -> str:
+        return "pong"
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation
+    def ping(self) -> str:
+        return "pong"
+
+
+@patch("strawberry.schema.execute.validate", wraps=validate)
+@patch("strawberry.schema.execute.parse", wraps=parse)
+def test_operation_cache_skips_parse_and_validate(mock_parse, mock_validate):
+    cache = OperationCache()
+    schema = strawberry.Schema(query=Query, operation_cache=cache)
+
+    for _ in range(3):
+        result = schema.execute_sync("query { hello }")
+
+        assert not result.errors
+        assert result.data == {"hello": "world"}
+
+    assert mock_parse.call_count == 1
+    assert mock_validate.call_count == 1
+
+    result = schema.execute_sync("query { ping }")
+
+    assert not result.errors
+    assert result.data == {"ping": "pong"}
+
+    assert mock_parse.call_count == 2
+    assert mock_validate.call_count == 2
+
+    info = cache.cache_info()
+    assert info.hits == 2
+    assert info.misses == 2
+    assert info.currsize == 2
+
+
+@patch("strawberry.schema.execute.validate", wraps=validate)
+@patch("strawberry.schema.execute.parse", wraps=parse)
+async def test_operation_cache_async(mock_parse, mock_validate):
+    schema = strawberry.Schema(query=Query, operation_cache=OperationCache())
+
+    for _ in range(3):
+        result = await schema.execute("query { hello }")
+
+        assert not result.errors
+        assert result.data == {"hello": "world"}
+
+    assert mock_parse.call_count == 1
+    assert mock_validate.call_count == 1
+
+
+@patch("strawberry.schema.execute.validate", wraps=validate)
+def test_operation_cache_caches_validation_errors(mock_validate):
+    schema = strawberry.Schema(query=Query, operation_cache=OperationCache())
+
+    for _ in range(2):
+        result = schema.execute_sync("query { unknown }")
+
+        assert result.data is None
+        assert result.errors
+        assert result.errors[0].message == (
+            "Cannot query field 'unknown' on type 'Query'."
+        )
+
+    assert mock_validate.call_count == 1
+
+
+def test_operation_cache_skips_parse_and_validate_hooks():
+    calls = []
+
+    class MyExtension(SchemaExtension):
+        def on_parse(self) -> Iterator[None]:
+            calls.append("parse")
+            yield
+
+        def on_validate(self) -> Iterator[None]:
+            calls.append("validate")
+            yield
+
+        def on_execute(self) -> Iterator[None]:
+            calls.append("execute")
+            yield
+
+    schema = strawberry.Schema(
+        query=Query, extensions=[MyExtension], operation_cache=OperationCache()
+    )
+
+    schema.execute_sync("query { hello }")
+    schema.execute_sync("query { hello }")
+
+    assert calls == ["parse", "validate", "execute", "execute"]
+
+
+def test_operation_cache_is_keyed_on_validation_rules():
+    from graphql import GraphQLError, ValidationRule
+
+    class NoPing(ValidationRule):
+        def enter_field(self, node: Any, *args: Any) -> None:
+            if node.name.value == "ping":
+                self.report_error(GraphQLError("ping is not allowed"))
+
+    cache = OperationCache()
+    schema = strawberry.Schema(query=Query, operation_cache=cache)
+    restricted_schema = strawberry.Schema(
+        query=Query,
+        extensions=[AddValidationRules([NoPing])],
+        operation_cache=cache,
+    )
+
+    assert not schema.execute_sync("query { ping }").errors
+
+    result = restricted_schema.execute_sync("query { ping }")
+    assert result.errors
+    assert result.errors[0].message == "ping is not allowed"
+
+    assert cache.cache_info().currsize == 2
+
+
+def test_operation_cache_does_not_cache_syntax_errors():
+    cache = OperationCache()
+    schema = strawberry.Schema(query=Query, operation_cache=cache)
+
+    result = schema.execute_sync("query { hello ")
+
+    assert result.errors
+    assert len(cache) == 0
+
+
+def test_operation_cache_checks_allowed_operation_types():
+    schema = strawberry.Schema(
+        query=Query, mutation=Mutation, operation_cache=OperationCache()
+    )
+    query = "mutation { ping }"
+
+    assert schema.execute_sync(query).data == {"ping": "pong"}
+
+    with pytest.raises(InvalidOperationTypeError):
+        schema.execute_sync(query, allowed_operation_types=[OperationType.QUERY])
+
+
+def test_operation_cache_uses_operation_name():
+    schema = strawberry.Schema(
+        query=Query, mutation=Mutation, operation_cache=OperationCache()
+    )
+    query = "query A { hello } mutation B { ping }"
+
+    result = schema.execute_sync(query, operation_name="A")
+    assert result.data == {"hello": "world"}
+
+    with pytest.raises(InvalidOperationTypeError):
+        schema.execute_sync(
+            query, operation_name="B", allowed_operation_types=[OperationType.QUERY]
+        )
+
+
+def test_evicts_least_recently_used_entry():
+    cache = OperationCache(maxsize=2)
+    document = parse("{ hello }")
+
+    cache.set(("a", (), ()), CachedOperation(document=document, errors=[]))
+    cache.set(("b", (), ()), CachedOperation(document=document, errors=[]))
+    assert cache.get(("a", (), ())) is not None
+
+    cache.set(("c", (), ()), CachedOperation(document=document, errors=[]))
+
+    assert cache.get(("b", (), ())) is None
+    assert cache.get(("a", (), ())) is not None
+    assert cache.get(("c", (), ())) is not None
+
+    info = cache.cache_info()
+    assert info.evictions == 1
+    assert info.hits == 3
+    assert info.misses == 1
+
+
+def test_evicts_by_size_in_bytes():
+    cache = OperationCache(maxsize=None, max_bytes=10)
+    document = parse("{ hello }")
+
+    cache.set(("aaaa", (), ()), CachedOperation(document=document, errors=[]))
+    cache.set(("bbbb", (), ()), CachedOperation(document=document, errors=[]))
+    assert cache.cache_info().currbytes == 8
+
+    cache.set(("cccc", (), ()), CachedOperation(document=document, errors=[]))
+    assert cache.cache_info().currbytes == 8
+    assert cache.get(("aaaa", (), ())) is None
+
+    # entries bigger than the limit are never stored
+    cache.set(("d" * 11, (), ()), CachedOperation(document=document, errors=[]))
+    assert cache.get(("d" * 11, (), ())) is None
+    assert len(cache) == 2
+
+
+def test_clear():
+    cache = OperationCache()
+    schema = strawberry.Schema(query=Query, operation_cache=cache)
+
+    schema.execute_sync("query { hello }")
+    schema.execute_sync("query { hello }")
+    cache.clear()
+
+    assert cache.cache_info() == (0, 0, 0, 1000, 0, None, 0)
@@ -0,0 +1,206 @@
+import asyncio
+from typing import List, Optional
+from unittest.mock import patch
+
+import pytest
+from graphql.version import VersionInfo
+
+import strawberry
+from strawberry.dataloader import SyncDataLoader
+from strawberry.schema.exceptions import UnsupportedGraphQLCoreVersionError
+from strawberry.schema.sync_batching_execution import SyncBatchingExecutionContext
+from strawberry.types import Info
+
+
+@strawberry.type
+class Post:
+    id: int
+    author_id: strawberry.Private[int]
+
+    @strawberry.field
+    def author(self, info: Info) -> "User":
+        return info.context["users"].load(self.author_id)
+
+
+@strawberry.type
+class User:
+    id: int
+
+    @strawberry.field
+    def posts(self, info: Info) -> List[Post]:
+        return info.context["posts"].load(self.id)
+
+    @strawberry.field
+    async def best_friend(self, info: Info) -> Optional["User"]:
+        return await info.context["users"].load(self.id + 10)
+
+    @strawberry.field
+    def name(self, info: Info) -> str:
+        return info.context["users"].load(self.id).then(lambda user: f"User {user.id}")
+
+    @strawberry.field
+    async def slow(self) -> str:
+        await asyncio.sleep(0)
+        return "slow"
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def users(self, ids: List[int]) -> List[User]:
+        return [User(id=id_) for id_ in ids]
+
+    @strawberry.field
+    def user(self, info: Info, id: int) -> Optional[User]:
+        return info.context["users"].load(id)
+
+
+@strawberry.type
+class Mutation:
+    @strawberry.mutation
+    def rename(self, info: Info, id: int) -> User:
+        return info.context["users"].load(id)
+
+
+schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    execution_context_class=SyncBatchingExecutionContext,
+)
+
+
+@pytest.fixture
+def context():
+    calls = []
+
+    def load_users(keys: List[int]) -> List[User]:
+        calls.append(("users", keys))
+        return [ValueError("Not found") if key < 0 else User(id=key) for key in keys]
+
+    def load_posts(keys: List[int]) -> List[List[Post]]:
+        calls.append(("posts", keys))
+        return [
+            [Post(id=key * 10 + i, author_id=key) for i in range(2)] for key in keys
+        ]
+
+    return {
+        "calls": calls,
+        "users": SyncDataLoader(load_users),
+        "posts": SyncDataLoader(load_posts),
+    }
+
+
+def test_loads_are_batched_by_level(context):
+    result = schema.execute_sync(
+        "{ users(ids: [1, 2, 3]) { id posts { id author { id } } } }",
+        context_value=context,
+    )
+
+    assert not result.errors
+    assert result.data["users"][0] == {
+        "id": 1,
+        "posts": [{"id": 10, "author": {"id": 1}}, {"id": 11, "author": {"id": 1}}],
+    }
+    assert context["calls"] == [("posts", [1, 2, 3]), ("users", [1, 2, 3])]
+
+
+def test_coroutines_awaiting_loads_are_batched(context):
+    result = schema.execute_sync(
+        "{ users(ids: [1, 2]) { bestFriend { id bestFriend { id } } } }",
+        context_value=context,
+    )
+
+    assert not result.errors
+    assert result.data["users"] == [
+        {"bestFriend": {"id": 11, "bestFriend": {"id": 21}}},
+        {"bestFriend": {"id": 12, "bestFriend": {"id": 22}}},
+    ]
+    assert context["calls"] == [("users", [11, 12]), ("users", [21, 22])]
+
+
+def test_chained_loads(context):
+    result = schema.execute_sync(
+        "{ users(ids: [1, 2]) { name } }", context_value=context
+    )
+
+    assert not result.errors
+    assert result.data["users"] == [{"name": "User 1"}, {"name": "User 2"}]
+    assert context["calls"] == [("users", [1, 2])]
+
+
+def test_errors_are_located(context):
+    result = schema.execute_sync(
+        "{ a: user(id: 1) { id } b: user(id: -1) { id } }", context_value=context
+    )
+
+    assert result.data == {"a": {"id": 1}, "b": None}
+    assert len(result.errors) == 1
+    assert result.errors[0].message == "Not found"
+    assert result.errors[0].path == ["b"]
+    assert context["calls"] == [("users", [1, -1])]
+
+
+def test_non_null_errors_propagate(context):
+    result = schema.execute_sync(
+        "mutation { rename(id: -1) { id } }", context_value=context
+    )
+
+    assert result.data is None
+    assert result.errors[0].message == "Not found"
+
+
+def test_mutations(context):
+    result = schema.execute_sync(
+        "mutation { a: rename(id: 1) { id } b: rename(id: 2) { id } }",
+        context_value=context,
+    )
+
+    assert result.data == {"a": {"id": 1}, "b": {"id": 2}}
+    # like in async execution, resolvers are called before the previous
+    # results are awaited
+    assert context["calls"] == [("users", [1, 2])]
+
+
+def test_awaiting_other_awaitables_fails(context):
+    result = schema.execute_sync("{ users(ids: [1]) { slow } }", context_value=context)
+
+    assert result.data is None
+    assert result.errors[0].message == (
+        "GraphQL execution failed to complete synchronously."
+    )
+
+
+async def test_async_execution_loads_without_batching(context):
+    result = await schema.execute(
+        "{ users(ids: [1, 2]) { id slow bestFriend { id } } }",
+        context_value=context,
+    )
+
+    assert not result.errors
+    assert result.data["users"] == [
+        {"id": 1, "slow": "slow", "bestFriend": {"id": 11}},
+        {"id": 2, "slow": "slow", "bestFriend": {"id": 12}},
+    ]
+    assert context["calls"] == [("users", [11]), ("users", [12])]
+
+
+def test_requires_graphql_core_3_2(context):
+    version = VersionInfo.from_str("3.3.0a6")
+
+    with patch("graphql.version_info", version):
+        with pytest.raises(
+            UnsupportedGraphQLCoreVersionError,
+            match="SyncBatchingExecutionContext only supports graphql-core 3.2, "
+            "but graphql-core 3.3.0a6 is installed",
+        ):
+            strawberry.Schema(
+                query=Query, execution_context_class=SyncBatchingExecutionContext
+            )
+
+        result = schema.execute_sync(
+            "{ users(ids: [1]) { id } }", context_value=context
+        )
+
+    assert result.errors[0].message.startswith(
+        "SyncBatchingExecutionContext only supports graphql-core 3.2"
+    )
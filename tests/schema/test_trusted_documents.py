@@ -0,0 +1,157 @@
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from graphql import FieldNode, GraphQLError, ValidationRule, parse, validate
+
+import strawberry
+from strawberry.exceptions import MissingQueryError
+from strawberry.extensions import AddValidationRules, DisableValidation
+from strawberry.schema.trusted_documents import TrustedDocuments
+
+QUERY = "query Hello { hello }"
+QUERY_ID = TrustedDocuments.hash_document(QUERY)
+
+
+@strawberry.type
+class Query:
+    @strawberry.field
+    def hello(self) -> str:
+        return "world"
+
+    @strawberry.field
+    def ping(self) -> str:
+        return "pong"
+
+
+@pytest.fixture()
+def schema() -> strawberry.Schema:
+    return strawberry.Schema(
+        query=Query, trusted_documents=TrustedDocuments({QUERY_ID: QUERY})
+    )
+
+
+@patch("strawberry.schema.execute.validate", wraps=validate)
+@patch("strawberry.schema.execute.parse", wraps=parse)
+def test_executes_document_by_id(mock_parse, mock_validate, schema):
+    result = schema.execute_sync(None, document_id=QUERY_ID)
+
+    assert not result.errors
+    assert result.data == {"hello": "world"}
+
+    mock_parse.assert_not_called()
+    mock_validate.assert_not_called()
+
+
+@patch("strawberry.schema.execute.parse", wraps=parse)
+async def test_executes_document_by_id_async(mock_parse, schema):
+    result = await schema.execute(None, document_id=QUERY_ID)
+
+    assert not result.errors
+    assert result.data == {"hello": "world"}
+
+    mock_parse.assert_not_called()
+
+
+def test_executes_document_by_query_text(schema):
+    result = schema.execute_sync(QUERY)
+
+    assert not result.errors
+    assert result.data == {"hello": "world"}
+
+
+@pytest.mark.parametrize(
+    ("query", "document_id"),
+    [("{ ping }", None), (None, "unknown"), ("{ ping }", "unknown")],
+)
+def test_rejects_unknown_documents(schema, query, document_id):
+    result = schema.execute_sync(query, document_id=document_id)
+
+    assert result.data is None
+    assert result.errors
+    assert result.errors[0].message == "Only trusted documents are allowed"
+    assert result.errors[0].extensions == {"code": "TRUSTED_DOCUMENT_NOT_FOUND"}
+
+
+def test_requires_query_or_document_id(schema):
+    with pytest.raises(MissingQueryError):
+        schema.execute_sync(None)
+
+
+def test_invalid_documents_fail_at_startup():
+    trusted_documents = TrustedDocuments({"a": "{ unknown }", "b": "{ hello"})
+
+    with pytest.raises(ValueError, match="Invalid trusted documents") as exc_info:
+        strawberry.Schema(query=Query, trusted_documents=trusted_documents)
+
+    assert "❌ a: Cannot query field 'unknown' on type 'Query'." in str(exc_info.value)
+    assert "❌ b: Syntax Error" in str(exc_info.value)
+
+
+def test_from_file(tmp_path: Path):
+    path = tmp_path / "trusted_documents.json"
+    path.write_text(json.dumps({QUERY_ID: QUERY}))
+
+    trusted_documents = TrustedDocuments.from_file(path)
+
+    assert trusted_documents.documents == {QUERY_ID: QUERY}
+    assert len(trusted_documents) == 1
+
+
+def test_from_file_rejects_invalid_manifest(tmp_path: Path):
+    path = tmp_path / "trusted_documents.json"
+    path.write_text(json.dumps([QUERY]))
+
+    with pytest.raises(ValueError, match="Invalid trusted documents manifest"):
+        TrustedDocuments.from_file(path)
+
+
+def test_introspection_is_not_restricted(schema):
+    assert schema.introspect()["__schema"]["queryType"]["name"] == "Query"
+
+
+class NoHelloRule(ValidationRule):
+    def enter_field(self, node: FieldNode, *_args: Any) -> None:
+        if node.name.value == "hello":
+            self.report_error(GraphQLError("hello is not allowed", node))
+
+
+@pytest.mark.parametrize("sync", [True, False])
+async def test_documents_are_validated_with_the_rules_of_extensions(sync: bool):
+    schema = strawberry.Schema(
+        query=Query,
+        trusted_documents=TrustedDocuments({QUERY_ID: QUERY}),
+        extensions=[AddValidationRules([NoHelloRule])],
+    )
+
+    with patch("strawberry.schema.execute.validate", wraps=validate) as mock_validate:
+        for _ in range(2):
+            if sync:
+                result = schema.execute_sync(None, document_id=QUERY_ID)
+            else:
+                result = await schema.execute(None, document_id=QUERY_ID)
+
+            assert result.data is None
+            assert [error.message for error in result.errors] == [
+                "hello is not allowed"
+            ]
+
+    # the result of the validation is cached
+    mock_validate.assert_called_once()
+
+
+def test_documents_are_not_validated_when_validation_is_disabled():
+    schema = strawberry.Schema(
+        query=Query,
+        trusted_documents=TrustedDocuments({QUERY_ID: QUERY}),
+        extensions=[DisableValidation()],
+    )
+
+    with patch("strawberry.schema.execute.validate", wraps=validate) as mock_validate:
+        result = schema.execute_sync(None, document_id=QUERY_ID)
+
+    assert not result.errors
+    assert result.data == {"hello": "world"}
+    mock_validate.assert_not_called()
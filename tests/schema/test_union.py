@@ -850,3 +850,55 @@ def test_single_union():
 
     assert not result.errors
     assert result.data["something"] == {"__typename": "A", "a": 5}
+
+
+def test_union_type_resolution_uses_type_index():
+    T = TypeVar("T")
+
+    @strawberry.type
+    class A:
+        a: int
+
+    @strawberry.type
+    class B:
+        b: int
+
+    @strawberry.type
+    class Box(Generic[T]):
+        item: T
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def items(self) -> List[Union[A, B, Box[int], Box[str]]]:
+            return [A(a=1), B(b=2), Box(item=3), Box(item="4"), A(a=5)]
+
+    schema = strawberry.Schema(query=Query)
+    query = """{
+        items {
+            __typename
+            ... on IntBox { intItem: item }
+            ... on StrBox { strItem: item }
+        }
+    }"""
+
+    result = schema.execute_sync(query)
+
+    assert not result.errors
+    assert result.data == {
+        "items": [
+            {"__typename": "A"},
+            {"__typename": "B"},
+            {"__typename": "IntBox", "intItem": 3},
+            {"__typename": "StrBox", "strItem": "4"},
+            {"__typename": "A"},
+        ]
+    }
+
+    type_index = schema.schema_converter.type_index
+    assert [
+        candidate.implementation.name for candidate in type_index.get_candidates(A)
+    ] == ["A"]
+    assert sorted(
+        candidate.implementation.name for candidate in type_index.get_candidates(Box)
+    ) == ["IntBox", "StrBox"]
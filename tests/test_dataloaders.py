@@ -5,7 +5,23 @@ from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union,
 import pytest
 from pytest_mock import MockerFixture
 
-from strawberry.dataloader import AbstractCache, DataLoader
+from strawberry.dataloader import (
+    AbstractCache,
+    AdaptiveBatchSize,
+    BatchLimiter,
+    DataLoader,
+    DataLoaderInstrumentation,
+    InMemorySharedCache,
+    LRUCache,
+    SingleFlight,
+    SyncDataLoader,
+    TTLCache,
+    instrument_dataloaders,
+    iterations_scheduler,
+    next_tick_scheduler,
+    run_sync,
+    time_window_scheduler,
+)
 from strawberry.exceptions import WrongNumberOfResultsReturned
 
 IDXType = Callable[[List[int]], Awaitable[List[int]]]
@@ -176,7 +192,8 @@ async def test_cache_disabled(mocker: MockerFixture):
     assert await a == 1
     assert await b == 1
 
-    mock_loader.assert_has_calls([mocker.call([1, 1])])  # type: ignore
+    # keys are still sent once per batch
+    mock_loader.assert_called_once_with([1])
 
 
 @pytest.mark.asyncio
@@ -450,6 +467,354 @@ async def test_user_class_custom_cache_key_fn():
     assert data1 != data2
 
 
+@pytest.mark.asyncio
+async def test_lru_cache(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    cache = LRUCache[int, int](maxsize=2)
+    loader = DataLoader(load_fn=cast(IDXType, mock_loader), cache_map=cache)
+
+    assert await loader.load_many([1, 2]) == [1, 2]
+    # 1 is now the most recently used
+    assert await loader.load(1) == 1
+    assert await loader.load(3) == 3
+
+    assert len(cache) == 2
+    assert list(cache.cache_map) == [1, 3]
+
+    assert await loader.load(2) == 2
+
+    assert mock_loader.call_args_list == [
+        mocker.call([1, 2]),
+        mocker.call([3]),
+        mocker.call([2]),
+    ]
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 4, 2)
+
+
+@pytest.mark.asyncio
+async def test_lru_cache_with_weight():
+    cache = LRUCache[str, str](maxsize=None, max_weight=10, weight_fn=len)
+
+    async def load(keys: List[str]) -> List[str]:
+        return [key * 4 for key in keys]
+
+    loader = DataLoader(load_fn=load, cache_map=cache)
+
+    await loader.load_many(["a", "b"])
+    assert cache.weight == 8
+
+    await loader.load("c")
+    assert cache.weight == 8
+    assert list(cache.cache_map) == ["b", "c"]
+    assert cache.evictions == 1
+
+    loader.clear("b")
+    assert cache.weight == 4
+
+    loader.clear_all()
+    assert cache.weight == 0
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_lru_cache_doesnt_weigh_failed_loads():
+    cache = LRUCache[int, int](max_weight=10, weight_fn=lambda value: value)
+
+    async def load(keys: List[int]) -> List[Union[int, Exception]]:
+        return [ValueError() if key == 5 else key for key in keys]
+
+    loader = DataLoader(load_fn=load, cache_map=cache)
+
+    results = await asyncio.gather(
+        loader.load(4), loader.load(5), return_exceptions=True
+    )
+    assert results[0] == 4
+    assert isinstance(results[1], ValueError)
+
+    assert cache.weight == 4
+
+
+def test_lru_cache_requires_weight_fn_with_max_weight():
+    with pytest.raises(ValueError, match="`weight_fn` is required"):
+        LRUCache(max_weight=10)
+
+
+@pytest.mark.asyncio
+async def test_lru_cache_clearing_evicted_key():
+    loader = DataLoader(load_fn=idx, cache_map=LRUCache(maxsize=1))
+
+    await loader.load_many([1, 2])
+
+    loader.clear(1)
+    loader.clear_many([1, 2])
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache(mocker: MockerFixture):
+    now = 0.0
+    mock_loader = mocker.Mock(side_effect=idx)
+    cache = TTLCache[int, int](ttl=10, timer=lambda: now)
+    loader = DataLoader(load_fn=cast(IDXType, mock_loader), cache_map=cache)
+
+    await loader.load(1)
+    now = 5
+    await loader.load(2)
+    await loader.load(1)
+
+    now = 11
+    # 1 has expired, 2 hasn't
+    assert await loader.load_many([1, 2]) == [1, 2]
+
+    assert mock_loader.call_args_list == [
+        mocker.call([1]),
+        mocker.call([2]),
+        mocker.call([1]),
+    ]
+    assert cache.evictions == 1
+
+    now = 30
+    await loader.load(3)
+
+    # expired entries are evicted when setting new ones
+    assert list(cache.cache_map) == [3]
+    assert list(cache.expires_at) == [3]
+    assert cache.evictions == 3
+
+
+@pytest.mark.asyncio
+async def test_ttl_cache_with_maxsize():
+    cache = TTLCache[int, int](ttl=10, maxsize=1, timer=lambda: 0)
+    loader = DataLoader(load_fn=idx, cache_map=cache)
+
+    await loader.load_many([1, 2])
+
+    assert list(cache.cache_map) == [2]
+    assert list(cache.expires_at) == [2]
+
+
+@pytest.mark.asyncio
+async def test_shared_cache(mocker: MockerFixture):
+    shared_cache = InMemorySharedCache()
+
+    def create_loader() -> Tuple[DataLoader[int, int], Any]:
+        mock_loader = mocker.Mock(side_effect=idx)
+        loader = DataLoader(
+            load_fn=cast(IDXType, mock_loader),
+            shared_cache=shared_cache,
+            shared_cache_namespace="numbers",
+        )
+        return loader, mock_loader
+
+    loader, mock_loader = create_loader()
+    assert await loader.load_many([1, 2]) == [1, 2]
+    mock_loader.assert_called_once_with([1, 2])
+
+    # a new loader, as for another request, only loads what's not cached
+    loader, mock_loader = create_loader()
+    assert await loader.load_many([1, 2, 3]) == [1, 2, 3]
+    mock_loader.assert_called_once_with([3])
+
+    loader, mock_loader = create_loader()
+    assert await loader.load_many([1, 2, 3]) == [1, 2, 3]
+    mock_loader.assert_not_called()
+
+    await shared_cache.invalidate("numbers", [2])
+
+    loader, mock_loader = create_loader()
+    assert await loader.load_many([1, 2, 3]) == [1, 2, 3]
+    mock_loader.assert_called_once_with([2])
+
+    await shared_cache.invalidate("numbers")
+
+    loader, mock_loader = create_loader()
+    assert await loader.load_many([1, 2, 3]) == [1, 2, 3]
+    mock_loader.assert_called_once_with([1, 2, 3])
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_doesnt_store_errors(mocker: MockerFixture):
+    shared_cache = InMemorySharedCache()
+
+    async def load(keys: List[int]) -> List[Union[int, Exception]]:
+        return [ValueError() if key == 2 else key for key in keys]
+
+    mock_loader = mocker.Mock(side_effect=load)
+
+    for _ in range(2):
+        loader = DataLoader(
+            load_fn=mock_loader,
+            shared_cache=shared_cache,
+            shared_cache_namespace="numbers",
+        )
+
+        results = await asyncio.gather(
+            loader.load(1), loader.load(2), return_exceptions=True
+        )
+        assert results[0] == 1
+        assert isinstance(results[1], ValueError)
+
+    assert mock_loader.call_args_list == [mocker.call([1, 2]), mocker.call([2])]
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_namespaces():
+    shared_cache = InMemorySharedCache()
+
+    async def load_doubles(keys: List[int]) -> List[int]:
+        return [key * 2 for key in keys]
+
+    doubles = DataLoader(load_fn=load_doubles, shared_cache=shared_cache)
+    numbers = DataLoader(load_fn=idx, shared_cache=shared_cache)
+
+    assert await doubles.load(1) == 2
+    assert await numbers.load(1) == 1
+
+    assert doubles.shared_cache_namespace == (
+        "tests.test_dataloaders.test_shared_cache_namespaces.<locals>.load_doubles"
+    )
+    assert numbers.shared_cache_namespace == "tests.test_dataloaders.idx"
+
+
+def test_shared_cache_namespace_is_required_without_qualname(
+    mocker: MockerFixture,
+):
+    with pytest.raises(ValueError, match="`shared_cache_namespace` is required"):
+        DataLoader(load_fn=mocker.Mock(), shared_cache=InMemorySharedCache())
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_uses_cache_key_fn():
+    shared_cache = InMemorySharedCache()
+
+    def cache_key(key: Dict[str, int]) -> int:
+        return key["id"]
+
+    async def load(keys: List[Dict[str, int]]) -> List[int]:
+        return [key["id"] for key in keys]
+
+    loader = DataLoader(load_fn=load, cache_key_fn=cache_key, shared_cache=shared_cache)
+
+    assert await loader.load({"id": 1}) == 1
+    assert await shared_cache.get_many(loader.shared_cache_namespace, [1]) == {1: 1}
+
+
+@pytest.mark.asyncio
+async def test_in_memory_shared_cache_ttl():
+    now = 0.0
+    shared_cache = InMemorySharedCache(ttl=10, timer=lambda: now)
+
+    await shared_cache.set_many("numbers", {1: 1})
+    await shared_cache.set_many("numbers", {2: 2}, ttl=20)
+
+    now = 15
+    assert await shared_cache.get_many("numbers", [1, 2]) == {2: 2}
+
+    now = 20
+    assert await shared_cache.get_many("numbers", [1, 2]) == {}
+
+
+@pytest.mark.asyncio
+async def test_in_memory_shared_cache_maxsize():
+    shared_cache = InMemorySharedCache(maxsize=2)
+
+    await shared_cache.set_many("numbers", {1: 1, 2: 2})
+    assert await shared_cache.get_many("numbers", [1]) == {1: 1}
+    await shared_cache.set_many("numbers", {3: 3})
+
+    assert await shared_cache.get_many("numbers", [1, 2, 3]) == {1: 1, 3: 3}
+    assert await shared_cache.get_many("letters", [1]) == {}
+
+
+async def _load_after_awaiting(loader: DataLoader[int, int], key: int) -> int:
+    # like a nested resolver, awaiting something before using the loader
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    return await loader.load(key)
+
+
+@pytest.mark.asyncio
+async def test_next_tick_scheduler(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    loader = DataLoader(load_fn=cast(IDXType, mock_loader))
+
+    assert loader.batch_scheduler is next_tick_scheduler
+
+    await asyncio.gather(loader.load(1), _load_after_awaiting(loader, 2))
+
+    assert mock_loader.call_args_list == [mocker.call([1]), mocker.call([2])]
+
+
+@pytest.mark.asyncio
+async def test_time_window_scheduler(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    loader = DataLoader(
+        load_fn=cast(IDXType, mock_loader),
+        batch_scheduler=time_window_scheduler(0.01),
+    )
+
+    results = await asyncio.gather(loader.load(1), _load_after_awaiting(loader, 2))
+
+    assert results == [1, 2]
+    mock_loader.assert_called_once_with([1, 2])
+
+
+@pytest.mark.asyncio
+async def test_iterations_scheduler(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    loader = DataLoader(
+        load_fn=cast(IDXType, mock_loader), batch_scheduler=iterations_scheduler()
+    )
+
+    results = await asyncio.gather(
+        loader.load(1), _load_after_awaiting(loader, 2), _load_after_awaiting(loader, 3)
+    )
+
+    assert results == [1, 2, 3]
+    mock_loader.assert_called_once_with([1, 2, 3])
+
+
+@pytest.mark.asyncio
+async def test_iterations_scheduler_with_several_loaders(mocker: MockerFixture):
+    mock_loader_a = mocker.Mock(side_effect=idx)
+    mock_loader_b = mocker.Mock(side_effect=idx)
+    loader_a = DataLoader(
+        load_fn=cast(IDXType, mock_loader_a), batch_scheduler=iterations_scheduler()
+    )
+    loader_b = DataLoader(
+        load_fn=cast(IDXType, mock_loader_b), batch_scheduler=iterations_scheduler()
+    )
+
+    results = await asyncio.gather(
+        loader_a.load(1),
+        loader_b.load(1),
+        _load_after_awaiting(loader_a, 2),
+        _load_after_awaiting(loader_b, 2),
+    )
+
+    assert results == [1, 1, 2, 2]
+    mock_loader_a.assert_called_once_with([1, 2])
+    mock_loader_b.assert_called_once_with([1, 2])
+
+
+@pytest.mark.asyncio
+async def test_iterations_scheduler_iterations(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    loader = DataLoader(
+        load_fn=cast(IDXType, mock_loader),
+        batch_scheduler=iterations_scheduler(iterations=2),
+    )
+
+    await asyncio.gather(loader.load(1), _load_after_awaiting(loader, 2))
+
+    assert mock_loader.call_args_list == [mocker.call([1]), mocker.call([2])]
+
+
+def test_iterations_scheduler_requires_an_iteration():
+    with pytest.raises(ValueError, match="`iterations` must be at least 1"):
+        iterations_scheduler(iterations=0)
+
+
 def test_works_when_created_in_a_different_loop(mocker: MockerFixture):
     mock_loader = mocker.Mock(side_effect=idx)
     loader = DataLoader(load_fn=cast(IDXType, mock_loader), cache=False)
@@ -464,3 +829,462 @@ def test_works_when_created_in_a_different_loop(mocker: MockerFixture):
     assert data == 1
 
     mock_loader.assert_called_once_with([1])
+
+
+def sync_idx(keys: List[int]) -> List[int]:
+    return keys
+
+
+def test_sync_loader_dispatches_when_the_result_is_needed(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=sync_idx)
+    loader = SyncDataLoader(load_fn=mock_loader)
+
+    first = loader.load(1)
+    second = loader.load(2)
+
+    assert not first.done()
+    assert first.result() == 1
+    assert second.done()
+    assert second.result() == 2
+
+    mock_loader.assert_called_once_with([1, 2])
+
+
+def test_sync_loader_batches_awaited_loads(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=sync_idx)
+    loader = SyncDataLoader(load_fn=mock_loader, max_batch_size=2)
+
+    async def load_next(key: int) -> int:
+        value = await loader.load(key)
+        return await loader.load(value + 1)
+
+    # awaiting a load outside of `run_sync` loads it right away
+    assert run_sync(loader.load_many([4, 5])) == [4, 5]
+    mock_loader.reset_mock()
+
+    assert run_sync(loader.load_many([1, 2, 3])) == [1, 2, 3]
+    assert mock_loader.call_args_list == [mocker.call([1, 2]), mocker.call([3])]
+    mock_loader.reset_mock()
+
+    assert run_sync(load_next(10)) == 11
+    assert mock_loader.call_args_list == [mocker.call([10]), mocker.call([11])]
+
+
+def test_sync_loader_caches_and_primes(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=sync_idx)
+    loader = SyncDataLoader(load_fn=mock_loader, cache_map=LRUCache(maxsize=2))
+
+    pending = loader.load(1)
+    loader.prime_many({1: 10, 2: 20})
+
+    assert pending.result() == 10
+    assert loader.load(1) is pending
+    assert loader.load(2).result() == 20
+    mock_loader.assert_not_called()
+
+    loader.clear(1)
+    assert loader.load(1).result() == 1
+    mock_loader.assert_called_once_with([1])
+
+
+def test_sync_loader_errors():
+    def load(keys: List[int]) -> List[Union[int, ValueError]]:
+        return [ValueError(key) if key < 0 else key for key in keys]
+
+    loader = SyncDataLoader(load_fn=load)
+
+    with pytest.raises(ValueError, match="-1"):
+        loader.load(-1).result()
+
+    with pytest.raises(ValueError, match="-2"):
+        loader.load_many([1, -2]).result()
+
+    loader = SyncDataLoader(load_fn=lambda keys: [])
+
+    with pytest.raises(WrongNumberOfResultsReturned):
+        loader.load(1).result()
+
+
+def test_sync_future_then():
+    loader = SyncDataLoader(load_fn=sync_idx)
+    other = SyncDataLoader(load_fn=lambda keys: [key * 2 for key in keys])
+
+    future = loader.load(1).then(lambda value: other.load(value + 1))
+
+    assert future.result() == 4
+
+    future = loader.load(2).then(lambda value: value / 0)
+
+    with pytest.raises(ZeroDivisionError):
+        future.result()
+
+
+def test_run_sync_fails_on_other_awaitables():
+    async def run() -> None:
+        await asyncio.sleep(0)
+
+    with pytest.raises(RuntimeError, match="failed to complete synchronously"):
+        run_sync(run())
+
+
+async def test_instrumentation(mocker: MockerFixture):
+    loader_instrumentation = mocker.Mock(spec=DataLoaderInstrumentation)
+    active_instrumentation = mocker.Mock(spec=DataLoaderInstrumentation)
+
+    async def load(keys: List[int]) -> List[int]:
+        return keys[:1]
+
+    loader = DataLoader(load_fn=load, instrumentation=loader_instrumentation)
+
+    with instrument_dataloaders(active_instrumentation):
+        with pytest.raises(WrongNumberOfResultsReturned):
+            await asyncio.gather(loader.load(1), loader.load(2), loader.load(1))
+
+    await loader.load(3)
+
+    assert active_instrumentation.on_load.call_args_list == [
+        mocker.call(loader, 1, False),
+        mocker.call(loader, 2, False),
+        mocker.call(loader, 1, True),
+    ]
+    assert loader_instrumentation.on_load.call_count == 4
+
+    [dispatch_call] = active_instrumentation.on_batch_dispatch.call_args_list
+    assert dispatch_call.args[:2] == (loader, 2)
+
+    [loaded_call] = active_instrumentation.on_batch_loaded.call_args_list
+    assert loaded_call.args[:2] == (loader, 2)
+    assert isinstance(loaded_call.args[3], WrongNumberOfResultsReturned)
+
+    assert loader_instrumentation.on_batch_loaded.call_args.args[3] is None
+
+
+async def test_cache_disabled_deduplicates_keys(mocker: MockerFixture):
+    async def load(keys: List[Dict[str, int]]) -> List[Union[int, ValueError]]:
+        return [ValueError("Negative") if key["id"] < 0 else key["id"] for key in keys]
+
+    mock_loader = mocker.Mock(side_effect=load)
+    loader = DataLoader(
+        load_fn=mock_loader, cache=False, cache_key_fn=lambda key: key["id"]
+    )
+
+    values = await asyncio.gather(
+        loader.load({"id": 1}),
+        loader.load({"id": 2}),
+        loader.load({"id": 1}),
+        loader.load({"id": -1}),
+        loader.load({"id": -1}),
+        return_exceptions=True,
+    )
+
+    assert values[:3] == [1, 2, 1]
+    assert isinstance(values[3], ValueError)
+    assert values[4] is values[3]
+    mock_loader.assert_called_once_with([{"id": 1}, {"id": 2}, {"id": -1}])
+
+
+async def test_cache_disabled_keeps_unhashable_keys(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=idx)
+    loader = DataLoader(load_fn=mock_loader, cache=False)
+
+    assert await loader.load_many([[1], [1]]) == [[1], [1]]
+    mock_loader.assert_called_once_with([[1], [1]])
+
+
+def test_sync_loader_deduplicates_keys(mocker: MockerFixture):
+    mock_loader = mocker.Mock(side_effect=sync_idx)
+    loader = SyncDataLoader(load_fn=mock_loader, cache=False)
+
+    assert loader.load_many([1, 2, 1]).result() == [1, 2, 1]
+    mock_loader.assert_called_once_with([1, 2])
+
+
+def _create_slow_loader(
+    single_flight: SingleFlight, calls: List[List[int]], release: asyncio.Event
+) -> DataLoader[int, int]:
+    async def load_slowly(keys: List[int]) -> List[Union[int, ValueError]]:
+        calls.append(keys)
+        await release.wait()
+        return [ValueError("Negative") if key < 0 else key for key in keys]
+
+    return DataLoader(load_fn=load_slowly, single_flight=single_flight)
+
+
+async def test_single_flight_shares_keys_between_loaders():
+    single_flight = SingleFlight()
+    calls: List[List[int]] = []
+    release = asyncio.Event()
+
+    first = _create_slow_loader(single_flight, calls, release)
+    second = _create_slow_loader(single_flight, calls, release)
+
+    first_values = asyncio.gather(first.load_many([1, 2, -1]))
+    second_values = asyncio.gather(
+        second.load_many([2, 3]), second.load(-1), return_exceptions=True
+    )
+
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    release.set()
+
+    with pytest.raises(ValueError, match="Negative"):
+        await first_values
+
+    [values, error] = await second_values
+
+    assert values == [2, 3]
+    assert isinstance(error, ValueError)
+    assert calls == [[1, 2, -1], [3]]
+    assert single_flight.in_flight == {}
+
+    # keys are only shared while they are being loaded
+    third = _create_slow_loader(single_flight, calls, release)
+    assert await third.load(1) == 1
+    assert calls[-1] == [1]
+
+
+async def test_single_flight_cancelled_batches():
+    single_flight = SingleFlight()
+    calls: List[List[int]] = []
+    release = asyncio.Event()
+
+    first = _create_slow_loader(single_flight, calls, release)
+    second = _create_slow_loader(single_flight, calls, release)
+
+    first_value = asyncio.ensure_future(first.load(1))
+    second_value = asyncio.ensure_future(second.load(1))
+
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    second_value.cancel()
+    release.set()
+
+    assert await first_value == 1
+    assert calls == [[1]]
+
+
+async def test_single_flight_batches_reload_the_keys_of_a_cancelled_batch():
+    single_flight = SingleFlight()
+    calls: List[List[int]] = []
+    release = asyncio.Event()
+
+    first = _create_slow_loader(single_flight, calls, release)
+    second = _create_slow_loader(single_flight, calls, release)
+
+    first_value = first.load(1)
+    await asyncio.sleep(0)
+    [first_batch] = asyncio.all_tasks() - {asyncio.current_task()}
+
+    second_values = second.load_many([1, 2])
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    # the request owning the batch is cancelled, the other one loads 1 itself
+    first_batch.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await second_values == [1, 2]
+    assert calls == [[1], [2], [1]]
+    assert single_flight.in_flight == {}
+    assert first_value.cancelled()
+
+
+def test_single_flight_namespace_is_required_without_qualified_name(
+    mocker: MockerFixture,
+):
+    with pytest.raises(ValueError, match="shared_cache_namespace"):
+        DataLoader(load_fn=mocker.Mock(spec=[]), single_flight=SingleFlight())
+
+
+class _ConcurrencyTracker:
+    def __init__(self) -> None:
+        self.active = 0
+        self.max_active = 0
+        self.batches: List[List[int]] = []
+
+    async def load(self, keys: List[int]) -> List[int]:
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.batches.append(keys)
+
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        self.active -= 1
+        return keys
+
+
+async def test_max_concurrent_batches():
+    tracker = _ConcurrencyTracker()
+    loader = DataLoader(
+        load_fn=tracker.load, max_batch_size=2, max_concurrent_batches=2
+    )
+
+    assert await loader.load_many(range(10)) == list(range(10))
+
+    assert tracker.max_active == 2
+    # batches are loaded in the order they were dispatched
+    assert tracker.batches == [[0, 1], [2, 3], [4, 5], [6, 7], [8, 9]]
+
+
+async def test_shared_batch_limiter():
+    tracker = _ConcurrencyTracker()
+    limiter = BatchLimiter(max_concurrent_batches=1)
+
+    first = DataLoader(load_fn=tracker.load, batch_limiter=limiter)
+    second = DataLoader(
+        load_fn=tracker.load,
+        batch_limiter=limiter,
+        max_batch_size=1,
+        max_concurrent_batches=2,
+    )
+
+    assert await asyncio.gather(first.load_many([1, 2]), second.load_many([3, 4])) == [
+        [1, 2],
+        [3, 4],
+    ]
+    assert tracker.max_active == 1
+    assert limiter.active == 0
+
+
+async def test_batch_limiter_cancelled_waiters():
+    limiter = BatchLimiter(max_concurrent_batches=1)
+
+    await limiter.acquire()
+
+    cancelled = asyncio.ensure_future(limiter.acquire())
+    waiting = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    limiter.release()
+    await waiting
+
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    assert limiter.active == 1
+    limiter.release()
+    assert limiter.active == 0
+
+
+def test_batch_limiter_needs_a_slot():
+    with pytest.raises(ValueError, match="at least 1"):
+        BatchLimiter(max_concurrent_batches=0)
+
+
+async def test_queue_time_is_reported(mocker: MockerFixture):
+    instrumentation = mocker.Mock(spec=DataLoaderInstrumentation)
+
+    async def load(keys: List[int]) -> List[int]:
+        await asyncio.sleep(0.01)
+        return keys
+
+    loader = DataLoader(
+        load_fn=load,
+        max_batch_size=1,
+        max_concurrent_batches=1,
+        instrumentation=instrumentation,
+    )
+
+    await loader.load_many([1, 2])
+
+    queue_times = [
+        call.args[2] for call in instrumentation.on_batch_queued.call_args_list
+    ]
+    assert len(queue_times) == 2
+    assert queue_times[0] < 0.01 <= queue_times[1]
+
+    unlimited_loader = DataLoader(load_fn=idx, instrumentation=instrumentation)
+    await unlimited_loader.load(1)
+    assert instrumentation.on_batch_queued.call_count == 2
+
+
+def test_adaptive_batch_size_follows_the_latency_per_key():
+    batch_size = AdaptiveBatchSize(
+        target_latency=0.1, initial_size=100, max_size=1000, smoothing=1
+    )
+
+    # too slow: 100 keys in 0.2s means 50 keys fit in the target latency
+    batch_size.record(100, 0.2)
+    assert batch_size.batch_size == 50
+
+    # faster than the target, but the batch wasn't full
+    batch_size.record(10, 0.001)
+    assert batch_size.batch_size == 50
+
+    # full and fast, but it can only double
+    batch_size.record(50, 0.001)
+    assert batch_size.batch_size == 100
+
+    batch_size.record(100, 0.08)
+    assert batch_size.batch_size == 125
+
+    # even a small batch can be too slow
+    batch_size.record(10, 2)
+    assert batch_size.batch_size == 1
+
+    batch_size.record(1, 0)
+    assert batch_size.batch_size == 2
+
+
+def test_adaptive_batch_size_smoothing_and_bounds():
+    batch_size = AdaptiveBatchSize(
+        target_latency=0.1, min_size=10, max_size=100, initial_size=50, smoothing=0.5
+    )
+
+    batch_size.record(50, 0.2)
+    assert batch_size.batch_size == 38
+
+    for _ in range(10):
+        batch_size.record(batch_size.batch_size, 10)
+    assert batch_size.batch_size == 10
+
+    for _ in range(20):
+        batch_size.record(batch_size.batch_size, 0.001)
+    assert batch_size.batch_size == 100
+
+    with pytest.raises(ValueError, match="min_size"):
+        AdaptiveBatchSize(target_latency=0.1, min_size=0)
+
+    with pytest.raises(ValueError, match="smoothing"):
+        AdaptiveBatchSize(target_latency=0.1, smoothing=0)
+
+
+async def test_adaptive_batches_are_loaded_in_concurrent_chunks(
+    mocker: MockerFixture,
+):
+    tracker = _ConcurrencyTracker()
+    batch_size = AdaptiveBatchSize(target_latency=10, initial_size=2, smoothing=1)
+    record = mocker.spy(batch_size, "record")
+
+    loader = DataLoader(load_fn=tracker.load, adaptive_batch_size=batch_size)
+
+    assert await loader.load_many(range(5)) == list(range(5))
+
+    assert tracker.batches == [[0, 1], [2, 3], [4]]
+    assert tracker.max_active == 3
+    assert [call.args[0] for call in record.call_args_list] == [2, 2, 1]
+
+    # the chunks were full and fast
+    assert batch_size.batch_size == 4
+
+
+async def test_adaptive_chunks_fail_independently():
+    async def load(keys: List[int]) -> List[int]:
+        if 3 in keys:
+            raise ValueError("Broken chunk")
+        return keys
+
+    loader = DataLoader(
+        load_fn=load,
+        adaptive_batch_size=AdaptiveBatchSize(target_latency=10, initial_size=2),
+    )
+
+    values = await asyncio.gather(*map(loader.load, range(5)), return_exceptions=True)
+
+    assert values[:2] == [0, 1]
+    assert isinstance(values[2], ValueError)
+    assert values[3] is values[2]
+    assert values[4] == 4
@@ -9,7 +9,11 @@ from strawberry.annotation import StrawberryAnnotation
 from strawberry.exceptions import UnsupportedTypeError
 from strawberry.schema.config import StrawberryConfig
 from strawberry.schema.types.scalar import DEFAULT_SCALAR_REGISTRY
-from strawberry.types.arguments import StrawberryArgument, convert_arguments
+from strawberry.types.arguments import (
+    StrawberryArgument,
+    compile_arguments_converter,
+    convert_arguments,
+)
 from strawberry.types.lazy_type import LazyType
 from strawberry.types.unset import UNSET
 
@@ -450,3 +454,159 @@ def test_fails_when_passing_non_strawberry_classes():
         )
         == {}
     )
+
+
+def test_compiled_converter_matches_convert_arguments():
+    @strawberry.enum
+    class Color(Enum):
+        RED = "red"
+
+    @strawberry.input
+    class Point:
+        x_value: int
+        color: Color = Color.RED
+
+    @strawberry.input
+    class Shape:
+        points: List[Point]
+        maybe_points: Optional[List[Optional[Point]]] = UNSET
+        tags: List[str]
+
+    arguments = [
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="shape",
+            type_annotation=StrawberryAnnotation(Optional[Shape]),
+        ),
+        StrawberryArgument(
+            graphql_name="pointList",
+            python_name="point_list",
+            type_annotation=StrawberryAnnotation(List[Point]),
+        ),
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="lazy",
+            type_annotation=StrawberryAnnotation(
+                LazyType["LaziestType", "tests.utils.test_arguments_converter"]
+            ),
+        ),
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="color",
+            type_annotation=StrawberryAnnotation(Color),
+        ),
+    ]
+
+    convert = compile_arguments_converter(
+        arguments, DEFAULT_SCALAR_REGISTRY, StrawberryConfig()
+    )
+
+    for args in (
+        {
+            "shape": {
+                "points": [{"xValue": 1, "color": Color.RED}],
+                "maybePoints": [None, {"xValue": 2}],
+                "tags": ["a"],
+            },
+            "pointList": [{"xValue": 3}],
+            "lazy": {"something": True},
+            "color": Color.RED,
+        },
+        {"shape": {"points": [], "tags": []}, "pointList": []},
+        {"shape": None},
+        {},
+    ):
+        assert convert(args) == convert_arguments(
+            args,
+            arguments,
+            scalar_registry=DEFAULT_SCALAR_REGISTRY,
+            config=StrawberryConfig(),
+        )
+
+
+@strawberry.input
+class Tree:
+    value: int
+    children: List["Tree"]
+
+
+def test_compiled_converter_recursive_input_types():
+    arguments = [
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="tree",
+            type_annotation=StrawberryAnnotation(Tree),
+        ),
+    ]
+
+    converters = {}
+    convert = compile_arguments_converter(
+        arguments, DEFAULT_SCALAR_REGISTRY, StrawberryConfig(), converters
+    )
+
+    assert convert(
+        {"tree": {"value": 1, "children": [{"value": 2, "children": []}]}}
+    ) == {"tree": Tree(value=1, children=[Tree(value=2, children=[])])}
+    assert list(converters) == [Tree]
+
+
+def test_compiled_converter_skips_values_that_need_no_conversion():
+    arguments = [
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="numbers",
+            type_annotation=StrawberryAnnotation(List[Optional[int]]),
+        ),
+    ]
+
+    convert = compile_arguments_converter(
+        arguments, DEFAULT_SCALAR_REGISTRY, StrawberryConfig()
+    )
+    numbers = [1, None]
+
+    assert convert({"numbers": numbers})["numbers"] is numbers
+
+
+@pytest.mark.raises_strawberry_exception(
+    UnsupportedTypeError,
+    match=r"<class .*> conversion is not supported",
+)
+def test_compiled_converter_fails_when_passing_non_strawberry_classes():
+    class Input:
+        numbers: List[int]
+
+    arguments = [
+        StrawberryArgument(
+            graphql_name=None,
+            python_name="input",
+            type_annotation=StrawberryAnnotation(Optional[Input]),
+        )
+    ]
+
+    convert = compile_arguments_converter(
+        arguments, DEFAULT_SCALAR_REGISTRY, StrawberryConfig()
+    )
+
+    convert({"input": {"numbers": [1, 2]}})
+
+
+def test_schema_uses_compiled_converters(mocker):
+    @strawberry.input
+    class Point:
+        x: int
+
+    @strawberry.type
+    class Query:
+        @strawberry.field
+        def total(self, points: List[Point], info: strawberry.Info) -> int:
+            assert info.field_name == "total"
+            return sum(point.x for point in points)
+
+    schema = strawberry.Schema(query=Query)
+    convert = mocker.patch("strawberry.types.arguments.convert_argument")
+
+    result = schema.execute_sync("{ total(points: [{ x: 1 }, { x: 2 }]) }")
+
+    assert not result.errors
+    assert result.data == {"total": 3}
+    convert.assert_not_called()